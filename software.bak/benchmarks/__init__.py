@@ -0,0 +1,10 @@
+"""
+Benchmarks für Liedverarbeitung, Bibliothek, Direktorium und das Timing des
+Carillons. Aufruf aus `software.bak` mit `python -m benchmarks`; Ergebnisse
+werden mit den Referenzwerten in `baselines.json` verglichen.
+"""
+
+from . import carillon, direktorium, songs
+from .runner import benchmark, BENCHMARKS, best, compare, run
+
+__all__ = ['benchmark', 'BENCHMARKS', 'best', 'compare', 'run', ]
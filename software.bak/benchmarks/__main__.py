@@ -0,0 +1,41 @@
+import argparse
+import sys
+
+from . import runner
+
+
+def main() -> int:
+    """
+    Führt die Benchmarks aus, gibt die Messwerte samt Referenzwerten aus und
+    meldet Regressionen über den Rückgabewert.
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('names', nargs='*',
+                        help='Präfixe der auszuführenden Benchmarks')
+    parser.add_argument('--threshold', type=float, default=runner.THRESHOLD,
+                        help='relative Verschlechterung für eine Regression')
+    parser.add_argument('--baselines', default=runner.BASELINES,
+                        help='Datei mit Referenzwerten')
+    parser.add_argument('--update', action='store_true',
+                        help='Messwerte als Referenzwerte speichern')
+    args = parser.parse_args()
+
+    metrics = runner.run(args.names)
+    baselines = runner.load(args.baselines)
+    for name, value in metrics.items():
+        reference = baselines.get(name)
+        line = f'{name:<40} {value * 1e3:12.4f} ms'
+        if reference: line += f'  ({value / reference - 1:+.0%})'
+        print(line)
+
+    if args.update:
+        runner.save(metrics, args.baselines)
+        return 0
+    regressions = runner.compare(metrics, baselines, args.threshold)
+    for name, value, reference in regressions:
+        print(f'Regression: {name} {value * 1e3:.4f} ms '
+              f'statt {reference * 1e3:.4f} ms', file=sys.stderr)
+    return 1 if regressions else 0
+
+
+sys.exit(main())
@@ -0,0 +1,28 @@
+import mido.ports
+
+from lib.carillon import Carillon, Harness
+from lib.songs import Song
+
+from .runner import benchmark, best, Metrics
+from .songs import SONGS
+
+TEMPO = 8
+"""Faktor, um den die Lieder für die Messung beschleunigt werden."""
+
+
+@benchmark
+def play() -> Metrics:
+    """
+    Wiedergabe gegen einen Null-Port: Kosten eines Anschlags sowie Fehler,
+    Jitter und Drift einer beschleunigt gespielten Melodie.
+    """
+    carillon = Carillon(mido.ports.BaseOutput())
+    song = Song.from_file(f'{SONGS}/Salve Regina.mid')
+    song.tempo //= TEMPO
+    report = Harness().play(song.timeline)
+    return {
+        'carillon.hit': best(lambda: carillon.hit(60), 10_000),
+        'carillon.play.max_error': report.max_error,
+        'carillon.play.jitter': report.jitter,
+        'carillon.play.drift': abs(report.drift),
+    }
@@ -0,0 +1,189 @@
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import requests
+import shutil
+import tempfile
+from threading import Thread
+
+from lib.direktorium import (Calendarium, Color, Direktorium, JsonCache,
+                             Rank, SqliteCache)
+
+from .runner import benchmark, best, Metrics
+
+YEAR = 2030
+"""Synthetisch zwischengespeichertes Jahr."""
+
+_COLORS = {Color.WHITE: 'w', Color.RED: 'r', Color.GREEN: 'g',
+           Color.VIOLET: 'v', Color.NONE: ''}
+_RANKS = {Rank.HOCHFEST: 'H', Rank.FEST: 'F', Rank.GEBOTEN: 'G',
+          Rank.NICHTGEBOTEN: 'g', Rank.NONE: ''}
+
+
+def _year(year: int) -> dict:
+    """
+    Erzeugt ein Jahr im Format der API aus dem Offline-Kalender, damit ohne
+    Netzwerk gemessen werden kann.
+    """
+    celebrations, i = {}, 0
+    for events in Calendarium().year(year).values():
+        for e in events:
+            i += 1
+            celebrations[str(i)] = dict(
+                Tl=e.title, Datum=e.date.isoformat(), Bem=e.comment,
+                L1=e.lecture1, AP=e.psalm, L2=e.lecture2, EV=e.gospel,
+                Farbe=_COLORS[e.color], Grad=e.importance,
+                Rang=_RANKS[e.rank])
+    return {'Zelebrationen': celebrations}
+
+
+def _cold(direktorium: Direktorium, d: date) -> None:
+    """Fragt ein Datum ab, nachdem der Speicher geleert wurde."""
+    with Direktorium._years_lock: Direktorium._years.clear()
+    direktorium.get(d)
+
+
+@benchmark
+def lookup() -> Metrics:
+    """
+    Abfrage eines Tages kalt aus dem Cache (JSON und SQLite) sowie warm aus
+    dem Speicher.
+    """
+    path = tempfile.mkdtemp()
+    try:
+        data = _year(YEAR)
+        folder = os.path.join(path, 'json', 'deutschland')
+        os.makedirs(folder)
+        with open(os.path.join(folder, f'{YEAR}.json'), 'w') as f:
+            json.dump(data, f)
+        sqlite = SqliteCache(os.path.join(path, 'sqlite'))
+        sqlite.store('deutschland', YEAR, data)
+
+        d = date(YEAR, 6, 29)
+        plain = Direktorium(cache_dir=os.path.join(path, 'json'))
+        indexed = Direktorium(cache=sqlite)
+        metrics = {
+            'direktorium.get.cold.json': best(lambda: _cold(plain, d), 5),
+            'direktorium.get.cold.sqlite': best(lambda: _cold(indexed, d),
+                                                50, 10),
+        }
+        plain.get(d)
+        metrics['direktorium.get.warm'] = best(lambda: plain.get(d), 10_000)
+        return metrics
+    finally:
+        with Direktorium._years_lock: Direktorium._years.clear()
+        shutil.rmtree(path)
+
+
+@benchmark
+def calendar() -> Metrics:
+    """
+    Zeit im Kirchenjahr und Osterdatum über große Zeiträume (Werte je
+    Aufruf bzw. je Tag).
+    """
+    direktorium = Direktorium()
+    start, end = date(1600, 1, 1), date(2599, 12, 31)
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+    def season():
+        for d in days: direktorium.season(d)
+
+    def easter():
+        for year in range(1600, 2600): Direktorium.easter(year)
+
+    direktorium.season_range(start, end)
+    return {
+        'direktorium.season': best(season) / len(days),
+        'direktorium.season_range': best(
+            lambda: direktorium.season_range(start, end))
+        / len(days),
+        'direktorium.easter': best(easter, 10) / 1000,
+    }
+
+
+class _Stub(BaseHTTPRequestHandler):
+    """
+    Lokaler Ersatz für die API: Beantwortet jede Anfrage mit einem leeren
+    Jahr samt `ETag`, bedingte Anfragen mit passendem `ETag` mit 304 und die
+    ersten `failures` Anfragen mit 503.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    etag = '"1"'
+    failures = 0
+    requests = 0
+
+    def do_GET(self) -> None:
+        """Beantwortet eine Anfrage an die API."""
+        _Stub.requests += 1
+        if _Stub.failures > 0:
+            _Stub.failures -= 1
+            return self._send(503, b'')
+        if self.headers.get('If-None-Match') == _Stub.etag:
+            return self._send(304, b'')
+        self._send(200, b'{"Zelebrationen": {}}')
+
+    def _send(self, status: int, body: bytes) -> None:
+        """Interne Methode, die eine Antwort samt `ETag` sendet."""
+        self.send_response(status)
+        self.send_header('ETag', _Stub.etag)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        """Unterdrückt die Protokollierung jeder Anfrage."""
+        pass
+
+
+@benchmark
+def api() -> Metrics:
+    """
+    HTTP-Sitzung gegen einen lokalen Ersatz der API: Anfragen mit und ohne
+    offene Verbindung, bedingte Anfragen (304) und eine transparent
+    wiederholte Anfrage nach einem 503. Das erwartete Verhalten wird dabei
+    geprüft.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Stub)
+    Thread(target=server.serve_forever, daemon=True).start()
+    api, path = Direktorium.API, tempfile.mkdtemp()
+    Direktorium.API = f'http://127.0.0.1:{server.server_port}/api.php'
+    try:
+        direktorium = Direktorium(cache=JsonCache(path))
+        url = Direktorium.API
+        session = Direktorium.session()
+        metrics = {
+            'direktorium.api.keepalive': best(
+                lambda: session.get(url, timeout=Direktorium.TIMEOUT), 50),
+            'direktorium.api.fresh': best(
+                lambda: requests.get(url, timeout=Direktorium.TIMEOUT), 50),
+        }
+
+        # Bedingte Anfragen: unverändert (304) bzw. geändert (200)
+        direktorium.read_year(YEAR)
+        if direktorium.revalidate(YEAR):
+            raise RuntimeError('Unverändertes Jahr wurde neu geladen!')
+        metrics['direktorium.api.revalidate'] = best(
+            lambda: direktorium.revalidate(YEAR), 50)
+        _Stub.etag = '"2"'
+        if not direktorium.revalidate(YEAR):
+            raise RuntimeError('Geändertes Jahr wurde nicht neu geladen!')
+
+        # Wiederholung nach einem 503 (die erste ohne Wartezeit)
+        def retry():
+            _Stub.failures, before = 1, _Stub.requests
+            direktorium.request_api(YEAR)
+            if _Stub.requests - before != 2:
+                raise RuntimeError('Anfrage wurde nicht wiederholt!')
+
+        metrics['direktorium.api.retry'] = best(retry, 20)
+        return metrics
+    finally:
+        Direktorium.API = api
+        _Stub.etag, _Stub.failures = '"1"', 0
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(path)
@@ -0,0 +1,121 @@
+import json
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+
+Metrics = Dict[str, float]
+
+BENCHMARKS: Dict[str, Callable[[], Metrics]] = {}
+"""Alle registrierten Benchmarks nach Namen."""
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'baselines.json')
+"""Pfad zu den gespeicherten Referenzwerten."""
+
+THRESHOLD = 0.25
+"""Relative Verschlechterung, ab der eine Regression gemeldet wird."""
+
+FLOORS = {'': 0.0001, 'carillon.play.': 0.002, 'direktorium.api.': 0.001}
+"""
+Absolute Abweichung in Sekunden, die je Präfix zusätzlich toleriert wird
+(es gilt der größte passende Wert). Messwerte unter einer Millisekunde
+schwanken mit dem Scheduler um weit mehr als die relative Schwelle; die
+Zeitfehler der Wiedergabe und die Anfragen über das Loopback-Netz liegen
+ganz im Bereich dieses Rauschens.
+"""
+
+
+def benchmark(function: Callable[[], Metrics]) -> Callable[[], Metrics]:
+    """
+    Registriert einen Benchmark. Dieser gibt Messwerte in Sekunden zurück
+    (kleiner ist besser), deren Namen mit dem Modulnamen beginnen.
+    """
+    name = function.__module__.rsplit('.', 1)[-1] + '.' + function.__name__
+    BENCHMARKS[name] = function
+    return function
+
+
+def best(function: Callable[[], object], number: int = 1,
+         repeat: int = 15) -> float:
+    """
+    Misst die Laufzeit einer Funktion.
+
+    Parameters
+    ----------
+    function : Callable[[], object]
+        Zu messende Funktion.
+    number : int (optional)
+        Anzahl der Aufrufe je Messung.
+    repeat : int (optional)
+        Anzahl der Messungen.
+
+    Returns
+    -------
+    Kürzeste Laufzeit eines Aufrufs in Sekunden.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number): function()
+        times.append((time.perf_counter() - start) / number)
+    return min(times)
+
+
+def run(names: Iterable[str] = None) -> Metrics:
+    """
+    Führt Benchmarks aus.
+
+    Parameters
+    ----------
+    names : Iterable[str] (optional)
+        Präfixe der auszuführenden Benchmarks, standardmäßig alle.
+
+    Returns
+    -------
+    Alle Messwerte nach Namen.
+    """
+    names = tuple(names or ())
+    metrics = {}
+    for name, function in BENCHMARKS.items():
+        if names and not name.startswith(names): continue
+        metrics.update(function())
+    return metrics
+
+
+def compare(
+    metrics: Metrics, baselines: Metrics, threshold: float = THRESHOLD
+) -> List[Tuple[str, float, float]]:
+    """
+    Vergleicht Messwerte mit Referenzwerten.
+
+    Returns
+    -------
+    Name, Messwert und Referenzwert aller Messwerte, die den Referenzwert um
+    mehr als `threshold` (relativ) und die Toleranz aus `FLOORS` (absolut)
+    überschreiten.
+    """
+    regressions = []
+    for name, value in metrics.items():
+        if name not in baselines: continue
+        floor = max((f for prefix, f in FLOORS.items()
+                     if name.startswith(prefix)), default=0)
+        if value > baselines[name] * (1 + threshold) + floor:
+            regressions.append((name, value, baselines[name]))
+    return regressions
+
+
+def load(file: str = BASELINES) -> Metrics:
+    """Liest Referenzwerte oder gibt ein leeres Verzeichnis zurück."""
+    try:
+        with open(file) as f: return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save(metrics: Metrics, file: str = BASELINES) -> None:
+    """Schreibt Referenzwerte, bestehende Werte bleiben erhalten."""
+    baselines = load(file)
+    baselines.update(metrics)
+    with open(file, 'w') as f:
+        json.dump(dict(sorted(baselines.items())), f, indent=2)
+        f.write('\n')
@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+
+from lib.songs import Library, Song
+
+from .runner import benchmark, best, Metrics
+
+SONGS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                     'songs')
+"""Verzeichnis mit den MIDI-Dateien des Repositoriums."""
+
+SIZES = (10, 1_000, 10_000)
+"""Größen der synthetischen Bibliotheken."""
+
+
+def _synthetic(path: str, size: int) -> None:
+    """
+    Füllt ein Verzeichnis mit `size` Kopien der vorhandenen Lieder unter
+    fortlaufenden Gotteslobnummern (verteilt auf Unterverzeichnisse).
+    """
+    sources = sorted(f for f in os.listdir(SONGS) if f.endswith('.mid'))
+    for i in range(size):
+        folder = os.path.join(path, f'{i // 500:02d}')
+        os.makedirs(folder, exist_ok=True)
+        source = sources[i % len(sources)]
+        shutil.copy(os.path.join(SONGS, source),
+                    os.path.join(folder, f'{i + 1} {source}'))
+
+
+@benchmark
+def song() -> Metrics:
+    """Einlesen eines Liedes sowie Erzeugen der Nachrichten und Timeline."""
+    file = os.path.join(SONGS, 'Salve Regina.mid')
+    s = Song.from_file(file)
+
+    def compile():
+        s._compiled = None
+        return s.timeline
+
+    return {
+        'song.from_file': best(lambda: Song.from_file(file), 20),
+        'song.messages': best(lambda: s.messages, 20),
+        'song.timeline.compile': best(compile, 20),
+        'song.timeline.cached': best(lambda: s.timeline, 10_000),
+    }
+
+
+@benchmark
+def library() -> Metrics:
+    """
+    Aufbau der Bibliothek ohne (kalt) und mit (warm) Manifest für
+    synthetische Bibliotheken verschiedener Größe.
+    """
+    metrics = {}
+    for size in SIZES:
+        path = tempfile.mkdtemp()
+        try:
+            _synthetic(path, size)
+            manifest = os.path.join(path, '.manifest.json')
+
+            def cold():
+                if os.path.exists(manifest): os.unlink(manifest)
+                Library(path)
+
+            metrics[f'library.cold.{size}'] = best(
+                cold, repeat=1 if size >= 10_000 else 3)
+            metrics[f'library.warm.{size}'] = best(lambda: Library(path))
+        finally:
+            shutil.rmtree(path)
+    return metrics
@@ -1,154 +1,113 @@
-from datetime import date, timedelta
 import os
-import time
+from threading import Lock
+import warnings
 
-from lib.carillon import Carillon, Striker
-from lib.direktorium import TodayDirektorium, Rank, Season
-from lib.songs import Song
+from lib.carillon import Arbiter
+from lib.direktorium import Snapshot, TodayDirektorium
+from lib.rules import DayPlan, DayPlayer, RuleSet, Timetable
 
-_CustomStriker__sdir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                                    'songs')
+_CustomStriker__dir = os.path.dirname(os.path.abspath(__file__))
 
-
-class CustomStriker(Striker):
+class CustomStriker:
     """
-    Klasse, die den Striker der Bibliothek erweitert und ein eigenes
-    Stundengeläut möglichst schlicht zur Verfügung stellt.
+    Klasse, die ein eigenes Stundengeläut möglichst schlicht zur Verfügung
+    stellt. Das Geläut ist in der Läuteordnung `rules.toml` beschrieben, die
+    einmal am Tag mit dem Direktorium zu einem Fahrplan übersetzt und als
+    Plan des ganzen Tages gerendert wird. Ein `DayPlayer` übergibt dessen
+    Einträge zu ihren Fristen mit dem Vorrang `Priority.STRIKE` an den
+    Arbiter, der das Carillon allein bespielt.
 
     Constants
     ---------
-    TRINITATIS : int
-    MARIA : int
-    JOSEF : int
-    APOSTEL : int
-    BERNHARD : int
-    ENGEL : int
-    SONG_LOURDES : Song
-        Lourdes-Lied, das Mittags gespielt wird.
-    SONG_MARIANIC : dict
-        Dictionary, das jeder Season einen Song (marianische Antiphon)
-        zuordnet.
+    RULES : str
+        Pfad zur Läuteordnung.
+    SONGS : str
+        Verzeichnis der Lieder der Läuteordnung.
 
     Attributes
     ----------
-    active : bool
-        Kann gesetzt werden, um weitere Schläge zu muten.
-    carillon : Carillon
-        Carillon, auf dem geschlagen werden soll.
+    arbiter : Arbiter
+        Arbiter, über den das Carillon bespielt wird.
     direktorium : TodayDirektorium
         Ein Direktorium, das Infos für den heutigen Tag cacht.
+    rules : RuleSet
+        Zuletzt gelesene Läuteordnung.
+    timetable : Timetable
+        Fahrplan des aktuellen Tages (oder `None`).
+    dayplan : DayPlan
+        Plan des aktuellen Tages (oder `None`).
+    player : DayPlayer
+        Spieler, der den Plan des Tages abspielt.
 
     Methods
     -------
-    play(messages)
-        Spielt eine Melodie und pausiert währenddessen das Geläut.
-    strike(hours, quarters)
-        Schlägt die Stunden und Viertelstunden an.
-    tell(hours, quarters)
-        Reagiert auf das automatische Triggern.
-    _play(messages)
-        Interne Methode zum Abspielen einer Melodie, die bei
-        `self.active = False` abbricht.
+    plan() : DayPlan
+        Gibt den Plan des heutigen Tages zurück.
+    stop()
+        Beendet das Geläut.
+    _compile(snapshot) : Timetable
+        Interne Methode, die den Fahrplan eines Tages erstellt.
     """
 
-    TRINITATIS = 0x22  # A1SHARP
-    MARIA = 0x25       # C2SHARP
-    JOSEF = 0x27       # D2SHARP
-    APOSTEL = 0x2A     # F2SHARP
-    BERNHARD = 0x2C    # G2SHARP
-    ENGEL = 0x2E       # A2SHARP
+    RULES = os.path.join(_CustomStriker__dir, 'rules.toml')
+    SONGS = os.path.join(_CustomStriker__dir, 'songs')
 
-    SONG_LOURDES = Song.from_file(os.path.join(_CustomStriker__sdir,
-                                               'Lourdes Lied.mid'))
-    SONG_MARIANIC = {
-        Season.ORDINARY:
-            Song.from_file(os.path.join(_CustomStriker__sdir,
-                                        'Salve Regina.mid')),
-        Season.CHRISTMAS:
-            Song.from_file(os.path.join(_CustomStriker__sdir,
-                                        'Alma Redemptoris Mater.mid')),
-        Season.LENT:
-            Song.from_file(os.path.join(_CustomStriker__sdir,
-                                        'Ave Regina caelorum.mid')),
-        Season.EASTER:
-            Song.from_file(os.path.join(_CustomStriker__sdir,
-                                        'Regina caeli laetare.mid')),
-    }
+    def __init__(
+        self, arbiter: Arbiter, direktorium: TodayDirektorium,
+        rules: str = RULES
+    ):
+        """
+        Erstellt das Objekt, übernimmt Arbiter und Direktorium, liest die
+        Läuteordnung und startet das Geläut.
 
-    def __init__(self, carillon: Carillon, direktorium: TodayDirektorium):
-        """Erstellt das Objekt und übernimmt Carillon und Direktorium."""
-        super().__init__()
-        self.active = True
-        self.carillon = carillon
+        Raises
+        ------
+        ValueError
+            Falls die Läuteordnung ungültig ist.
+        """
+        self.arbiter = arbiter
         self.direktorium = direktorium
-
-    def play(self, messages) -> None:
-        """Spielt eine Melodie und pausiert währenddessen das Geläut."""
-        self.active = False
-        self.carillon.play(messages)
-        self.active = True
-
-    def strike(self, hours: int, quarters: int) -> None:
-        """Schlägt die spezifizierte Zahl an (Viertel-)Stunden an."""
-
-        # Nachtschaltung
-        if hours > 21 or (hours == 21 and quarters > 2): return
-        if hours < 8: return
-
-        # Schweigen an Karfreitag und -samstag
-        easter = self.direktorium.easter()
-        if date.today() == easter - timedelta(days=1): return
-        if date.today() == easter - timedelta(days=2): return
-
-        # Mittagsgeläut
-        if hours == 12 and quarters == 0:
-            self.tell(12, 4)
-            return self._play(CustomStriker.SONG_LOURDES.messages)
-
-        # Abendgeläut
-        if hours == 21 and quarters == 2:
-            self.tell(21, 2)
-            antiphon = CustomStriker.SONG_MARIANIC[self.direktorium.season()]
-            return self._play(antiphon.messages)
-
-        # Sonstiges, „normales“ Geläut
-        hours %= 12
-        if hours == 0: hours = 12
-        if quarters == 0:
-            self.tell(hours, 4)
-        else:
-            self.tell(0, quarters)
-
-    def tell(self, hours: int, quarters: int) -> None:
-        """Reagiert auf den Viertelstundentrigger."""
-        for i in range(quarters):
-            events = self.direktorium.get()
-            if events and events[0].rank >= Rank.GEBOTEN:
-                if not self.active: return
-                self.carillon.hit(CustomStriker.ENGEL)
-                time.sleep(0.5)
-                if not self.active: return
-                self.carillon.hit(CustomStriker.BERNHARD)
-                time.sleep(0.5)
-                if not self.active: return
-                self.carillon.hit(CustomStriker.APOSTEL)
-                time.sleep(1.5)
-            else:
-                if not self.active: return
-                self.carillon.hit(CustomStriker.ENGEL)
-                time.sleep(2)
-
-        for i in range(hours):
-            if not self.active: return
-            self.carillon.hit(CustomStriker.TRINITATIS)
-            time.sleep(2.5)
-
-    def _play(self, messages) -> None:
+        self._rules_file = rules
+        self.rules = RuleSet.from_file(rules, CustomStriker.SONGS)
+        self.timetable = None
+        self.dayplan = None
+        self._lock = Lock()
+        self.player = DayPlayer(arbiter, self.plan)
+
+    def plan(self) -> DayPlan:
+        """
+        Gibt den Plan des heutigen Tages zurück. Zu Beginn eines Tages werden
+        Fahrplan und Plan einmalig neu erstellt.
+        """
+        snapshot = self.direktorium.snapshot()
+        dayplan = self.dayplan
+        if dayplan is not None and dayplan.date == snapshot.date:
+            return dayplan
+        with self._lock:
+            if self.dayplan is None or self.dayplan.date != snapshot.date:
+                self.timetable = self._compile(snapshot)
+                self.dayplan = DayPlan.from_timetable(self.timetable)
+            return self.dayplan
+
+    def stop(self) -> None:
+        """Beendet das Geläut (laufende Aufträge des Arbiters bleiben)."""
+        self.player.stop()
+
+    def _compile(self, snapshot: Snapshot) -> Timetable:
         """
-        Interne Methode zum Abspielen einer Melodie, die bei Deaktivierung des
-        Geläuts abbricht.
+        Interne Methode, die die Läuteordnung neu liest, damit Änderungen ab
+        dem nächsten Tag gelten, und den Fahrplan des Tages erstellt. Ist die
+        Datei ungültig, wird mit einer Warnung die bisherige genutzt; schlägt
+        auch das Erstellen fehl, gilt der bisherige Fahrplan weiter.
         """
-        for m in messages:
-            if not self.active: return
-            print(self.active, m)
-            self.carillon.play([m])
+        try:
+            self.rules = RuleSet.from_file(self._rules_file,
+                                           CustomStriker.SONGS)
+        except (OSError, ValueError) as e:
+            warnings.warn(f'Läuteordnung nicht lesbar, nutze bisherige: {e}')
+        try:
+            return self.rules.compile(snapshot)
+        except Exception as e:
+            if self.timetable is None: raise
+            warnings.warn(f'Fahrplan nicht erstellt, nutze bisherigen: {e}')
+            return Timetable(snapshot.date, self.timetable.slots)
@@ -1,9 +1,14 @@
 """
-Bibliothek, die das Carillon als MIDI-Instrument und den Uhrmechanismus
-zusammenfasst.
+Bibliothek, die das Carillon als MIDI-Instrument und den Arbiter, der alle
+Wiedergaben darauf ordnet, zusammenfasst.
 """
 
+from .arbiter import Arbiter
 from .carillon import Carillon
-from .striker import Striker
+from .harness import Harness
+from .job import Job, JobStatus, Priority
+from .recordingport import RecordingPort
+from .timingreport import TimingReport
 
-__all__ = ['Carillon', 'Striker', ]
+__all__ = ['Arbiter', 'Carillon', 'Harness', 'Job', 'JobStatus', 'Priority',
+           'RecordingPort', 'TimingReport', ]
@@ -0,0 +1,220 @@
+from collections import OrderedDict
+from threading import Condition, Thread
+import time
+from typing import List
+import warnings
+
+from .carillon import Carillon
+from .job import Job, JobStatus, Priority
+from ..metrics import Registry
+from ..songs.timeline import Timeline
+
+_LATENESS = Registry.default().histogram(
+    'striker_lateness_seconds',
+    'Verspätung des Beginns befristeter Aufträge in Sekunden.')
+
+
+class Arbiter:
+    """
+    Einziger Besitzer des Carillons: Ein Hintergrundthread spielt alle
+    Wiedergabeaufträge (Stundenschläge, Lieder, Tests) nach Vorrang und
+    innerhalb eines Vorrangs in Eingangsreihenfolge ab. Ein Auftrag höheren
+    Vorrangs verdrängt den laufenden; dieser wird danach ab dem nächsten
+    ungespielten Anschlag fortgesetzt.
+
+    Abbruch und Verdrängung erfolgen über das Abbruchsignal des Auftrags
+    (`Job.interrupt`), das auch Pausen zwischen Anschlägen sofort beendet,
+    sodass ein Auftrag innerhalb weniger Millisekunden endet.
+
+    Attributes
+    ----------
+    carillon : Carillon
+        Carillon, auf dem gespielt wird.
+    history : int
+        Anzahl abgeschlossener Aufträge, die abfragbar bleiben.
+    current : Job
+        Gerade spielender Auftrag (oder `None`).
+
+    Methods
+    -------
+    submit(timeline, title, priority, deadline) : Job
+        Reiht eine Melodie entsprechend ihrem Vorrang ein.
+    get(job_id) : Job
+        Sucht einen Auftrag anhand seiner Nummer.
+    jobs() : List[Job]
+        Gibt den laufenden und alle wartenden Aufträge zurück.
+    cancel(job_id) : bool
+        Bricht einen wartenden oder laufenden Auftrag ab.
+    move(job_id, index) : bool
+        Verschiebt einen wartenden Auftrag innerhalb seines Vorrangs.
+    _index(priority, front) : int
+        Interne Methode, die die Einfügeposition eines Auftrags ermittelt.
+    _insert(job, front)
+        Interne Methode, die einen Auftrag in die Warteschlange einordnet.
+    _run()
+        Interne Methode des Hintergrundthreads.
+    _trim()
+        Interne Methode, die alte abgeschlossene Aufträge verwirft.
+    """
+
+    def __init__(self, carillon: Carillon, history: int = 50):
+        """
+        Erstellt den Arbiter und startet den Hintergrundthread.
+
+        Parameters
+        ----------
+        carillon : Carillon
+            Carillon, das ausschließlich über den Arbiter bespielt wird.
+        history : int (optional)
+            Anzahl abgeschlossener Aufträge, die abfragbar bleiben.
+        """
+        self.carillon = carillon
+        self.history = history
+        self.current = None
+        self._pending = []
+        self._jobs = OrderedDict()
+        self._cond = Condition()
+        Thread(target=self._run, daemon=True).start()
+
+    def submit(
+        self, timeline: Timeline, title: str = '',
+        priority: Priority = Priority.SONG, deadline: float = None
+    ) -> Job:
+        """
+        Reiht eine Melodie hinter allen Aufträgen gleichen oder höheren
+        Vorrangs ein und gibt sofort den Auftrag zurück. Hat der laufende
+        Auftrag einen niedrigeren Vorrang, wird er verdrängt. Für Aufträge
+        mit Frist (Unix-Zeit) wird die Verspätung ihres Beginns im
+        Histogramm `striker_lateness_seconds` erfasst.
+        """
+        job = Job(timeline, title, priority, deadline)
+        with self._cond:
+            self._insert(job)
+            self._jobs[job.id] = job
+            if self.current is not None and self.current.priority < priority:
+                self.current.interrupt.set()
+            self._cond.notify()
+        return job
+
+    def get(self, job_id: int) -> Job:
+        """Sucht einen Auftrag anhand seiner Nummer (oder `None`)."""
+        with self._cond: return self._jobs.get(job_id)
+
+    def jobs(self) -> List[Job]:
+        """
+        Gibt den laufenden und alle wartenden Aufträge in der Reihenfolge
+        ihrer Wiedergabe zurück.
+        """
+        with self._cond:
+            current = [] if self.current is None else [self.current]
+            return current + self._pending
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Bricht einen wartenden oder laufenden Auftrag ab. Ein laufender
+        Auftrag endet sofort, auch während einer Pause.
+
+        Returns
+        -------
+        Ob der Auftrag gefunden und abgebrochen wurde.
+        """
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None: return False
+            if job.status is JobStatus.QUEUED: self._pending.remove(job)
+            elif job.status is not JobStatus.PLAYING: return False
+            job.status = JobStatus.CANCELLED
+            job.finished = time.monotonic()
+            job.interrupt.set()
+            self._trim()
+            return True
+
+    def move(self, job_id: int, index: int) -> bool:
+        """
+        Verschiebt einen wartenden Auftrag an die angegebene Position der
+        Warteschlange (0 ist der nächste Auftrag). Die Position wird auf den
+        Bereich der Aufträge gleichen Vorrangs begrenzt.
+
+        Returns
+        -------
+        Ob der Auftrag gefunden und verschoben wurde.
+        """
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job.status is not JobStatus.QUEUED: return False
+            self._pending.remove(job)
+            same = [i for i, j in enumerate(self._pending)
+                    if j.priority == job.priority]
+            first = same[0] if same else self._index(job.priority, True)
+            last = same[-1] + 1 if same else first
+            self._pending.insert(min(max(first, index), last), job)
+            return True
+
+    def _index(self, priority: Priority, front: bool) -> int:
+        """
+        Interne Methode, die die Einfügeposition für einen Auftrag ermittelt:
+        vor (`front`) bzw. hinter allen wartenden Aufträgen gleichen Vorrangs.
+        """
+        for i, job in enumerate(self._pending):
+            if job.priority < priority or (front and
+                                           job.priority == priority):
+                return i
+        return len(self._pending)
+
+    def _insert(self, job: Job, front: bool = False) -> None:
+        """
+        Interne Methode, die einen Auftrag entsprechend seinem Vorrang in die
+        Warteschlange einordnet. Verdrängte Aufträge werden mit `front` vor
+        alle Aufträge gleichen Vorrangs gestellt. Muss mit gehaltener Sperre
+        aufgerufen werden.
+        """
+        job.status = JobStatus.QUEUED
+        self._pending.insert(self._index(job.priority, front), job)
+
+    def _run(self) -> None:
+        """
+        Interne Methode des Hintergrundthreads, die Aufträge nach Vorrang
+        abspielt und verdrängte Aufträge wieder einreiht.
+        """
+        while True:
+            with self._cond:
+                while not self._pending: self._cond.wait()
+                job = self.current = self._pending.pop(0)
+                job.status = JobStatus.PLAYING
+                if job.deadline is not None and job.started is None:
+                    _LATENESS.observe(time.time() - job.deadline)
+                # Bei Fortsetzung die bereits gespielte Zeit anrechnen
+                offset = job.timeline.times[job.played] \
+                    if job.played < len(job.timeline) else 0.0
+                job.started = time.monotonic() - offset
+
+            status = JobStatus.DONE
+            try:
+                job.played += len(self.carillon.play(
+                    job.timeline, job.active, job.played, job.interrupt))
+            except Exception as e:
+                warnings.warn(f'Wiedergabe von Auftrag {job.id} '
+                              f'fehlgeschlagen: {e}')
+                status = JobStatus.FAILED
+
+            with self._cond:
+                self.current = None
+                if job.status is JobStatus.PLAYING:
+                    if status is JobStatus.DONE and job.interrupt.is_set() \
+                            and job.played < len(job.timeline):
+                        job.interrupt.clear()
+                        self._insert(job, front=True)
+                    else:
+                        job.status = status
+                        job.finished = time.monotonic()
+                self._trim()
+
+    def _trim(self) -> None:
+        """
+        Interne Methode, die nur die letzten `history` abgeschlossenen
+        Aufträge aufbewahrt. Muss mit gehaltener Sperre aufgerufen werden.
+        """
+        finished = [i for i, j in self._jobs.items()
+                    if j.finished is not None]
+        for i in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[i]
@@ -1,9 +1,33 @@
-from dataclasses import dataclass
+import array
+from dataclasses import dataclass, field
 import mido
+from mido.frozen import freeze_message
+import mido.ports
+from threading import Event
 import time
-from typing import List
+from typing import Callable, Iterable, List, Tuple, Union
 import warnings
 
+from ..metrics import Histogram, Registry
+from .deadline import sleep_until
+from ..songs.timeline import Timeline
+
+
+def _prepare(note: int) -> Tuple[mido.Message, mido.Message]:
+    """
+    Erzeugt die eingefrorenen `note_on`- und `note_off`-Nachrichten einer
+    Note.
+    """
+    return (freeze_message(mido.Message('note_on', note=note)),
+            freeze_message(mido.Message('note_off', note=note)))
+
+_SEND = Registry.default().histogram(
+    'carillon_send_seconds', 'Dauer des Sendens eines Anschlags in Sekunden.',
+    Histogram.FAST)
+_LATENESS = Registry.default().histogram(
+    'carillon_play_lateness_seconds',
+    'Verspätung der Anschläge einer Melodie in Sekunden.')
+
 
 @dataclass
 class Carillon:
@@ -11,20 +35,38 @@ class Carillon:
     Klasse, die die Kommunikation zu GrandOrgue über MIDI-Messages abstrahiert
     zur Verfügung stellt.
 
+    Constants
+    ---------
+    LOWEST : int
+        Tiefste Note des Carillons.
+    HIGHEST : int
+        Höchste Note des Carillons.
+    MESSAGES : dict
+        Für jede Note des Carillons vorab erzeugte und eingefrorene
+        `note_on`- und `note_off`-Nachrichten.
+
     Attributes
     ----------
-    port : mido.backends.rtmidi.Output
-        MIDI-Port, an den die Nachrichten gesendet werden.
+    port : mido.ports.BaseOutput
+        MIDI-Port, an den die Nachrichten gesendet werden (standardmäßig der
+        Standardausgang von rtmidi, zum Testen etwa ein `RecordingPort`).
 
     Methods
     -------
     hit(note)
         Schlägt eine Glocke an.
-    play(*messages)
-        Spielt eine Melodie auf dem Carillon.
+    chord(notes)
+        Schlägt mehrere Glocken in einem Schwung an.
+    play(melody, active, start, interrupt) : array.array
+        Spielt eine Melodie auf dem Carillon und gibt die Verspätungen der
+        einzelnen Anschläge zurück.
     """
 
-    port: mido.backends.rtmidi.Output = mido.open_output()
+    LOWEST = 34
+    HIGHEST = 89
+    MESSAGES = {n: _prepare(n) for n in range(LOWEST, HIGHEST + 1)}
+
+    port: mido.ports.BaseOutput = field(default_factory=mido.open_output)
 
     def hit(self, note: int) -> None:
         """
@@ -36,21 +78,84 @@ class Carillon:
         note : int
             MIDI-Notenwert der anzuschlagenden Glocke.
         """
-        if note < 34 or note > 89:
-            warnings.warn(f'Note {note} nicht durch das Carillon abgebildet!')
-        else:
-            self.port.send(mido.Message('note_on', note=note))
-            self.port.send(mido.Message('note_off', note=note))
+        self.chord((note, ))
 
-    def play(self, messages: List[mido.Message]) -> None:
+    def chord(self, notes: Iterable[int]) -> None:
         """
-        Spielt eine übergebene Melodie auf dem Carillon.
+        Schlägt mehrere Glocken gleichzeitig an. Zunächst werden alle
+        `note_on`-, danach alle `note_off`-Nachrichten in einem Schwung
+        gesendet. Es werden ausschließlich vorbereitete, eingefrorene
+        Nachrichten über `port.send` genutzt. Nicht vorhandene Glocken werden
+        mit einer Warnung übersprungen. Die Dauer des Sendens
+        wird im Histogramm `carillon_send_seconds` erfasst.
 
         Parameters
         ----------
-        messages : List[mido.Message]
-            MIDI-Nachrichten, die die Melodie kodieren.
+        notes : Iterable[int]
+            MIDI-Notenwerte der anzuschlagenden Glocken.
+        """
+        prepared = []
+        for note in notes:
+            e = Carillon.MESSAGES.get(note)
+            if e is None:
+                warnings.warn(f'Note {note} nicht durch das Carillon '
+                              'abgebildet!')
+            else: prepared.append(e)
+        if not prepared: return
+
+        start = time.perf_counter()
+        for on, _ in prepared: self.port.send(on)
+        for _, off in prepared: self.port.send(off)
+        _SEND.observe(time.perf_counter() - start)
+
+    def play(
+        self, melody: Union[Timeline, List[mido.Message]],
+        active: Callable[[], bool] = None, start: int = 0,
+        interrupt: Event = None
+    ) -> array.array:
+        """
+        Spielt eine übergebene Melodie auf dem Carillon. Jeder Anschlag wird
+        gegen eine absolute Frist auf der monotonen Uhr geplant, sodass sich
+        Verzögerungen einzelner Anschläge nicht auf den Rest der Melodie
+        übertragen. Gleichzeitige Anschläge werden gemeinsam gesendet, ihre
+        Verspätung wird im Histogramm `carillon_play_lateness_seconds`
+        erfasst.
+
+        Parameters
+        ----------
+        melody : Timeline | List[mido.Message]
+            Kompilierte Abfolge der Anschläge oder MIDI-Nachrichten, die die
+            Melodie kodieren.
+        active : Callable[[], bool] (optional)
+            Wird vor jedem Anschlag abgefragt; liefert sie `False`, wird die
+            Wiedergabe abgebrochen.
+        start : int (optional)
+            Index des ersten zu spielenden Anschlags, um eine unterbrochene
+            Wiedergabe fortzusetzen.
+        interrupt : Event (optional)
+            Wird es gesetzt, bricht die Wiedergabe auch während der Pausen
+            zwischen zwei Anschlägen sofort ab.
+
+        Returns
+        -------
+        Verspätung jedes gespielten Anschlags in Sekunden. Ihre Anzahl ist
+        die Zahl der gespielten Anschläge.
         """
-        for msg in messages:
-            time.sleep(msg.time)
-            if msg.type == 'note_on' and msg.velocity != 0: self.hit(msg.note)
+        melody = Timeline.coerce(melody)
+        times, notes = melody.times, melody.notes
+        lateness = array.array('d')
+        i = start
+        if i >= len(times): return lateness
+        origin = time.monotonic() - times[i]
+        while i < len(times):
+            # Gleichzeitige Anschläge (Akkorde) gemeinsam senden
+            j = i + 1
+            while j < len(times) and times[j] == times[i]: j += 1
+            late = sleep_until(origin + times[i], interrupt=interrupt)
+            if interrupt is not None and interrupt.is_set(): break
+            if active is not None and not active(): break
+            self.chord(notes[i:j])
+            _LATENESS.observe(late)
+            lateness.extend([late] * (j - i))
+            i = j
+        return lateness
@@ -0,0 +1,71 @@
+import mido
+import time
+from typing import Callable, List, Union
+
+from .carillon import Carillon
+from .recordingport import RecordingPort
+from ..songs.timeline import Timeline
+from .timingreport import TimingReport
+
+
+class Harness:
+    """
+    Prüfstand, der ein Carillon mit einem `RecordingPort` betreibt, Lieder
+    und Schlagfolgen abspielt und deren Timing mit der idealen Abfolge
+    vergleicht. So lassen sich Änderungen am Timing ohne MIDI-Hardware (etwa
+    in einer CI) prüfen.
+
+    Attributes
+    ----------
+    port : RecordingPort
+        Virtueller MIDI-Ausgang, der alle Anschläge aufzeichnet.
+    carillon : Carillon
+        Carillon, das an den virtuellen Ausgang sendet.
+
+    Methods
+    -------
+    play(melody) : TimingReport
+        Spielt eine Melodie und bewertet ihr Timing.
+    run(action, ideal) : TimingReport
+        Führt eine beliebige Schlagfolge aus und bewertet ihr Timing.
+    """
+
+    def __init__(self):
+        """Erstellt den Prüfstand samt virtuellem Ausgang und Carillon."""
+        self.port = RecordingPort()
+        self.carillon = Carillon(self.port)
+
+    def play(
+        self, melody: Union[Timeline, List[mido.Message]]
+    ) -> TimingReport:
+        """
+        Spielt eine Melodie auf dem Carillon und vergleicht die Anschläge mit
+        ihrer Timeline. Noten außerhalb des Carillons werden nicht erwartet.
+        """
+        melody = Timeline.coerce(melody)
+        return self.run(lambda: self.carillon.play(melody), melody)
+
+    def run(
+        self, action: Callable[[], object],
+        ideal: Union[Timeline, List[mido.Message]]
+    ) -> TimingReport:
+        """
+        Führt eine Schlagfolge aus, etwa
+        `lambda: self.carillon.play(rules.strike(3, 4))` mit einer
+        Läuteordnung `rules`, und vergleicht die aufgezeichneten Anschläge
+        mit der idealen Abfolge.
+
+        Parameters
+        ----------
+        action : Callable[[], object]
+            Auszuführende Schlagfolge.
+        ideal : Timeline | List[mido.Message]
+            Ideale Abfolge der Anschläge ab dem Aufruf von `action`.
+        """
+        ideal = [(t, n) for t, n in Timeline.coerce(ideal)
+                 if n in Carillon.MESSAGES]
+        self.port.clear()
+        start = time.perf_counter()
+        action()
+        actual = [(t - start, n) for t, n in self.port.onsets()]
+        return TimingReport.compare(ideal, actual)
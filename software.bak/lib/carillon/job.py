@@ -0,0 +1,110 @@
+from dataclasses import dataclass, field
+import enum
+import itertools
+from threading import Event
+import time
+
+from ..songs.timeline import Timeline
+
+_ids = itertools.count(1)
+
+
+class JobStatus(enum.Enum):
+    """Kodierung des Zustands eines Wiedergabeauftrags."""
+
+    QUEUED = enum.auto()
+    PLAYING = enum.auto()
+    DONE = enum.auto()
+    CANCELLED = enum.auto()
+    FAILED = enum.auto()
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+
+class Priority(enum.IntEnum):
+    """
+    Vorrang eines Wiedergabeauftrags im `Arbiter`: Stundenschläge vor
+    Liedern vor Tests.
+    """
+
+    TEST = 0
+    SONG = 1
+    STRIKE = 2
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+
+@dataclass
+class Job:
+    """
+    Auftrag zur Wiedergabe einer Melodie im `Arbiter`.
+
+    Attributes
+    ----------
+    timeline : Timeline
+        Abzuspielende Melodie.
+    title : str
+        Bezeichnung des Auftrags (etwa der Liedtitel).
+    priority : Priority
+        Vorrang des Auftrags.
+    deadline : float
+        Frist als Unix-Zeit, zu der die Wiedergabe beginnen soll (oder
+        `None`).
+    id : int
+        Fortlaufende, eindeutige Nummer des Auftrags.
+    status : JobStatus
+        Aktueller Zustand des Auftrags.
+    started : float
+        Startzeitpunkt der Wiedergabe auf der Uhr `time.monotonic()`.
+    finished : float
+        Endzeitpunkt der Wiedergabe auf der Uhr `time.monotonic()`.
+    played : int
+        Anzahl bereits gespielter Anschläge; ein verdrängter Auftrag wird
+        ab hier fortgesetzt.
+    interrupt : Event
+        Abbruchsignal, das die laufende Wiedergabe auch während einer Pause
+        sofort beendet (bei Abbruch oder Verdrängung).
+
+    Methods
+    -------
+    active() : bool
+        Gibt an, ob die Wiedergabe fortgesetzt werden soll.
+    position() : float
+        Aktuelle Wiedergabeposition in Sekunden.
+    to_dict() : dict
+        Darstellung des Auftrags für die API.
+    """
+
+    timeline: Timeline
+    title: str = ''
+    priority: Priority = Priority.SONG
+    deadline: float = None
+    id: int = field(default_factory=lambda: next(_ids))
+    status: JobStatus = JobStatus.QUEUED
+    started: float = None
+    finished: float = None
+    played: int = 0
+    interrupt: Event = field(default_factory=Event, repr=False,
+                             compare=False)
+
+    def active(self) -> bool:
+        """Gibt an, ob die Wiedergabe fortgesetzt werden soll."""
+        return self.status is JobStatus.PLAYING
+
+    def position(self) -> float:
+        """Aktuelle Wiedergabeposition in Sekunden."""
+        if self.started is None: return 0.0
+        # Verdrängt und auf Fortsetzung wartend
+        if self.status is JobStatus.QUEUED:
+            return self.timeline.times[self.played]
+        end = time.monotonic() if self.finished is None else self.finished
+        return min(end - self.started, self.timeline.duration)
+
+    def to_dict(self) -> dict:
+        """Darstellung des Auftrags für die API."""
+        return dict(id=self.id, title=self.title, status=str(self.status),
+                    priority=str(self.priority),
+                    position=round(self.position(), 3),
+                    duration=round(self.timeline.duration, 3))
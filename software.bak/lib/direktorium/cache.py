@@ -0,0 +1,79 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List
+
+
+class Cache(ABC):
+    """
+    Abstrakte Schnittstelle für den Zwischenspeicher des Direktoriums. Ein
+    Cache hält ganze Jahre im API-Format je Kalender vor.
+
+    Attributes
+    ----------
+    path : str
+        Verzeichnis, in dem der Cache abgelegt ist.
+    indexed : bool
+        Gibt an, ob einzelne Tage ohne Einlesen des ganzen Jahres
+        nachgeschlagen werden können.
+
+    Methods
+    -------
+    year(kalender, year) : dict
+        Liest ein ganzes Jahr im API-Format.
+    day(kalender, d) : List[dict]
+        Liest die Einträge eines Tages im API-Format.
+    store(kalender, year, data, validators)
+        Legt ein ganzes Jahr im API-Format ab.
+    validators(kalender, year) : dict
+        Liest die HTTP-Validatoren (`ETag`, `Last-Modified`) eines Jahres.
+    """
+
+    indexed = False
+
+    def __init__(self, path: str):
+        """
+        Erstellt den Cache.
+
+        Parameters
+        ----------
+        path : str
+            Verzeichnis, in dem der Cache abgelegt werden soll.
+        """
+        self.path = path
+
+    @abstractmethod
+    def year(self, kalender: str, year: int) -> dict:
+        """
+        Liest ein ganzes Jahr im API-Format oder gibt `None` zurück, falls es
+        nicht zwischengespeichert ist.
+        """
+        pass
+
+    def day(self, kalender: str, d: date) -> List[dict]:
+        """
+        Liest die Einträge eines Tages im API-Format oder gibt `None` zurück,
+        falls das Jahr nicht zwischengespeichert ist.
+        """
+        data = self.year(kalender, d.year)
+        if data is None: return None
+        datestr = d.isoformat()
+        return [e for e in data['Zelebrationen'].values()
+                if e['Datum'] == datestr]
+
+    @abstractmethod
+    def store(
+        self, kalender: str, year: int, data: dict, validators: dict = None
+    ) -> None:
+        """
+        Legt ein ganzes Jahr im API-Format samt den HTTP-Validatoren der
+        Antwort atomar ab.
+        """
+        pass
+
+    @abstractmethod
+    def validators(self, kalender: str, year: int) -> dict:
+        """
+        Liest die HTTP-Validatoren eines Jahres oder gibt `None` zurück, falls
+        das Jahr nicht zwischengespeichert ist.
+        """
+        pass
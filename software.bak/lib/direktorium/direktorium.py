@@ -1,12 +1,30 @@
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import date, timedelta
-import json
-import os
+from functools import lru_cache
+import numpy as np
 import requests
-from typing import List
+from requests.adapters import HTTPAdapter
+from threading import Lock
+import time
+from urllib3.util import Retry
+import warnings
+from typing import Dict, Iterable, List, Tuple
 
+from ..metrics import Registry
+from .cache import Cache
 from .event import Event
+from .jsoncache import JsonCache
 from .season import Season
+from .seasontable import SeasonTable
+
+_HITS = Registry.default().counter(
+    'direktorium_cache_hits_total',
+    'Aus dem Speicher oder dem Cache beantwortete Abfragen.')
+_MISSES = Registry.default().counter(
+    'direktorium_cache_misses_total', 'Über die API beantwortete Abfragen.')
+_API = Registry.default().histogram(
+    'direktorium_api_seconds', 'Dauer der Anfragen an die API in Sekunden.')
 
 
 @dataclass
@@ -22,46 +40,202 @@ class Direktorium:
         https://www.eucharistiefeier.de/lk/api-abfrage.php.
     cache_dir : str
         Verzeichnis, in dem Ergebnisse zwischengespeichert werden sollen.
+    cache : Cache
+        Genutzter Zwischenspeicher, standardmäßig ein `JsonCache` in
+        `cache_dir`.
+    offline : bool
+        Gibt an, ob für nicht lokal vorliegende Jahre sofort offline
+        berechnet statt online abgefragt werden soll.
+
+    Constants
+    ---------
+    YEARS : int
+        Anzahl an Jahren (über alle Kalender), die indiziert im Speicher
+        gehalten werden.
+    API : str
+        Adresse der Online-API.
+    TIMEOUT : Tuple[float, float]
+        Zeitlimits in Sekunden für Verbindungsaufbau und Antwort.
+    RETRIES : int
+        Anzahl der Wiederholungen fehlgeschlagener Anfragen (mit exponentiell
+        wachsender, zufällig gestreuter Wartezeit).
 
     Methods
     -------
     get(d) : List[Event]
         Gibt eine Liste von Events für ein Datum zurück.
-    request_api(year, month, day) : requests.models.Response
+    get_range(start, end) : Dict[date, List[Event]]
+        Gibt die Events aller Tage eines Zeitraums zurück.
+    load_year(year) : Dict[date, List[Event]]
+        Gibt den Index eines Jahres zurück (aus dem Speicher oder Cache).
+    read_year(year) : dict
+        Liest ein ganzes Jahr im API-Format aus dem Cache.
+    request_api(year, month, day, headers) : requests.models.Response
         Fragt die API online über ein Datum ab.
     request_cache(d) : dict
         Erstellt das API-Format aus dem Cache.
+    revalidate(year) : bool
+        Prüft ein zwischengespeichertes Jahr per bedingter Anfrage auf
+        Änderungen.
     season(d) : Season
         Ermittelt die Zeit im Kirchenjahr, in die das Datum fällt.
+    season_range(start, end) : np.ndarray
+        Ermittelt die Zeiten im Kirchenjahr für alle Tage eines Zeitraums.
+
+    _memory(year) : Dict[date, List[Event]]
+        Sucht den Index eines Jahres im Speicher.
 
     Static Methods
     --------------
     easter(year) : date
         Ermittelt das Osterdatum für ein gegebenes Jahr.
+    session() : requests.Session
+        Gemeinsame HTTP-Sitzung mit Verbindungspool und Wiederholungen.
+    _boundaries(year) : Tuple[date, date, date, date, date]
+        Grenzen der Zeiten im Kirchenjahr eines Jahres.
+    _calendarium() : Calendarium
+        Offline-Kalender als Rückfallebene.
+    _validators(r) : dict
+        Liest die HTTP-Validatoren einer Antwort.
+    _index(entries) : Dict[date, List[Event]]
+        Ordnet Einträge im API-Format als Events ihren Daten zu.
     """
 
+    YEARS = 4
+    API = 'http://www.eucharistiefeier.de/lk/api.php'
+    TIMEOUT = (5, 30)
+    RETRIES = 3
+
     kalender: str = 'deutschland'
     cache_dir: str = None
+    cache: Cache = field(default=None, repr=False, compare=False)
+    offline: bool = False
+
+    _years = OrderedDict()
+    _years_lock = Lock()
+    _session = None
+    _session_lock = Lock()
+
+    def __post_init__(self) -> None:
+        """Verbindet `cache_dir` und `cache` miteinander."""
+        if self.cache is None and self.cache_dir is not None:
+            self.cache = JsonCache(self.cache_dir)
+        elif self.cache is not None:
+            self.cache_dir = self.cache.path
 
     def get(self, d: date) -> List[Event]:
-        """Gibt eine Liste von Events für ein angegebenes Datum zurück."""
-        r = self.request_cache(d)
-        entries = [Event.parse(e) for e in r.json()['Zelebrationen'].values()]
-        entries.sort(key=lambda e: e.importance)
-        return entries
+        """
+        Gibt eine Liste von Events für ein angegebenes Datum zurück. Liegt das
+        Jahr bereits im Speicher (etwa durch den `Prefetcher`), ist dies ein
+        Nachschlagen im Jahresindex. Ein indizierter Cache liest andernfalls
+        nur die Einträge des Tages.
+
+        Ist `offline` gesetzt und liegt das Jahr nicht lokal vor, oder ist die
+        API nicht erreichbar, werden die Events offline durch das
+        `Calendarium` berechnet.
+        """
+        index = self._memory(d.year)
+        if index is not None: return list(index.get(d, ()))
+        if self.offline and (self.cache is None or
+                             self.cache.validators(self.kalender, d.year)
+                             is None):
+            return Direktorium._calendarium().get(d)
+
+        try:
+            if self.cache is None:
+                _MISSES.inc()
+                data = self.request_api(d.year, d.month, d.day).json()
+                index = Direktorium._index(data['Zelebrationen'].values())
+                return index.get(d, [])
+            if self.cache.indexed:
+                entries = self.cache.day(self.kalender, d)
+                if entries is not None:
+                    _HITS.inc()
+                    return Direktorium._index(entries).get(d, [])
+            return list(self.load_year(d.year).get(d, ()))
+        except requests.exceptions.RequestException as e:
+            warnings.warn(f'API nicht erreichbar, berechne offline: {e}')
+            return Direktorium._calendarium().get(d)
+
+    def get_range(self, start: date, end: date) -> Dict[date, List[Event]]:
+        """
+        Gibt die Events aller Tage von `start` bis einschließlich `end`
+        zurück, auch über Jahresgrenzen hinweg. Jedes betroffene Jahr wird
+        dazu nur einmal am Stück geladen, statt Tag für Tag abzufragen.
+        """
+        events = {}
+        d = start
+        for year in range(start.year, end.year + 1):
+            index = self.load_year(year)
+            last = min(end, date(year, 12, 31))
+            while d <= last:
+                if d in index: events[d] = list(index[d])
+                d += timedelta(days=1)
+        return events
+
+    def load_year(self, year: int) -> Dict[date, List[Event]]:
+        """
+        Gibt den Index eines Jahres zurück, der jedem Datum die nach
+        Wichtigkeit sortierten Events zuordnet. Die zuletzt genutzten Jahre
+        werden im Speicher gehalten, ältere verdrängt.
+        """
+        index = self._memory(year)
+        if index is not None: return index
+
+        if self.cache is None:
+            _MISSES.inc()
+            data = self.request_api(year).json()
+        else: data = self.read_year(year)
+        index = Direktorium._index(data['Zelebrationen'].values())
+        with Direktorium._years_lock:
+            Direktorium._years[(self.cache_dir, self.kalender, year)] = index
+            while len(Direktorium._years) > Direktorium.YEARS:
+                Direktorium._years.popitem(last=False)
+        return index
+
+    def read_year(self, year: int) -> dict:
+        """
+        Liest ein ganzes Jahr im API-Format aus dem Cache und lädt es dazu
+        falls nötig herunter.
+        """
+        data = self.cache.year(self.kalender, year)
+        if data is not None: _HITS.inc()
+        else:
+            _MISSES.inc()
+            r = self.request_api(year)
+            data = r.json()
+            self.cache.store(self.kalender, year, data,
+                             Direktorium._validators(r))
+        return data
 
     def request_api(
-        self, year: int, month: int = None, day: int = None
+        self, year: int, month: int = None, day: int = None,
+        headers: dict = None
     ) -> requests.models.Response:
         """
         Fragt die API online direkt ab, optional können Monat und Tag angegeben
-        werden.
+        werden. Die Anfrage nutzt die gemeinsame Sitzung mit Zeitlimits und
+        Wiederholungen; ihre Dauer wird im Histogramm
+        `direktorium_api_seconds` erfasst.
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            Falls die API auch nach allen Wiederholungen nicht oder mit einem
+            Fehler antwortet.
         """
-        url = 'http://www.eucharistiefeier.de/lk/api.php?format=json&' \
+        url = f'{Direktorium.API}?format=json&' \
               f'info=wdtrgflu&dup=e&bahn=j&kal={self.kalender}&jahr={year}&'
         if month: url += f'monat={month}&'
         if month and day: url += f'tag={day}&'
-        return requests.get(url)
+        start = time.perf_counter()
+        try:
+            r = Direktorium.session().get(url, headers=headers,
+                                          timeout=Direktorium.TIMEOUT)
+        finally:
+            _API.observe(time.perf_counter() - start)
+        r.raise_for_status()
+        return r
 
     def request_cache(self, d: date) -> dict:
         """
@@ -69,19 +243,11 @@ class Direktorium:
         Cache angelegt. Sollte kein Cache vorgesehen sein, wird direkt die
         Online-API abgefragt.
         """
-        if self.cache_dir is None:
-            return self.request_api(d.year, d.month, d.day)
+        if self.cache is None:
+            return self.request_api(d.year, d.month, d.day).json()
 
         # Daten einlesen (ggf. herunterladen)
-        dir = os.path.join(self.cache_dir, self.kalender)
-        file = os.path.join(dir, f'{d.year}.json')
-        if not os.path.exists(file):
-            if not os.path.exists(dir): os.makedirs(dir)
-            r = self.request_api(d.year)
-            with open(file, 'wb') as f: f.write(r.content)
-            data = r.json()
-        else:
-            with open(file) as f: data = json.load(f)
+        data = self.read_year(d.year)
 
         # Dictionary für aktuellen Tag konstruieren
         datestr = d.isoformat()
@@ -89,27 +255,68 @@ class Direktorium:
                                  if datestr == v['Datum']}
         return data
 
-    def season(self, d: date) -> Season:
+    def revalidate(self, year: int) -> bool:
         """
-        Ermittelt die Zeit im Kirchenjahr, in die das gegebene Datum fällt.
+        Prüft ein zwischengespeichertes Jahr mit `If-None-Match` bzw.
+        `If-Modified-Since` auf Änderungen und ersetzt es gegebenenfalls.
+        Ein noch nicht zwischengespeichertes Jahr wird heruntergeladen.
+
+        Returns
+        -------
+        Ob neue Daten geladen wurden.
         """
-        christmas = date(d.year, 12, 25)
-        advent = christmas - timedelta(days=21 + christmas.isoweekday())
-        if d >= advent: return Season.CHRISTMAS
+        validators = self.cache.validators(self.kalender, year)
+        if validators is None:
+            self.read_year(year)
+            return True
 
-        epiphany = date(d.year, 1, 6)
-        baptism = epiphany + timedelta(days=7 - epiphany.isoweekday() % 7)
-        if d <= baptism: return Season.CHRISTMAS
+        headers = {}
+        if 'ETag' in validators:
+            headers['If-None-Match'] = validators['ETag']
+        if 'Last-Modified' in validators:
+            headers['If-Modified-Since'] = validators['Last-Modified']
+        r = self.request_api(year, headers=headers)
+        if r.status_code == 304: return False
 
-        easter = Direktorium.easter(d.year)
-        ashwednsday = easter - timedelta(days=46)
-        if d >= ashwednsday and d < easter: return Season.LENT
+        self.cache.store(self.kalender, year, r.json(),
+                         Direktorium._validators(r))
+        with Direktorium._years_lock:
+            Direktorium._years.pop((self.cache_dir, self.kalender, year), None)
+        return True
 
-        pentecoste = easter + timedelta(days=49)
-        if d >= easter and d <= pentecoste: return Season.EASTER
+    def _memory(self, year: int) -> Dict[date, List[Event]]:
+        """
+        Interne Methode, die den Index eines Jahres im Speicher sucht und
+        `None` zurückgibt, falls er nicht geladen ist. Treffer werden in
+        `direktorium_cache_hits_total` gezählt.
+        """
+        key = (self.cache_dir, self.kalender, year)
+        with Direktorium._years_lock:
+            index = Direktorium._years.get(key)
+            if index is None: return None
+            Direktorium._years.move_to_end(key)
+        _HITS.inc()
+        return index
 
+    def season(self, d: date) -> Season:
+        """
+        Ermittelt die Zeit im Kirchenjahr, in die das gegebene Datum fällt.
+        """
+        baptism, ashwednesday, easter, pentecost, advent = \
+            Direktorium._boundaries(d.year)
+        if d <= baptism or d >= advent: return Season.CHRISTMAS
+        if d >= ashwednesday and d < easter: return Season.LENT
+        if d >= easter and d <= pentecost: return Season.EASTER
         return Season.ORDINARY
 
+    def season_range(self, start: date, end: date) -> np.ndarray:
+        """
+        Ermittelt die Zeiten im Kirchenjahr für alle Tage von `start` bis
+        einschließlich `end` vektorisiert über die `SeasonTable`. Geliefert
+        werden die Codes `Season.value`, ein Eintrag pro Tag.
+        """
+        return SeasonTable.default().season_range(start, end)
+
     @staticmethod
     def easter(year: int) -> date:
         """Ermittelt das Osterdatum für ein Jahr."""
@@ -118,3 +325,64 @@ class Direktorium:
         e = (32 + 2 * (b % 4) + 2 * (c // 4) - d - (c % 4)) % 7
         f = d + e - 7 * ((a + 11 * d + 22 * e) // 451) + 114
         return date(year, f // 31, f % 31 + 1)
+
+    @staticmethod
+    def _index(entries: Iterable[dict]) -> Dict[date, List[Event]]:
+        """
+        Interpretiert Einträge im API-Format und ordnet die Events, nach
+        Wichtigkeit sortiert, ihren Daten zu.
+        """
+        index = {}
+        for e in entries:
+            event = Event.parse(e)
+            index.setdefault(event.date, []).append(event)
+        for entries in index.values(): entries.sort(key=lambda e: e.importance)
+        return index
+
+    @staticmethod
+    def session() -> requests.Session:
+        """
+        Gibt die gemeinsame HTTP-Sitzung zurück, die Verbindungen offen hält
+        und fehlgeschlagene Anfragen mit exponentiell wachsender, zufällig
+        gestreuter Wartezeit wiederholt.
+        """
+        with Direktorium._session_lock:
+            if Direktorium._session is None:
+                retry = Retry(total=Direktorium.RETRIES, backoff_factor=0.5,
+                              backoff_jitter=0.5, allowed_methods={'GET'},
+                              status_forcelist=(429, 500, 502, 503, 504))
+                session = requests.Session()
+                session.mount('http://', HTTPAdapter(max_retries=retry))
+                session.mount('https://', HTTPAdapter(max_retries=retry))
+                Direktorium._session = session
+            return Direktorium._session
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _boundaries(year: int) -> Tuple[date, date, date, date, date]:
+        """
+        Ermittelt die Grenzen der Zeiten im Kirchenjahr: Taufe des Herrn,
+        Aschermittwoch, Ostern, Pfingsten und den ersten Advent.
+        """
+        christmas = date(year, 12, 25)
+        advent = christmas - timedelta(days=21 + christmas.isoweekday())
+        epiphany = date(year, 1, 6)
+        baptism = epiphany + timedelta(days=7 - epiphany.isoweekday() % 7)
+        easter = Direktorium.easter(year)
+        return (baptism, easter - timedelta(days=46), easter,
+                easter + timedelta(days=49), advent)
+
+    @staticmethod
+    def _calendarium() -> 'Calendarium':
+        """
+        Gibt den gemeinsamen Offline-Kalender zurück (der Import erfolgt erst
+        hier, da das `Calendarium` selbst auf dem Direktorium aufbaut).
+        """
+        from .calendarium import Calendarium
+        return Calendarium.default()
+
+    @staticmethod
+    def _validators(r: requests.models.Response) -> dict:
+        """Liest `ETag` und `Last-Modified` aus einer Antwort."""
+        return {k: r.headers[k] for k in ('ETag', 'Last-Modified')
+                if k in r.headers}
@@ -0,0 +1,88 @@
+from datetime import date
+from threading import Event, Thread
+import warnings
+
+
+class Prefetcher:
+    """
+    Lädt die Daten des laufenden und der kommenden Jahre im Hintergrund in
+    Cache und Speicher eines Direktoriums, damit zum Jahreswechsel nicht erst
+    im Thread des Geläuts heruntergeladen werden muss. Bereits
+    zwischengespeicherte Jahre werden per bedingter Anfrage aktualisiert.
+
+    Constants
+    ---------
+    INTERVAL : float
+        Abstand der regulären Prüfungen in Sekunden.
+    RETRY : float
+        Abstand in Sekunden, nach dem ein fehlgeschlagener Abruf wiederholt
+        wird.
+
+    Attributes
+    ----------
+    direktorium : Direktorium
+        Direktorium, dessen Daten vorgeladen werden.
+    years : int
+        Anzahl der kommenden Jahre, die zusätzlich vorgeladen werden.
+
+    Methods
+    -------
+    prefetch() : bool
+        Lädt alle benötigten Jahre einmalig vor.
+    stop()
+        Beendet den Hintergrundthread.
+    _run()
+        Interne Methode des Hintergrundthreads.
+    """
+
+    INTERVAL = 6 * 3600
+    RETRY = 15 * 60
+
+    def __init__(self, direktorium: 'Direktorium', years: int = 1):
+        """
+        Erstellt den Prefetcher und startet den Hintergrundthread.
+
+        Parameters
+        ----------
+        direktorium : Direktorium
+            Direktorium, dessen Daten vorgeladen werden sollen.
+        years : int (optional)
+            Anzahl der kommenden Jahre, die zusätzlich vorgeladen werden.
+        """
+        self.direktorium = direktorium
+        self.years = years
+        self._stop = Event()
+        Thread(target=self._run, daemon=True).start()
+
+    def prefetch(self) -> bool:
+        """
+        Lädt das laufende und die kommenden Jahre vor.
+
+        Returns
+        -------
+        Ob alle Jahre erfolgreich geladen wurden.
+        """
+        ok = True
+        today = date.today()
+        for year in range(today.year, today.year + self.years + 1):
+            try:
+                if self.direktorium.cache is not None:
+                    self.direktorium.revalidate(year)
+                self.direktorium.load_year(year)
+            except Exception as e:
+                warnings.warn(f'Direktorium {year} nicht abrufbar: {e}')
+                ok = False
+        return ok
+
+    def stop(self) -> None:
+        """Beendet den Hintergrundthread."""
+        self._stop.set()
+
+    def _run(self) -> None:
+        """
+        Interne Methode des Hintergrundthreads, die regelmäßig vorlädt und
+        Fehlschläge zeitnah wiederholt.
+        """
+        while not self._stop.is_set():
+            ok = self.prefetch()
+            self._stop.wait(Prefetcher.INTERVAL if ok else Prefetcher.RETRY)
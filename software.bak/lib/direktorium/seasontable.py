@@ -0,0 +1,167 @@
+from datetime import date
+import numpy as np
+
+from .season import Season
+
+
+class SeasonTable:
+    """
+    Tabelle der Grenzen der Zeiten im Kirchenjahr für alle Jahre des
+    gregorianischen Kalenders. Die Grenzen werden einmalig vektorisiert
+    berechnet, sodass ganze Zeiträume in einem Aufruf eingeordnet werden
+    können.
+
+    Alle Daten werden als Tage seit dem 1.1.1970 (`datetime64[D]`) geführt.
+
+    Constants
+    ---------
+    FIRST : int
+        Erstes Jahr der Tabelle (erstes volles Jahr nach der Kalenderreform).
+    LAST : int
+        Letztes Jahr der Tabelle.
+    CODES : Dict[int, Season]
+        Zuordnung der Codes in den Ergebnissen zu den Zeiten.
+
+    Attributes
+    ----------
+    easter : np.ndarray
+        Ostersonntag jedes Jahres.
+    baptism : np.ndarray
+        Fest der Taufe des Herrn (letzter Tag der Weihnachtszeit).
+    ashwednesday : np.ndarray
+        Aschermittwoch (erster Tag der Fastenzeit).
+    pentecost : np.ndarray
+        Pfingstsonntag (letzter Tag der Osterzeit).
+    advent : np.ndarray
+        Erster Adventssonntag (erster Tag der Weihnachtszeit).
+
+    Methods
+    -------
+    season(d) : Season
+        Ermittelt die Zeit im Kirchenjahr für ein Datum.
+    season_range(start, end) : np.ndarray
+        Ermittelt die Codes der Zeiten für alle Tage eines Zeitraums.
+    classify(days) : np.ndarray
+        Ermittelt die Codes der Zeiten für beliebige Tage.
+
+    Static methods
+    --------------
+    easter_days(years) : np.ndarray
+        Ermittelt die Osterdaten vieler Jahre auf einmal.
+
+    Class methods
+    -------------
+    default() : SeasonTable
+        Gemeinsame Tabelle des Prozesses.
+    """
+
+    FIRST = 1583
+    LAST = 9999
+    CODES = {s.value: s for s in Season}
+
+    _default = None
+
+    def __init__(self):
+        """Berechnet die Grenzen der Zeiten für alle Jahre der Tabelle."""
+        years = np.arange(SeasonTable.FIRST, SeasonTable.LAST + 1)
+        self.easter = SeasonTable.easter_days(years)
+        self.ashwednesday = self.easter - 46
+        self.pentecost = self.easter + 49
+
+        y = (years - 1970).astype('datetime64[Y]')
+        epiphany = y.astype('datetime64[D]') + 5
+        christmas = epiphany + 353 + _leap(years)
+        self.baptism = epiphany + 7 - _isoweekday(epiphany) % 7
+        self.advent = christmas - 21 - _isoweekday(christmas)
+
+    @classmethod
+    def default(cls) -> 'SeasonTable':
+        """Gibt die gemeinsame Tabelle des Prozesses zurück."""
+        if cls._default is None: cls._default = cls()
+        return cls._default
+
+    @staticmethod
+    def easter_days(years: np.ndarray) -> np.ndarray:
+        """
+        Ermittelt die Osterdaten vieler Jahre auf einmal (vektorisierte Form
+        von `Direktorium.easter`).
+
+        Parameters
+        ----------
+        years : np.ndarray
+            Jahreszahlen.
+
+        Returns
+        -------
+        Osterdaten als `datetime64[D]`.
+        """
+        years = np.asarray(years, dtype=np.int64)
+        a, b, c = years % 19, years // 100, years % 100
+        d = (19 * a + b - b // 4 - ((b - (b + 8) // 25 + 1) // 3) + 15) % 30
+        e = (32 + 2 * (b % 4) + 2 * (c // 4) - d - (c % 4)) % 7
+        f = d + e - 7 * ((a + 11 * d + 22 * e) // 451) + 114
+        months = (years - 1970) * 12 + f // 31 - 1
+        return (months.astype('datetime64[M]').astype('datetime64[D]')
+                + f % 31)
+
+    def season(self, d: date) -> Season:
+        """Ermittelt die Zeit im Kirchenjahr, in die das Datum fällt."""
+        day = np.array([d], dtype='datetime64[D]')
+        return SeasonTable.CODES[int(self.classify(day)[0])]
+
+    def season_range(self, start: date, end: date) -> np.ndarray:
+        """
+        Ermittelt die Zeiten im Kirchenjahr für alle Tage von `start` bis
+        einschließlich `end`.
+
+        Returns
+        -------
+        Codes der Zeiten (siehe `CODES` bzw. `Season.value`), ein Eintrag pro
+        Tag beginnend mit `start`.
+        """
+        days = np.arange(np.datetime64(start, 'D'),
+                         np.datetime64(end, 'D') + 1)
+        return self.classify(days)
+
+    def classify(self, days: np.ndarray) -> np.ndarray:
+        """
+        Ermittelt die Zeiten im Kirchenjahr für beliebige Tage.
+
+        Parameters
+        ----------
+        days : np.ndarray
+            Tage als `datetime64[D]`.
+
+        Returns
+        -------
+        Codes der Zeiten (siehe `CODES` bzw. `Season.value`).
+        """
+        days = np.asarray(days, dtype='datetime64[D]')
+        i = days.astype('datetime64[Y]').astype(np.int64) + 1970
+        if i.size and (i.min() < SeasonTable.FIRST
+                       or i.max() > SeasonTable.LAST):
+            raise ValueError(f'Nur Jahre {SeasonTable.FIRST} bis '
+                             f'{SeasonTable.LAST} werden unterstützt.')
+        i -= SeasonTable.FIRST
+
+        codes = np.full(days.shape, Season.ORDINARY.value, dtype=np.int8)
+        easter = self.easter[i]
+        codes[(days >= self.ashwednesday[i]) & (days < easter)] = \
+            Season.LENT.value
+        codes[(days >= easter) & (days <= self.pentecost[i])] = \
+            Season.EASTER.value
+        codes[(days <= self.baptism[i]) | (days >= self.advent[i])] = \
+            Season.CHRISTMAS.value
+        return codes
+
+
+def _leap(years: np.ndarray) -> np.ndarray:
+    """Gibt für jedes Jahr an, ob es ein Schaltjahr ist (als 0 bzw. 1)."""
+    return ((years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))) \
+        .astype(np.int64)
+
+
+def _isoweekday(days: np.ndarray) -> np.ndarray:
+    """Ermittelt den Wochentag (1 = Montag bis 7 = Sonntag) vieler Tage."""
+    # Der 1.1.1970 war ein Donnerstag
+    return (days.astype(np.int64) + 3) % 7 + 1
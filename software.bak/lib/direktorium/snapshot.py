@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Tuple
+
+from .event import Event
+from .season import Season
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Unveränderlicher Stand des Direktoriums für einen Tag. Er wird als Ganzes
+    ersetzt, sodass Leser nie einen halb aktualisierten Stand sehen.
+    """
+
+    date: date
+    events: Tuple[Event, ...]
+    season: Season
+    easter: date
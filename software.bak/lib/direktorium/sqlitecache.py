@@ -0,0 +1,128 @@
+from datetime import date
+import json
+import os
+import sqlite3
+from threading import Lock
+from typing import List
+
+from .cache import Cache
+from .jsoncache import JsonCache
+
+
+class SqliteCache(Cache):
+    """
+    Cache, der alle Einträge in einer SQLite-Datenbank `<path>/<FILE>`
+    indiziert nach Kalender und Datum ablegt. Das Nachschlagen eines Tages
+    liest nur dessen Zeilen. Vorhandene JSON-Dateien (`JsonCache`) werden beim
+    ersten Zugriff auf ein Jahr automatisch übernommen. Schreibzugriffe sind
+    Transaktionen, sodass sich mehrere Prozesse die Datenbank teilen können.
+
+    Constants
+    ---------
+    FILE : str
+        Dateiname der Datenbank.
+    """
+
+    FILE = 'direktorium.sqlite3'
+    indexed = True
+
+    def __init__(self, path: str):
+        """Erstellt den Cache und legt die Datenbank falls nötig an."""
+        super().__init__(path)
+        os.makedirs(path, exist_ok=True)
+        self._lock = Lock()
+        self._db = sqlite3.connect(os.path.join(path, SqliteCache.FILE),
+                                   timeout=30, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS years (kalender TEXT,'
+                             ' year INTEGER, meta TEXT, validators TEXT,'
+                             ' PRIMARY KEY (kalender, year))')
+            columns = [c[1] for c in
+                       self._db.execute('PRAGMA table_info(years)')]
+            if 'validators' not in columns:
+                self._db.execute('ALTER TABLE years'
+                                 ' ADD COLUMN validators TEXT')
+            self._db.execute('CREATE TABLE IF NOT EXISTS events (kalender TEXT,'
+                             ' datum TEXT, id TEXT, data TEXT,'
+                             ' PRIMARY KEY (kalender, datum, id))'
+                             ' WITHOUT ROWID')
+
+    def year(self, kalender: str, year: int) -> dict:
+        """
+        Liest ein ganzes Jahr oder gibt `None` zurück, falls es weder in der
+        Datenbank noch als JSON-Datei vorliegt.
+        """
+        if not self._migrate(kalender, year): return None
+        with self._lock:
+            meta, = self._db.execute(
+                'SELECT meta FROM years WHERE kalender = ? AND year = ?',
+                (kalender, year)).fetchone()
+            rows = self._db.execute(
+                'SELECT id, data FROM events WHERE kalender = ? AND datum >= ?'
+                ' AND datum < ? ORDER BY datum, id',
+                (kalender, f'{year:04d}', f'{year + 1:04d}')).fetchall()
+        data = json.loads(meta)
+        data['Zelebrationen'] = {i: json.loads(e) for i, e in rows}
+        return data
+
+    def day(self, kalender: str, d: date) -> List[dict]:
+        """
+        Liest die Einträge eines Tages oder gibt `None` zurück, falls das Jahr
+        weder in der Datenbank noch als JSON-Datei vorliegt.
+        """
+        if not self._migrate(kalender, d.year): return None
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT data FROM events WHERE kalender = ? AND datum = ?'
+                ' ORDER BY id', (kalender, d.isoformat())).fetchall()
+        return [json.loads(e) for e, in rows]
+
+    def store(
+        self, kalender: str, year: int, data: dict, validators: dict = None
+    ) -> None:
+        """Legt ein Jahr samt HTTP-Validatoren in einer Transaktion ab."""
+        meta = {k: v for k, v in data.items() if k != 'Zelebrationen'}
+        rows = [(kalender, e['Datum'], i, json.dumps(e))
+                for i, e in data['Zelebrationen'].items()]
+        with self._lock, self._db:
+            self._db.execute(
+                'DELETE FROM events WHERE kalender = ? AND datum >= ?'
+                ' AND datum < ?', (kalender, f'{year:04d}', f'{year + 1:04d}'))
+            self._db.executemany('INSERT OR REPLACE INTO events'
+                                 ' VALUES (?, ?, ?, ?)', rows)
+            self._db.execute(
+                'INSERT OR REPLACE INTO years VALUES (?, ?, ?, ?)',
+                (kalender, year, json.dumps(meta), json.dumps(validators or {})))
+
+    def validators(self, kalender: str, year: int) -> dict:
+        """
+        Liest die HTTP-Validatoren eines Jahres oder gibt `None` zurück, falls
+        das Jahr nicht zwischengespeichert ist.
+        """
+        if not self._migrate(kalender, year): return None
+        with self._lock:
+            v, = self._db.execute(
+                'SELECT validators FROM years WHERE kalender = ? AND year = ?',
+                (kalender, year)).fetchone()
+        return json.loads(v) if v else {}
+
+    def _migrate(self, kalender: str, year: int) -> bool:
+        """
+        Interne Methode, die prüft, ob ein Jahr in der Datenbank vorliegt, und
+        es andernfalls aus einer vorhandenen JSON-Datei übernimmt.
+
+        Returns
+        -------
+        Ob das Jahr (nun) in der Datenbank vorliegt.
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT 1 FROM years WHERE kalender = ? AND year = ?',
+                (kalender, year)).fetchone()
+        if row is not None: return True
+        legacy = JsonCache(self.path)
+        data = legacy.year(kalender, year)
+        if data is None: return False
+        self.store(kalender, year, data, legacy.validators(kalender, year))
+        return True
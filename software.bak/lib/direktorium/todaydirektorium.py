@@ -1,9 +1,13 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from threading import Event as Signal, Lock, Thread
 from typing import List
+import warnings
 
 from .direktorium import Direktorium
 from .event import Event
+from .prefetcher import Prefetcher
 from .season import Season
+from .snapshot import Snapshot
 
 
 class TodayDirektorium(Direktorium):
@@ -11,16 +15,31 @@ class TodayDirektorium(Direktorium):
     Eine Erweiterung der Direktoriumsklasse, die Ausgaben auf den heutigen Tag
     bezieht und cacht.
 
+    Der Stand des Tages wird kurz nach Mitternacht in einem eigenen Thread als
+    unveränderlicher `Snapshot` erstellt und als Ganzes veröffentlicht. Leser
+    greifen nur auf die aktuelle Referenz zu; erst wenn diese (etwa nach einem
+    Fehlschlag) veraltet ist, wird unter einer Sperre nachgeladen.
+
+    Constants
+    ---------
+    OFFSET : float
+        Abstand in Sekunden nach Mitternacht, zu dem neu erstellt wird.
+    RETRY : float
+        Abstand in Sekunden, nach dem ein fehlgeschlagenes Erstellen
+        wiederholt wird.
+    MAX_WAIT : float
+        Maximale Wartezeit in Sekunden, nach der das Datum erneut geprüft
+        wird (etwa nach Sprüngen der Systemuhr).
+
     Attributes
     ----------
-    _last_date : date
-        Letztes Datum, zu dem gecacht wurde.
-    _last_get : List[Event]
-        Eventliste des gecachten Tages.
-    _last_season : Season
-        Zeit im Kirchenjahr des gecachten Tages.
-    _last_easter : date
-        Osterdatum des aktuellen Jahres.
+    prefetcher : Prefetcher
+        Lädt das laufende und das kommende Jahr im Hintergrund vor (oder
+        `None`).
+    _snapshot : Snapshot
+        Zuletzt veröffentlichter Stand (oder `None`).
+    _lock : threading.Lock
+        Sperre, damit ein Stand nur einmal gleichzeitig erstellt wird.
 
     Methods
     -------
@@ -30,38 +49,99 @@ class TodayDirektorium(Direktorium):
         Gibt die Events des heutigen Tages zurück.
     season() : Season
         Gibt die Zeit im Kirchenjahr des heutigen Tages zurück.
-    _check()
-        Interne Methode, die das cachen nachhält.
+    snapshot() : Snapshot
+        Gibt den aktuellen Stand des heutigen Tages zurück.
+    stop()
+        Beendet den Hintergrundthread.
+    _refresh() : Snapshot
+        Interne Methode, die den Stand bei Bedarf neu erstellt.
+    _run()
+        Interne Methode des Hintergrundthreads.
     """
 
-    def __init__(self, *params, **kwargs):
-        """Erstellt das Objekt und bereitet das Caching vor."""
+    OFFSET = 5.0
+    RETRY = 60.0
+    MAX_WAIT = 3600.0
+
+    def __init__(self, *params, prefetch: bool = True, **kwargs):
+        """
+        Erstellt das Objekt und startet den Thread, der den Stand des Tages
+        erstellt.
+
+        Parameters
+        ----------
+        prefetch : bool (optional)
+            Gibt an, ob das laufende und das kommende Jahr im Hintergrund
+            vorgeladen werden sollen.
+        """
         super().__init__(*params, **kwargs)
-        self._last_date = date.today() - timedelta(days=1)
+        self._snapshot = None
+        self._lock = Lock()
+        self._stop = Signal()
+        self.prefetcher = Prefetcher(self) if prefetch else None
+        Thread(target=self._run, daemon=True).start()
 
     def easter(self) -> date:
         """Cacht das Osterdatum für das aktuelle Jahr."""
-        self._check()
-        return self._last_easter
+        return self.snapshot().easter
 
     def get(self) -> List[Event]:
         """Gibt eine Liste von heute stattfindenden Events zurück."""
-        self._check()
-        return self._last_get
+        return list(self.snapshot().events)
 
     def season(self) -> Season:
         """Ermittelt die aktuelle Zeit im Kirchenjahr."""
-        self._check()
-        return self._last_season
+        return self.snapshot().season
+
+    def snapshot(self) -> Snapshot:
+        """
+        Gibt den Stand des heutigen Tages zurück. Im Regelfall ist dies nur
+        das Lesen einer Referenz.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.date == date.today():
+            return snapshot
+        return self._refresh()
+
+    def stop(self) -> None:
+        """Beendet den Hintergrundthread (und den des Prefetchers)."""
+        self._stop.set()
+        if self.prefetcher is not None: self.prefetcher.stop()
+
+    def _refresh(self) -> Snapshot:
+        """
+        Interne Methode, die den Stand des heutigen Tages erstellt und
+        veröffentlicht, sofern er nicht bereits aktuell ist.
+        """
+        with self._lock:
+            today = date.today()
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.date == today:
+                return snapshot
+            snapshot = Snapshot(
+                date=today,
+                events=tuple(super().get(today)),
+                season=super().season(today),
+                easter=Direktorium.easter(today.year),
+            )
+            self._snapshot = snapshot
+            return snapshot
 
-    def _check(self) -> None:
+    def _run(self) -> None:
         """
-        Interne Methode, die überprüft, ob gecacht werden muss und dies ggf.
-        tut.
+        Interne Methode des Hintergrundthreads, die den Stand jeweils kurz
+        nach Mitternacht erstellt und Fehlschläge zeitnah wiederholt.
         """
-        today = date.today()
-        if self._last_date >= today: return
-        self._last_get = super().get(today)
-        self._last_season = super().season(today)
-        self._last_easter = Direktorium.easter(today.year)
-        self._last_date = today
+        while not self._stop.is_set():
+            try:
+                self._refresh()
+                now = datetime.now()
+                midnight = datetime.combine(now.date() + timedelta(days=1),
+                                            datetime.min.time())
+                timeout = min((midnight - now).total_seconds()
+                              + TodayDirektorium.OFFSET,
+                              TodayDirektorium.MAX_WAIT)
+            except Exception as e:
+                warnings.warn(f'Direktorium für heute nicht abrufbar: {e}')
+                timeout = TodayDirektorium.RETRY
+            self._stop.wait(timeout)
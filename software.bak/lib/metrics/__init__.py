@@ -0,0 +1,10 @@
+"""
+Bibliothek, die Messwerte (Zähler und Histogramme) mit geringem Aufwand
+erfasst und im Textformat von Prometheus zur Verfügung stellt.
+"""
+
+from .counter import Counter
+from .histogram import Histogram
+from .registry import Registry
+
+__all__ = ['Counter', 'Histogram', 'Registry', ]
@@ -0,0 +1,41 @@
+from threading import Lock
+from typing import List
+
+
+class Counter:
+    """
+    Monoton steigender Zähler.
+
+    Attributes
+    ----------
+    name : str
+        Name des Messwerts.
+    help : str
+        Beschreibung des Messwerts.
+    value : float
+        Aktueller Stand des Zählers.
+
+    Methods
+    -------
+    inc(amount)
+        Erhöht den Zähler.
+    expose() : List[str]
+        Gibt den Zähler im Textformat von Prometheus aus.
+    """
+
+    def __init__(self, name: str, help: str):
+        """Erstellt einen Zähler mit dem Stand null."""
+        self.name = name
+        self.help = help
+        self.value = 0
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        """Erhöht den Zähler um `amount`."""
+        with self._lock: self.value += amount
+
+    def expose(self) -> List[str]:
+        """Gibt den Zähler im Textformat von Prometheus aus."""
+        return [f'# HELP {self.name} {self.help}',
+                f'# TYPE {self.name} counter',
+                f'{self.name} {self.value}']
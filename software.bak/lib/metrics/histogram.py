@@ -0,0 +1,84 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import List, Sequence
+
+
+class Histogram:
+    """
+    Histogramm mit festen Klassengrenzen. Ein Messwert kostet eine binäre
+    Suche in den Grenzen und das Erhöhen eines Zählers; es werden keine
+    einzelnen Werte gespeichert, sodass auch häufige Messungen (etwa jeder
+    Anschlag einer Melodie) den Speicher nicht wachsen lassen.
+
+    Constants
+    ---------
+    LATENCY : Tuple[float, ...]
+        Klassengrenzen in Sekunden für Verspätungen und Anfragen.
+    FAST : Tuple[float, ...]
+        Klassengrenzen in Sekunden für kurze Vorgänge wie das Senden von
+        MIDI-Nachrichten.
+
+    Attributes
+    ----------
+    name : str
+        Name des Messwerts.
+    help : str
+        Beschreibung des Messwerts.
+    bounds : Tuple[float, ...]
+        Aufsteigende obere Grenzen der Klassen.
+    counts : List[int]
+        Anzahl der Messwerte je Klasse, zuletzt die oberhalb aller Grenzen.
+    sum : float
+        Summe aller Messwerte.
+    count : int
+        Anzahl aller Messwerte.
+
+    Methods
+    -------
+    observe(value)
+        Erfasst einen Messwert.
+    expose() : List[str]
+        Gibt das Histogramm im Textformat von Prometheus aus.
+    """
+
+    LATENCY = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+               0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    FAST = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001,
+            0.0025, 0.005, 0.01)
+
+    def __init__(self, name: str, help: str,
+                 bounds: Sequence[float] = LATENCY):
+        """Erstellt ein leeres Histogramm mit den angegebenen Grenzen."""
+        self.name = name
+        self.help = help
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = Lock()
+
+    def observe(self, value: float) -> None:
+        """Erfasst einen Messwert (etwa eine Dauer in Sekunden)."""
+        i = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+            self.count += 1
+
+    def expose(self) -> List[str]:
+        """
+        Gibt das Histogramm im Textformat von Prometheus aus (kumulierte
+        Klassen `_bucket`, `_sum` und `_count`).
+        """
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+        lines = [f'# HELP {self.name} {self.help}',
+                 f'# TYPE {self.name} histogram']
+        cumulative = 0
+        for bound, n in zip(self.bounds, counts):
+            cumulative += n
+            lines.append(f'{self.name}_bucket{{le="{bound:g}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {count}')
+        lines.append(f'{self.name}_sum {total:.9g}')
+        lines.append(f'{self.name}_count {count}')
+        return lines
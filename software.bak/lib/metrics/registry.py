@@ -0,0 +1,73 @@
+from threading import Lock
+from typing import Sequence, Union
+
+from .counter import Counter
+from .histogram import Histogram
+
+
+class Registry:
+    """
+    Verzeichnis aller Messwerte eines Prozesses. Module legen ihre Messwerte
+    beim Import über `counter` bzw. `histogram` an; der Server gibt sie über
+    `expose` gesammelt aus.
+
+    Methods
+    -------
+    counter(name, help) : Counter
+        Gibt einen Zähler zurück und legt ihn bei Bedarf an.
+    histogram(name, help, bounds) : Histogram
+        Gibt ein Histogramm zurück und legt es bei Bedarf an.
+    expose() : str
+        Gibt alle Messwerte im Textformat von Prometheus aus.
+    _get(cls, name, *args)
+        Interne Methode, die einen Messwert sucht oder anlegt.
+
+    Class methods
+    -------------
+    default() : Registry
+        Gemeinsames Verzeichnis des Prozesses.
+    """
+
+    _default = None
+
+    def __init__(self):
+        """Erstellt ein leeres Verzeichnis."""
+        self._metrics = {}
+        self._lock = Lock()
+
+    @classmethod
+    def default(cls) -> 'Registry':
+        """Gibt das gemeinsame Verzeichnis des Prozesses zurück."""
+        if cls._default is None: cls._default = cls()
+        return cls._default
+
+    def counter(self, name: str, help: str) -> Counter:
+        """Gibt den Zähler `name` zurück und legt ihn bei Bedarf an."""
+        return self._get(Counter, name, help)
+
+    def histogram(self, name: str, help: str,
+                  bounds: Sequence[float] = Histogram.LATENCY) -> Histogram:
+        """Gibt das Histogramm `name` zurück und legt es bei Bedarf an."""
+        return self._get(Histogram, name, help, bounds)
+
+    def expose(self) -> str:
+        """Gibt alle Messwerte im Textformat von Prometheus aus."""
+        with self._lock: metrics = sorted(self._metrics.items())
+        lines = []
+        for _, metric in metrics: lines.extend(metric.expose())
+        return '\n'.join(lines) + '\n'
+
+    def _get(self, cls: type, name: str,
+             *args) -> Union[Counter, Histogram]:
+        """
+        Interne Methode, die den Messwert `name` sucht oder als `cls` anlegt.
+        Existiert er bereits mit einem anderen Typ, wird ein Fehler geworfen.
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args)
+            elif not isinstance(metric, cls):
+                raise TypeError(f'Messwert {name} existiert bereits als '
+                                f'{type(metric).__name__}!')
+            return metric
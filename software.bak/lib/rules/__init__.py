@@ -0,0 +1,13 @@
+"""
+Bibliothek, die eine deklarative Läuteordnung (TOML) mit dem Direktorium des
+Tages zu einem Fahrplan aus 96 Viertelstunden übersetzt und diesen als Plan
+des ganzen Tages im Voraus rendert.
+"""
+
+from .dayplan import DayPlan
+from .dayplayer import DayPlayer
+from .rule import Rule
+from .ruleset import RuleSet
+from .timetable import Timetable
+
+__all__ = ['DayPlan', 'DayPlayer', 'Rule', 'RuleSet', 'Timetable', ]
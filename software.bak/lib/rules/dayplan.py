@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import cached_property
+import mido
+from typing import List, Tuple
+
+from ..songs import Timeline
+from .timetable import Timetable
+
+Entry = Tuple[float, Timeline, str]
+
+
+@dataclass(frozen=True)
+class DayPlan:
+    """
+    Geläut eines ganzen Tages, im Voraus als Abfolge zeitgestempelter
+    Einträge gerendert: Jede Melodie des Fahrplans beginnt zu ihrer
+    Viertelstunde bzw. im Anschluss an die vorherige Melodie derselben
+    Viertelstunde. Zeitpunkte werden als Sekunden seit Mitternacht (Ortszeit)
+    geführt.
+
+    Constants
+    ---------
+    NOTE : float
+        Länge der Noten im MIDI-Export in Sekunden.
+    TICKS : int
+        Auflösung des MIDI-Exports in Ticks pro Schlag.
+
+    Attributes
+    ----------
+    date : date
+        Tag des Plans.
+    entries : Tuple[Tuple[float, Timeline, str], ...]
+        Beginn in Sekunden seit Mitternacht, Melodie und Titel jedes
+        Eintrags, aufsteigend nach Beginn.
+    timeline : Timeline
+        Alle Anschläge des Tages als eine durchgehende Abfolge.
+
+    Methods
+    -------
+    at(offset) : datetime
+        Wandelt einen Zeitpunkt des Plans in Datum und Uhrzeit um.
+    timestamp(offset) : float
+        Wandelt einen Zeitpunkt des Plans in Unix-Zeit um.
+    between(start, end) : List[Tuple[datetime, str, float]]
+        Gibt die Einträge zurück, die in einem Zeitraum erklingen.
+    to_midi() : mido.MidiFile
+        Exportiert den Tag als MIDI-Datei.
+    export(file)
+        Schreibt den Tag als MIDI-Datei.
+
+    Class methods
+    -------------
+    from_timetable(timetable) : DayPlan
+        Rendert einen Fahrplan.
+    """
+
+    NOTE = 0.25
+    TICKS = 480
+
+    date: date
+    entries: Tuple[Entry, ...]
+
+    @classmethod
+    def from_timetable(cls, timetable: Timetable) -> 'DayPlan':
+        """
+        Rendert einen Fahrplan: Die Melodien jeder Viertelstunde werden
+        nacheinander ab deren Beginn eingeplant.
+        """
+        entries = []
+        for slot, actions in enumerate(timetable.slots):
+            start = slot * 900.0
+            for timeline, title in actions:
+                entries.append((start, timeline, title))
+                start += timeline.duration
+        return cls(timetable.date, tuple(sorted(entries, key=lambda e: e[0])))
+
+    @cached_property
+    def timeline(self) -> Timeline:
+        """
+        Alle Anschläge des Tages als eine Abfolge mit Zeitpunkten in Sekunden
+        seit Mitternacht.
+        """
+        strokes = sorted((start + t, note) for start, timeline, _ in
+                         self.entries for t, note in timeline)
+        end = max((s + t.duration for s, t, _ in self.entries), default=0.0)
+        return Timeline([t for t, _ in strokes], [n for _, n in strokes], end)
+
+    def at(self, offset: float) -> datetime:
+        """
+        Wandelt Sekunden seit Mitternacht in Datum und Uhrzeit (Ortszeit, wie
+        auf der Wanduhr) um.
+        """
+        return datetime.combine(self.date, time()) + timedelta(seconds=offset)
+
+    def timestamp(self, offset: float) -> float:
+        """
+        Wandelt Sekunden seit Mitternacht in Unix-Zeit um, sodass auch an
+        Tagen der Zeitumstellung zur Wanduhrzeit geläutet wird.
+        """
+        return self.at(offset).timestamp()
+
+    def between(
+        self, start: time = None, end: time = None
+    ) -> List[Tuple[datetime, str, float]]:
+        """
+        Gibt die Einträge zurück, die zwischen `start` (einschließlich) und
+        `end` (ausschließlich) erklingen, auch wenn sie vorher begonnen haben.
+
+        Parameters
+        ----------
+        start : time (optional)
+            Beginn des Zeitraums, standardmäßig Mitternacht.
+        end : time (optional)
+            Ende des Zeitraums, standardmäßig das Ende des Tages.
+
+        Returns
+        -------
+        Beginn, Titel und Dauer in Sekunden jedes Eintrags.
+        """
+        midnight = datetime.combine(self.date, time())
+        lo = 0.0 if start is None else \
+            (datetime.combine(self.date, start) - midnight).total_seconds()
+        hi = float('inf') if end is None else \
+            (datetime.combine(self.date, end) - midnight).total_seconds()
+        return [(self.at(s), title, timeline.duration)
+                for s, timeline, title in self.entries
+                if s < hi and (s + timeline.duration > lo or s >= lo)]
+
+    def to_midi(self) -> mido.MidiFile:
+        """
+        Exportiert den Tag als MIDI-Datei zur Durchsicht: eine Spur mit allen
+        Anschlägen (jeweils `NOTE` Sekunden lang) und einer Marke mit dem
+        Titel zu Beginn jedes Eintrags.
+        """
+        tempo = mido.bpm2tempo(120)
+        events = [(s, 0, mido.MetaMessage('marker', text=title))
+                  for s, _, title in self.entries]
+        for t, note in self.timeline:
+            events.append((t, 2, mido.Message('note_on', note=note)))
+            events.append((t + DayPlan.NOTE, 1,
+                           mido.Message('note_off', note=note)))
+        events.sort(key=lambda e: e[:2])
+
+        track = mido.MidiTrack([mido.MetaMessage('set_tempo', tempo=tempo)])
+        last = 0
+        for t, _, msg in events:
+            ticks = round(mido.second2tick(t, DayPlan.TICKS, tempo))
+            track.append(msg.copy(time=ticks - last))
+            last = ticks
+        midi = mido.MidiFile(ticks_per_beat=DayPlan.TICKS)
+        midi.tracks.append(track)
+        return midi
+
+    def export(self, file: str) -> None:
+        """Schreibt den Tag als MIDI-Datei (siehe `to_midi`)."""
+        self.to_midi().save(file)
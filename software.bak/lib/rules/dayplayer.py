@@ -0,0 +1,96 @@
+from bisect import bisect_left
+from threading import Event, Thread
+import time
+from typing import Callable
+import warnings
+
+from ..carillon import Arbiter, Priority
+from .dayplan import DayPlan
+
+
+class DayPlayer:
+    """
+    Spielt den im Voraus gerenderten Plan des Tages ab. Ein einziger Thread
+    schläft bis zur Frist des nächsten Eintrags und übergibt ihn dann mit dem
+    Vorrang `Priority.STRIKE` und seiner Frist an den Arbiter, der das
+    Carillon bespielt und die Verspätung des Beginns erfasst.
+
+    Fristen werden als Unix-Zeit geführt und vor jedem Eintrag neu gegen die
+    Systemuhr geprüft; der Thread schläft höchstens `MAX_SLEEP` Sekunden am
+    Stück, sodass Uhrsprünge und der Tageswechsel erkannt werden. Deutlich
+    verpasste Einträge werden übersprungen statt nachgeholt. Fehler beim
+    Erstellen des Plans oder Übergeben eines Eintrags beenden den Thread
+    nicht.
+
+    Constants
+    ---------
+    MAX_SLEEP : float
+        Maximale Schlafdauer in Sekunden.
+    GRACE : float
+        Verspätung in Sekunden, bis zu der Einträge noch gespielt werden.
+
+    Attributes
+    ----------
+    arbiter : Arbiter
+        Arbiter, an den die Einträge übergeben werden.
+    plan : Callable[[], DayPlan]
+        Liefert den Plan des aktuellen Tages.
+
+    Methods
+    -------
+    stop()
+        Beendet den Thread.
+    _run()
+        Interne Methode des Threads.
+    """
+
+    MAX_SLEEP = 60.0
+    GRACE = 60.0
+
+    def __init__(self, arbiter: Arbiter, plan: Callable[[], DayPlan]):
+        """Erstellt den Spieler und startet seinen Thread."""
+        self.arbiter = arbiter
+        self.plan = plan
+        self._stop = Event()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Beendet den Thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        """
+        Interne Methode des Threads, die die Einträge des Plans zu ihren
+        Fristen an den Arbiter übergibt. Fehler werden gewarnt und nach
+        `MAX_SLEEP` Sekunden erneut versucht; ein fehlgeschlagener Eintrag
+        wird nicht wiederholt.
+        """
+        day, deadlines, i = None, [], 0
+        while not self._stop.is_set():
+            try:
+                plan = self.plan()
+                if plan.date != day:
+                    day = plan.date
+                    deadlines = [plan.timestamp(s)
+                                 for s, _, _ in plan.entries]
+                    i = bisect_left(deadlines,
+                                    time.time() - DayPlayer.GRACE)
+
+                if i >= len(deadlines):
+                    self._stop.wait(DayPlayer.MAX_SLEEP)
+                    continue
+                remaining = deadlines[i] - time.time()
+                if remaining > 0:
+                    self._stop.wait(min(remaining, DayPlayer.MAX_SLEEP))
+                    continue
+
+                i += 1
+                if -remaining <= DayPlayer.GRACE:
+                    _, timeline, title = plan.entries[i - 1]
+                    self.arbiter.submit(timeline, title, Priority.STRIKE,
+                                        deadlines[i - 1])
+            except Exception as e:
+                warnings.warn(f'Plan des Tages nicht abspielbar: {e}')
+                self._stop.wait(DayPlayer.MAX_SLEEP)
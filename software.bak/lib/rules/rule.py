@@ -0,0 +1,187 @@
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Tuple, Union
+
+from ..direktorium import Rank, Season, Snapshot
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    Eine Regel der Läuteordnung. Sie gilt für eine Viertelstunde, wenn alle
+    angegebenen Bedingungen erfüllt sind; nicht angegebene Bedingungen sind
+    immer erfüllt.
+
+    Constants
+    ---------
+    TYPES : Dict[str, type | Tuple[type, ...]]
+        Erlaubte Typen der Schlüssel einer Regel.
+    ITEMS : Dict[str, type]
+        Erlaubte Typen der Einträge von Listen und Tabellen einer Regel.
+
+    Attributes
+    ----------
+    slots : FrozenSet[int]
+        Viertelstunden des Tages (0 bis 95), für die die Regel gilt (`None`
+        für alle).
+    easter : FrozenSet[int]
+        Abstände zum Ostersonntag in Tagen, an denen die Regel gilt.
+    rank : Rank
+        Mindestrang des Tages.
+    seasons : FrozenSet[Season]
+        Zeiten im Kirchenjahr, in denen die Regel gilt.
+    silence : bool
+        Gibt an, ob die Viertelstunde stumm bleibt.
+    strike : bool
+        Gibt an, ob Viertelstunden und Stunden geschlagen werden.
+    quarters : int
+        Anzahl der Viertelstundenschläge (`None` für die der Uhrzeit).
+    hours : int
+        Anzahl der Stundenschläge (`None` für die der Uhrzeit).
+    song : str | Dict[Season, str]
+        Im Anschluss zu spielendes Lied, ggf. je Zeit im Kirchenjahr.
+
+    Methods
+    -------
+    applies(snapshot) : bool
+        Prüft die Bedingungen, die vom Tag abhängen.
+    song_for(season) : str
+        Ermittelt das zu spielende Lied.
+
+    Class methods
+    -------------
+    parse(table) : Rule
+        Liest eine Regel aus einer Tabelle der Regeldatei.
+
+    Static methods
+    --------------
+    check(name, value, types)
+        Prüft den Typ eines Wertes der Regeldatei.
+    parse_time(time) : int
+        Wandelt eine Uhrzeit in die Nummer ihrer Viertelstunde um.
+    """
+
+    TYPES = {'at': list, 'from': str, 'until': str, 'easter': list,
+             'rank': str, 'season': list, 'silence': bool, 'strike': bool,
+             'quarters': int, 'hours': int, 'song': (str, dict)}
+    ITEMS = {'at': str, 'easter': int, 'season': str, 'song': str}
+
+    slots: FrozenSet[int] = None
+    easter: FrozenSet[int] = None
+    rank: Rank = None
+    seasons: FrozenSet[Season] = None
+    silence: bool = False
+    strike: bool = True
+    quarters: int = None
+    hours: int = None
+    song: Union[str, Dict[Season, str]] = None
+
+    def applies(self, snapshot: Snapshot) -> bool:
+        """
+        Prüft die Bedingungen der Regel, die vom Tag abhängen (Abstand zu
+        Ostern, Rang und Zeit im Kirchenjahr).
+        """
+        if self.easter is not None and \
+                (snapshot.date - snapshot.easter).days not in self.easter:
+            return False
+        if self.rank is not None:
+            rank = snapshot.events[0].rank if snapshot.events else Rank.NONE
+            if rank < self.rank: return False
+        if self.seasons is not None and snapshot.season not in self.seasons:
+            return False
+        return True
+
+    def song_for(self, season: Season) -> str:
+        """
+        Ermittelt das im Anschluss zu spielende Lied für die Zeit im
+        Kirchenjahr (oder `None`).
+        """
+        if isinstance(self.song, dict): return self.song.get(season)
+        return self.song
+
+    @classmethod
+    def parse(cls, table: dict) -> 'Rule':
+        """
+        Liest eine Regel aus einer Tabelle `[[rule]]` der Regeldatei.
+
+        Raises
+        ------
+        ValueError
+            Falls die Regel unbekannte Schlüssel oder ungültige Werte enthält.
+        """
+        unknown = set(table) - set(Rule.TYPES)
+        if unknown:
+            raise ValueError(f'Unbekannte Schlüssel in Regel: '
+                             f'{", ".join(sorted(unknown))}')
+        for key, value in table.items():
+            Rule.check(key, value, Rule.TYPES[key])
+            if isinstance(value, (list, dict)):
+                items = value.values() if isinstance(value, dict) else value
+                for item in items: Rule.check(key, item, Rule.ITEMS[key])
+
+        slots = None
+        if 'at' in table:
+            slots = frozenset(cls.parse_time(t) for t in table['at'])
+        elif 'from' in table or 'until' in table:
+            first = cls.parse_time(table.get('from', '00:00'))
+            last = cls.parse_time(table.get('until', '00:00')) or 96
+            # Zeiträume über Mitternacht hinweg
+            if first < last: slots = frozenset(range(first, last))
+            else: slots = frozenset(range(first, 96)).union(range(last))
+
+        try:
+            song = table.get('song')
+            if isinstance(song, dict):
+                song = {Season[k]: v for k, v in song.items()}
+            return cls(
+                slots=slots,
+                easter=frozenset(table['easter'])
+                if 'easter' in table else None,
+                rank=Rank[table['rank']] if 'rank' in table else None,
+                seasons=frozenset(Season[s] for s in table['season'])
+                if 'season' in table else None,
+                silence=bool(table.get('silence', False)),
+                strike=bool(table.get('strike', True)),
+                quarters=table.get('quarters'),
+                hours=table.get('hours'),
+                song=song,
+            )
+        except KeyError as e:
+            raise ValueError(f'Unbekannter Rang bzw. unbekannte Zeit im '
+                             f'Kirchenjahr: {e}') from e
+
+    @staticmethod
+    def check(name: str, value: object,
+              types: Union[type, Tuple[type, ...]]) -> None:
+        """
+        Prüft, ob ein Wert der Regeldatei einen der erlaubten Typen hat.
+        Wahrheitswerte gelten dabei nicht als Zahlen.
+
+        Raises
+        ------
+        ValueError
+            Falls der Wert einen anderen Typ hat.
+        """
+        types = types if isinstance(types, tuple) else (types,)
+        if not isinstance(value, types) or \
+                isinstance(value, bool) and bool not in types:
+            raise ValueError(f'Ungültiger Wert für {name}: {value!r}')
+
+    @staticmethod
+    def parse_time(time: str) -> int:
+        """
+        Wandelt eine Uhrzeit `HH:MM` in die Nummer ihrer Viertelstunde des
+        Tages (0 bis 95) um.
+
+        Raises
+        ------
+        ValueError
+            Falls die Uhrzeit ungültig ist oder nicht auf eine Viertelstunde
+            fällt.
+        """
+        try:
+            hours, minutes = (int(p) for p in time.split(':'))
+        except (AttributeError, ValueError):
+            raise ValueError(f'Ungültige Uhrzeit: {time}') from None
+        if not 0 <= hours < 24 or minutes not in (0, 15, 30, 45):
+            raise ValueError(f'{time} ist keine Viertelstunde!')
+        return hours * 4 + minutes // 15
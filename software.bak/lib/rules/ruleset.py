@@ -0,0 +1,209 @@
+from dataclasses import dataclass
+import os
+import tomllib
+from typing import Dict, List, Tuple
+
+from ..direktorium import Rank, Snapshot
+from ..songs import Song, Timeline
+from .rule import Rule
+from .timetable import Timetable
+
+Strokes = List[Tuple[int, float]]
+
+
+@dataclass
+class RuleSet:
+    """
+    Läuteordnung des Carillons, gelesen aus einer TOML-Datei. Sie besteht aus
+    den Glocken (`[bells]`), den Schlagfolgen für Viertelstunden und Stunden
+    (`[strokes]`, ggf. abweichend ab einem Mindestrang in `[strokes.RANG]`)
+    und einer geordneten Liste von Regeln (`[[rule]]`). Für jede
+    Viertelstunde gilt die erste passende Regel; passt keine, bleibt sie
+    stumm.
+
+    Attributes
+    ----------
+    strokes : Dict[Rank, Dict[str, List[Tuple[int, float]]]]
+        Schlagfolgen aus Note und anschließender Pause in Sekunden (`hour`
+        und `quarter`) je Mindestrang.
+    rules : List[Rule]
+        Regeln in der Reihenfolge der Datei.
+    songs : str
+        Verzeichnis, relativ zu dem Lieder angegeben werden.
+
+    Methods
+    -------
+    compile(snapshot) : Timetable
+        Erstellt den Fahrplan eines Tages.
+    strike(hours, quarters, rank) : Timeline
+        Erzeugt die Abfolge der Schläge für Stunden und Viertelstunden.
+    _song(file) : Tuple[Timeline, str]
+        Interne Methode, die ein Lied einliest.
+
+    Class methods
+    -------------
+    from_file(file, songs) : RuleSet
+        Liest die Läuteordnung aus einer Datei.
+    _parse(data, songs) : RuleSet
+        Interne Methode, die die Läuteordnung aus einer Tabelle erstellt.
+    """
+
+    strokes: Dict[Rank, Dict[str, Strokes]]
+    rules: List[Rule]
+    songs: str = '.'
+
+    def __post_init__(self) -> None:
+        """Legt den Zwischenspeicher für eingelesene Lieder an."""
+        self._songs = {}
+
+    @classmethod
+    def from_file(cls, file: str, songs: str = None) -> 'RuleSet':
+        """
+        Liest die Läuteordnung aus einer TOML-Datei. Alle darin genannten
+        Lieder werden dabei bereits eingelesen.
+
+        Parameters
+        ----------
+        file : str
+            Pfad zur Regeldatei.
+        songs : str (optional)
+            Verzeichnis der Lieder, standardmäßig das der Regeldatei.
+
+        Raises
+        ------
+        ValueError
+            Falls die Datei oder ein Wert ungültig ist oder ein Lied fehlt.
+        """
+        with open(file, 'rb') as f:
+            try:
+                data = tomllib.load(f)
+            except tomllib.TOMLDecodeError as e:
+                raise ValueError(f'{file} ist ungültig: {e}') from e
+        if songs is None: songs = os.path.dirname(os.path.abspath(file))
+        try:
+            return cls._parse(data, songs)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f'{file} ist ungültig: {e}') from e
+
+    @classmethod
+    def _parse(cls, data: dict, songs: str) -> 'RuleSet':
+        """
+        Interne Methode, die die Läuteordnung aus der gelesenen Tabelle
+        erstellt, die Typen ihrer Werte prüft und alle Lieder einliest.
+
+        Raises
+        ------
+        ValueError
+            Falls ein Wert ungültig ist oder ein Lied fehlt.
+        """
+        bells = data.get('bells', {})
+        Rule.check('bells', bells, dict)
+        for bell in bells.values(): Rule.check('bells', bell, int)
+
+        def parse(strokes: list) -> Strokes:
+            Rule.check('strokes', strokes, list)
+            for stroke in strokes:
+                Rule.check('strokes', stroke, list)
+                if len(stroke) != 2:
+                    raise ValueError(f'Ungültiger Schlag: {stroke!r}')
+                Rule.check('strokes', stroke[0], (str, int))
+                Rule.check('strokes', stroke[1], (int, float))
+            try:
+                return [(bells[bell] if isinstance(bell, str) else bell,
+                         float(pause)) for bell, pause in strokes]
+            except KeyError as e:
+                raise ValueError(f'Unbekannte Glocke: {e}') from e
+
+        table = data.get('strokes', {})
+        Rule.check('strokes', table, dict)
+        strokes = {Rank.NONE: {k: parse(table.get(k, []))
+                               for k in ('hour', 'quarter')}}
+        for name, variant in table.items():
+            if not isinstance(variant, dict): continue
+            if name not in Rank.__members__:
+                raise ValueError(f'Unbekannter Rang: {name}')
+            strokes[Rank[name]] = dict(strokes[Rank.NONE],
+                                       **{k: parse(v)
+                                          for k, v in variant.items()})
+
+        rules = data.get('rule', [])
+        Rule.check('rule', rules, list)
+        for rule in rules: Rule.check('rule', rule, dict)
+        rules = [Rule.parse(r) for r in rules]
+        ruleset = cls(strokes, rules, songs)
+        for rule in rules:
+            files = rule.song.values() if isinstance(rule.song, dict) \
+                else [rule.song]
+            for song in files:
+                if song is None: continue
+                try:
+                    ruleset._song(song)
+                except Exception as e:
+                    raise ValueError(f'Lied {song} nicht lesbar: {e}') from e
+        return ruleset
+
+    def compile(self, snapshot: Snapshot) -> Timetable:
+        """
+        Erstellt den Fahrplan für den Tag des übergebenen Stands des
+        Direktoriums. Bedingungen, die vom Tag abhängen, werden dabei nur
+        einmal je Regel geprüft.
+        """
+        rank = snapshot.events[0].rank if snapshot.events else Rank.NONE
+        rules = [r for r in self.rules if r.applies(snapshot)]
+
+        slots, strikes = [], {}
+        for slot in range(Timetable.SLOTS):
+            rule = next((r for r in rules
+                         if r.slots is None or slot in r.slots), None)
+            if rule is None or rule.silence:
+                slots.append(())
+                continue
+
+            actions = []
+            hours, quarters = divmod(slot, 4)
+            if rule.strike:
+                if quarters == 0:
+                    count = (rule.hours if rule.hours is not None
+                             else hours % 12 or 12,
+                             rule.quarters if rule.quarters is not None
+                             else 4)
+                else:
+                    count = (rule.hours or 0,
+                             rule.quarters if rule.quarters is not None
+                             else quarters)
+                if count not in strikes:
+                    strikes[count] = self.strike(*count, rank)
+                actions.append((strikes[count], 'Stundenschlag'))
+            song = rule.song_for(snapshot.season)
+            if song is not None: actions.append(self._song(song))
+            slots.append(tuple(actions))
+        return Timetable(snapshot.date, tuple(slots))
+
+    def strike(self, hours: int, quarters: int,
+               rank: Rank = Rank.NONE) -> Timeline:
+        """
+        Erzeugt die Abfolge der Schläge: zunächst die Viertelstunden, dann
+        die Stunden. Es gilt die Schlagfolge des höchsten Mindestrangs, den
+        der Tag erreicht.
+        """
+        strokes = self.strokes[max(r for r in self.strokes if r <= rank)]
+        times, notes, t = [], [], 0.0
+        for note, pause in strokes['quarter'] * quarters + \
+                strokes['hour'] * hours:
+            times.append(t)
+            notes.append(note)
+            t += pause
+        return Timeline(times, notes, t)
+
+    def _song(self, file: str) -> Tuple[Timeline, str]:
+        """
+        Interne Methode, die ein Lied (relativ zu `songs`) einliest und samt
+        Titel zwischenspeichert.
+        """
+        action = self._songs.get(file)
+        if action is None:
+            song = Song.from_file(os.path.join(self.songs, file))
+            action = self._songs[file] = (song.timeline, song.title)
+        return action
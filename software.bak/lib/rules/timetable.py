@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Tuple
+
+from ..songs import Timeline
+
+Action = Tuple[Timeline, str]
+
+
+@dataclass(frozen=True)
+class Timetable:
+    """
+    Fahrplan eines Tages: Für jede der 96 Viertelstunden die nacheinander
+    abzuspielenden Melodien samt Titel. Er wird einmal am Tag aus der
+    Läuteordnung erstellt und zum Plan des Tages (`DayPlan`) gerendert.
+
+    Constants
+    ---------
+    SLOTS : int
+        Anzahl der Viertelstunden eines Tages.
+
+    Attributes
+    ----------
+    date : date
+        Tag, für den der Fahrplan gilt.
+    slots : Tuple[Tuple[Tuple[Timeline, str], ...], ...]
+        Abzuspielende Melodien und Titel je Viertelstunde.
+    """
+
+    SLOTS = 96
+
+    date: date
+    slots: Tuple[Tuple[Action, ...], ...]
@@ -3,6 +3,9 @@ Bibliothek, die MIDI-Dateien für das Carillon leicht zugänglich kapselt.
 """
 
 from .library import Library
+from .manifest import Manifest
 from .song import Song
+from .timeline import Timeline
+from .watcher import Watcher
 
-__all__ = ['Library', 'Song', ]
+__all__ = ['Library', 'Manifest', 'Song', 'Timeline', 'Watcher', ]
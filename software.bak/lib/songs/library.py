@@ -1,44 +1,301 @@
+from concurrent.futures import ProcessPoolExecutor
 from glob import glob
 import os
-from typing import List
+import re
+from threading import RLock
+from typing import Callable, Dict, Iterator, List, Set, Tuple
+import unicodedata
+import warnings
 
+from .manifest import Manifest
 from .song import Song
 
 
 class Library:
     """
     Liest alle MIDI-Dateien als Songs ein und stellt diese zur Verfügung.
+    Die Metadaten werden in einem `Manifest` vorgehalten, sodass beim Start
+    nur geänderte Dateien eingelesen werden; alle übrigen MIDI-Dateien werden
+    erst beim ersten Abspielen geladen.
+
+    Jedes Lied erhält eine Nummer, die im Manifest abgelegt wird und damit
+    auch über Änderungen der Datei und Neustarts hinweg erhalten bleibt.
 
     Attribtues
     ----------
+    path : str
+        Verzeichnis der Bibliothek.
     songs : List[Song]
         Liste aller eingelesenen Songs.
+    manifest : Manifest
+        Verzeichnis der Metadaten aller Lieder.
+    errors : Dict[str, str]
+        Fehlermeldungen je relativem Pfad der Dateien, die sich nicht
+        einlesen ließen.
+    _ids : Dict[int, Song]
+        Lieder nach ihrer Nummer.
+    _keys : Dict[str, int]
+        Nummern der Lieder nach relativem Pfad.
+    _slots : Dict[int, int]
+        Nummern der Lieder nach Objektidentität.
+    _numbers : Dict[str, Dict[int, Song]]
+        Index der Lieder nach Gotteslobnummer.
+    _prefixes : Dict[str, Dict[int, Song]]
+        Index der Lieder nach allen Präfixen der normalisierten Titelwörter.
 
     Methods
     -------
+    add(song, song_id) : int
+        Nimmt ein Lied in die Bibliothek und ihre Indizes auf.
+    remove(song)
+        Entfernt ein Lied aus der Bibliothek und ihren Indizes.
+    get(song_id) : Song
+        Gibt ein Lied anhand seiner Nummer zurück.
+    items() : List[Tuple[int, Song]]
+        Gibt alle Lieder samt ihrer Nummern zurück.
+    reload(*keys)
+        Gleicht einzelne Dateien mit der Bibliothek ab.
+    sync(folder)
+        Gleicht ein (Unter-)Verzeichnis mit der Bibliothek ab.
     search_number(number) : Song
         Sucht ein Lied anhand der Gotteslobnummer.
     search_title(title) : List[Song]
         Gibt alle Lieder zurück, die `title` im Titel tragen.
+    _insert(key, stat, meta, song_id)
+        Interne Methode, die ein Lied unter stabiler Nummer aufnimmt.
+    _known(key) : int
+        Interne Methode, die die Nummer einer Datei im Manifest nachschlägt.
+    _forget(key)
+        Interne Methode, die das Lied einer gelöschten Datei entfernt.
+    _error(key, error)
+        Interne Methode, die eine nicht lesbare Datei meldet.
+    _save()
+        Interne Methode, die das Manifest speichert.
+
+    Static methods
+    --------------
+    normalize(text) : str
+        Normalisiert Text für die Suche.
+    _ingest(files, workers) : Iterator[Tuple[dict, str]]
+        Liest Dateien (auf Wunsch parallel) ein.
+    _prefixes_of(title) : Set[str]
+        Ermittelt alle Präfixe der Wörter eines Titels.
+    _discard(index, key, song)
+        Entfernt ein Lied aus einem Eintrag eines Index.
     """
 
-    def __init__(self, path: str):
+    def __init__(
+        self, path: str, manifest: str = None, workers: int = 1,
+        progress: Callable[[int, int], None] = None
+    ):
         """
         Erstellt die Bibliothek und liest alle Songs aus dem übergebenen
-        Verzeichnis ein.
+        Verzeichnis ein. Dateien, die nicht unverändert im Manifest
+        verzeichnet sind, werden (auf Wunsch parallel) eingelesen; Dateien,
+        die sich nicht einlesen lassen, werden mit einer Warnung übersprungen.
 
         Parameters
         ----------
         path : str
             Pfad des Verzeichnisses, das eingelesen werden soll.
+        manifest : str (optional)
+            Pfad zum Manifest, standardmäßig `.manifest.json` in `path`.
+        workers : int (optional)
+            Anzahl der Prozesse, die Dateien einlesen (`None` für einen pro
+            Prozessorkern).
+        progress : Callable[[int, int], None] (optional)
+            Wird nach jeder eingelesenen Datei mit der Anzahl der bereits
+            eingelesenen und aller einzulesenden Dateien aufgerufen.
+        """
+        if manifest is None: manifest = os.path.join(path, '.manifest.json')
+        self.path = path
+        self.manifest = Manifest(manifest)
+        self.songs = []
+        self.errors = {}
+        self._lock = RLock()
+        self._ids = {}
+        self._keys = {}
+        self._slots = {}
+        self._numbers = {}
+        self._prefixes = {}
+        self._next = 1 + max((e.get('id', 0)
+                              for e in self.manifest.entries.values()),
+                             default=0)
+
+        files = glob(os.path.join(path, '**', f'*.mid'), recursive=True)
+        keys = [os.path.relpath(f, path) for f in files]
+        stats = [os.stat(f) for f in files]
+        metas = [self.manifest.lookup(k, s) for k, s in zip(keys, stats)]
+
+        cold = [i for i, meta in enumerate(metas) if meta is None]
+        results = Library._ingest([files[i] for i in cold], workers)
+        for done, (i, (meta, error)) in enumerate(zip(cold, results), 1):
+            if error is None: metas[i] = meta
+            else: self._error(keys[i], error)
+            if progress is not None: progress(done, len(cold))
+
+        for key, stat, meta in zip(keys, stats, metas):
+            if meta is not None: self._insert(key, stat, meta,
+                                              self._known(key))
+
+        self.manifest.retain(k for k in keys if k not in self.errors)
+        self._save()
+
+    def add(self, song: Song, song_id: int = None) -> int:
+        """
+        Nimmt ein Lied in die Bibliothek und ihre Indizes auf.
+
+        Parameters
+        ----------
+        song : Song
+            Aufzunehmendes Lied.
+        song_id : int (optional)
+            Nummer des Liedes, andernfalls wird eine neue vergeben.
+
+        Returns
+        -------
+        Nummer, unter der das Lied abgerufen werden kann.
+        """
+        with self._lock:
+            if song_id is None: song_id = self._next
+            self._next = max(self._next, song_id + 1)
+            self._ids[song_id] = song
+            self._slots[id(song)] = song_id
+            self.songs.append(song)
+            if song.number is not None:
+                number = Library.normalize(song.number)
+                self._numbers.setdefault(number, {})[id(song)] = song
+            for prefix in Library._prefixes_of(song.title):
+                self._prefixes.setdefault(prefix, {})[id(song)] = song
+            return song_id
+
+    def remove(self, song: Song) -> None:
+        """Entfernt ein Lied aus der Bibliothek und ihren Indizes."""
+        with self._lock:
+            self._ids.pop(self._slots.pop(id(song), None), None)
+            self.songs = [s for s in self.songs if s is not song]
+            if song.number is not None:
+                Library._discard(self._numbers,
+                                 Library.normalize(song.number), song)
+            for prefix in Library._prefixes_of(song.title):
+                Library._discard(self._prefixes, prefix, song)
+
+    def get(self, song_id: int) -> Song:
+        """Gibt das Lied mit der angegebenen Nummer zurück (oder `None`)."""
+        return self._ids.get(song_id)
+
+    def items(self) -> List[Tuple[int, Song]]:
+        """Gibt alle Lieder samt ihrer Nummern zurück."""
+        with self._lock: return sorted(self._ids.items())
+
+    def reload(self, *keys: str) -> None:
+        """
+        Gleicht einzelne Dateien mit der Bibliothek ab: Neue Dateien werden
+        aufgenommen, geänderte neu eingelesen (unter gleicher Nummer) und
+        gelöschte entfernt. Unveränderte Dateien werden nicht eingelesen.
+
+        Parameters
+        ----------
+        keys : str
+            Pfade der Dateien relativ zum Verzeichnis der Bibliothek.
         """
-        path = os.path.join(path, '**', f'*.mid')
-        songs = glob(path, recursive=True)
-        self.songs = [Song.from_file(s) for s in songs]
+        with self._lock:
+            for key in keys:
+                file = os.path.join(self.path, key)
+                try:
+                    stat = os.stat(file)
+                except FileNotFoundError:
+                    stat = None
+                if stat is None:
+                    self._forget(key)
+                    continue
+                meta = self.manifest.lookup(key, stat)
+                if meta is not None and key in self._keys: continue
+                if meta is None: meta, error = _read(file)
+                if meta is None:
+                    self._forget(key)
+                    self._error(key, error)
+                    continue
+                self.errors.pop(key, None)
+                self._insert(key, stat, meta, self._known(key))
+            self._save()
+
+    def sync(self, folder: str = '') -> None:
+        """
+        Gleicht ein Unterverzeichnis (standardmäßig das ganze Verzeichnis)
+        mit der Bibliothek ab. Es werden nur die Änderungszeiten und Größen
+        geprüft, eingelesen werden nur neue und geänderte Dateien.
+
+        Parameters
+        ----------
+        folder : str (optional)
+            Unterverzeichnis relativ zum Verzeichnis der Bibliothek.
+        """
+        root = os.path.join(self.path, folder)
+        files = glob(os.path.join(root, '**', f'*.mid'), recursive=True)
+        keys = {os.path.relpath(f, self.path) for f in files}
+        prefix = os.path.join(os.path.normpath(folder), '') \
+            if folder else ''
+        with self._lock:
+            keys.update(k for k in self._keys if k.startswith(prefix))
+            self.reload(*sorted(keys))
+
+    def _insert(self, key: str, stat: os.stat_result, meta: dict,
+                song_id: int = None) -> None:
+        """
+        Interne Methode, die ein Lied aus seinen Metadaten erstellt und unter
+        der bisherigen (oder im Manifest verzeichneten) Nummer aufnimmt.
+        Frisch eingelesene Metadaten tragen keine Nummer; für sie gilt
+        `song_id`, die Nummer des veralteten Manifesteintrags.
+        """
+        song_id = self._keys.get(key, meta.get('id', song_id))
+        if song_id in self._ids and self._keys.get(key) != song_id:
+            song_id = None
+        old = self._ids.get(song_id)
+        if old is not None: self.remove(old)
+
+        file = os.path.join(self.path, key)
+        song = Song.from_file(file, meta['number'], meta['title'], meta)
+        song_id = self.add(song, song_id)
+        self._keys[key] = song_id
+        if meta.get('id') != song_id:
+            self.manifest.store(key, stat, dict(meta, id=song_id))
+
+    def _known(self, key: str) -> int:
+        """
+        Interne Methode, die die im Manifest verzeichnete Nummer einer Datei
+        zurückgibt, auch wenn der Eintrag veraltet ist (oder `None`).
+        """
+        return self.manifest.entries.get(key, {}).get('id')
+
+    def _forget(self, key: str) -> None:
+        """
+        Interne Methode, die das Lied einer gelöschten Datei entfernt.
+        """
+        song_id = self._keys.pop(key, None)
+        if song_id in self._ids: self.remove(self._ids[song_id])
+        self.errors.pop(key, None)
+        self.manifest.discard(key)
+
+    def _error(self, key: str, error: str) -> None:
+        """
+        Interne Methode, die eine nicht lesbare Datei meldet.
+        """
+        warnings.warn(f'{key} nicht lesbar: {error}')
+        self.errors[key] = error
+
+    def _save(self) -> None:
+        """Interne Methode, die das Manifest speichert."""
+        try:
+            self.manifest.save()
+        except OSError as e:
+            warnings.warn(f'Manifest {self.manifest.file} nicht '
+                          f'speicherbar: {e}')
 
     def search_number(self, number: str) -> Song:
         """
-        Ermittelt das Lied mit der übergebenen Gotteslobnummer.
+        Ermittelt das Lied mit der übergebenen Gotteslobnummer über einen
+        Index (auch Unternummern wie `666,3`).
 
         Parameters
         ----------
@@ -47,28 +304,100 @@ class Library:
 
         Returns
         -------
-        Lied, das die gegebene Gotteslobnummer trägt.
+        Lied, das die gegebene Gotteslobnummer trägt (oder `None`).
         """
-        for s in Library.songs():
-            if str(number) == s.number: return s
+        with self._lock:
+            songs = self._numbers.get(Library.normalize(str(number)))
+            return next(iter(songs.values())) if songs else None
 
     def search_title(self, title: str) -> List[Song]:
         """
-        Ermittelt alle Lieder, die den übergebenen String als Bestandteil im
-        Titel tragen.
+        Ermittelt alle Lieder, in deren Titel jedes Wort der Suche als Anfang
+        eines Wortes vorkommt (etwa findet `"gross gott"` das Lied
+        "Großer Gott, wir loben dich").
 
         Parameters
         ----------
         title : str
-            Zu suchender Titelbestandteil. Um die Suche zu erleichtern, wird
-            Groß- und Kleinschreibung nicht berücksichtigt.
+            Zu suchende Titelbestandteile. Um die Suche zu erleichtern, werden
+            Groß- und Kleinschreibung sowie Umlaute nicht berücksichtigt.
 
         Returns
         -------
-        Liste aller Songs, die den gegebenen Bestandteil im Titel tragen.
+        Liste aller Songs, die die gegebenen Bestandteile im Titel tragen,
+        geordnet nach ihren Nummern in der Bibliothek.
         """
-        title = title.lower()
-        found = []
-        for s in Library.songs():
-            if title in s.title.lower(): found.append(s)
-        return found
+        words = re.findall(r'\w+', Library.normalize(title))
+        with self._lock:
+            if not words: return [s for _, s in sorted(self._ids.items())]
+            found = [self._prefixes.get(w, {}) for w in words]
+            found.sort(key=len)
+            common = set(found[0]).intersection(*found[1:])
+            return [found[0][k] for k in sorted(common,
+                                                key=self._slots.get)]
+
+    @staticmethod
+    def _ingest(
+        files: List[str], workers: int = 1
+    ) -> Iterator[Tuple[dict, str]]:
+        """
+        Interne Methode, die Dateien einliest und ihre Metadaten ermittelt.
+        Bei mehreren Prozessen werden die Dateien in Blöcken auf einen
+        Prozesspool verteilt, der nur die kompakten Metadaten zurückgibt.
+
+        Returns
+        -------
+        Je Datei (in gleicher Reihenfolge) die Metadaten und `None` oder
+        `None` und die Fehlermeldung.
+        """
+        if workers is None: workers = os.cpu_count() or 1
+        if workers <= 1 or len(files) < 2:
+            yield from map(_read, files)
+            return
+        chunksize = max(1, min(32, len(files) // (4 * workers)))
+        with ProcessPoolExecutor(workers) as pool:
+            yield from pool.map(_read, files, chunksize=chunksize)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalisiert Text für die Suche: Groß- und Kleinschreibung, Akzente
+        und Umlaute (auch in der Umschreibung `ae`, `oe`, `ue`) werden
+        vereinheitlicht, Punkte in Gotteslobnummern durch Kommata ersetzt.
+        """
+        text = unicodedata.normalize('NFKD', text.casefold())
+        text = ''.join(c for c in text if not unicodedata.combining(c))
+        for umlaut in ('ae', 'oe', 'ue'):
+            text = text.replace(umlaut, umlaut[0])
+        return text.replace('.', ',')
+
+    @staticmethod
+    def _prefixes_of(title: str) -> Set[str]:
+        """
+        Interne Methode, die alle Präfixe der normalisierten Wörter eines
+        Titels ermittelt.
+        """
+        words = set(re.findall(r'\w+', Library.normalize(title)))
+        return {w[:i] for w in words for i in range(1, len(w) + 1)}
+
+    @staticmethod
+    def _discard(index: Dict[str, Dict[int, Song]], key: str,
+                 song: Song) -> None:
+        """
+        Interne Methode, die ein Lied aus einem Eintrag eines Index entfernt.
+        """
+        songs = index.get(key)
+        if songs is None: return
+        songs.pop(id(song), None)
+        if not songs: del index[key]
+
+
+def _read(file: str) -> Tuple[dict, str]:
+    """
+    Liest eine Datei ein und gibt ihre Metadaten zurück. Als Funktion auf
+    Modulebene, damit sie in einem Prozesspool aufgerufen werden kann.
+    """
+    try:
+        return Song.from_file(file).meta, None
+    except Exception as e:
+        return None, f'{type(e).__name__}: {e}'
@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+from threading import Lock
+
+
+class Manifest:
+    """
+    Auf der Festplatte abgelegtes Verzeichnis der Metadaten aller Lieder einer
+    Bibliothek (Titel, Gotteslobnummer, Tempo, Dauer und Tonumfang). Einträge
+    sind über den relativen Pfad, die Änderungszeit und die Größe der Datei
+    verschlüsselt, sodass geänderte Dateien erkannt und neu eingelesen werden.
+
+    Attributes
+    ----------
+    file : str
+        Pfad zur JSON-Datei des Manifests.
+    entries : Dict[str, dict]
+        Metadaten je relativem Pfad, ergänzt um `mtime` und `size`.
+    dirty : bool
+        Gibt an, ob seit dem letzten Speichern Änderungen erfolgt sind.
+
+    Methods
+    -------
+    lookup(key, stat) : dict
+        Gibt die Metadaten einer unveränderten Datei zurück.
+    store(key, stat, meta)
+        Legt die Metadaten einer Datei ab.
+    discard(key)
+        Entfernt den Eintrag einer Datei.
+    retain(keys)
+        Entfernt Einträge aller nicht mehr vorhandenen Dateien.
+    save()
+        Schreibt das Manifest atomar, sofern es geändert wurde.
+    """
+
+    def __init__(self, file: str):
+        """
+        Liest das Manifest ein; fehlt die Datei oder ist sie beschädigt, wird
+        mit einem leeren Manifest begonnen.
+
+        Parameters
+        ----------
+        file : str
+            Pfad zur JSON-Datei des Manifests.
+        """
+        self.file = file
+        self.dirty = False
+        self._lock = Lock()
+        try:
+            with open(file) as f: self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def lookup(self, key: str, stat: os.stat_result) -> dict:
+        """
+        Gibt die Metadaten zu `key` zurück, sofern Änderungszeit und Größe
+        der Datei noch übereinstimmen, ansonsten `None`.
+        """
+        entry = self.entries.get(key)
+        if entry is None: return None
+        if entry['mtime'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            return None
+        return entry
+
+    def store(self, key: str, stat: os.stat_result, meta: dict) -> None:
+        """Legt die Metadaten einer Datei samt Änderungszeit und Größe ab."""
+        with self._lock:
+            self.entries[key] = dict(meta, mtime=stat.st_mtime_ns,
+                                     size=stat.st_size)
+            self.dirty = True
+
+    def discard(self, key: str) -> None:
+        """Entfernt den Eintrag einer Datei, sofern er existiert."""
+        with self._lock:
+            if self.entries.pop(key, None) is not None: self.dirty = True
+
+    def retain(self, keys) -> None:
+        """Entfernt alle Einträge, deren Schlüssel nicht in `keys` liegt."""
+        with self._lock:
+            stale = self.entries.keys() - set(keys)
+            for key in stale: del self.entries[key]
+            if stale: self.dirty = True
+
+    def save(self) -> None:
+        """
+        Schreibt das Manifest, sofern es geändert wurde. Es wird zunächst
+        unter einem temporären Namen geschrieben und dann ersetzt, sodass nie
+        eine halb geschriebene Datei gelesen wird.
+        """
+        with self._lock:
+            if not self.dirty: return
+            folder = os.path.dirname(os.path.abspath(self.file))
+            fd, tmp = tempfile.mkstemp(dir=folder, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f: json.dump(self.entries, f)
+                os.replace(tmp, self.file)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            self.dirty = False
@@ -5,6 +5,8 @@ import os
 import re
 from typing import List
 
+from .timeline import Timeline
+
 
 @dataclass
 class Song:
@@ -21,11 +23,30 @@ class Song:
         Wiedergabetempo.
     transpose : int
         Anzahl der Halbtöne, um die transponiert werden soll.
+    path : str
+        Pfad zur MIDI-Datei.
+    duration : float
+        Dauer des Liedes in Sekunden (im Originaltempo).
+    lowest : int
+        Tiefste Note des Liedes (ohne Transponierung).
+    highest : int
+        Höchste Note des Liedes (ohne Transponierung).
     file : mido.MidiFile
-        Eingelesene Datei.
+        Eingelesene Datei. Sie wird erst beim ersten Zugriff (in der Regel
+        beim ersten Abspielen) eingelesen.
+    meta : dict
+        Metadaten des Liedes, wie sie im `Manifest` abgelegt werden.
     messages : List[mido.Message]
         Liste an Nachrichten, die in der Datei enthalten sind (passend
         transponiert und mit richtigem Tempo ausgestattet).
+    timeline : Timeline
+        Kompilierte Abfolge der Anschläge, die nur bei Änderung von `tempo`
+        oder `transpose` neu erstellt wird.
+
+    Methods
+    -------
+    _load()
+        Interne Methode, die die MIDI-Datei einliest.
 
     Class methods
     -------------
@@ -42,25 +63,52 @@ class Song:
     filepath: InitVar[str]
     title: str
     number: str = None
-    tempo: int = field(init=False)
+    cached: InitVar[dict] = None
+    tempo: int = field(default=None, init=False)
     transpose: int = field(default=0, init=False)
-    file: mido.MidiFile = field(init=False)
+    path: str = field(default=None, init=False, repr=False)
+    duration: float = field(default=None, init=False, repr=False)
+    lowest: int = field(default=None, init=False, repr=False)
+    highest: int = field(default=None, init=False, repr=False)
+    _file: mido.MidiFile = field(default=None, init=False, repr=False,
+                                 compare=False)
+    _compiled: tuple = field(default=None, init=False, repr=False,
+                             compare=False)
 
-    def __post_init__(self, filepath: str) -> None:
+    def __post_init__(self, filepath: str, cached: dict) -> None:
         """
-        Schließt die Initialisierung der Datei ab, indem die MIDI-Datei in das
-        `file`-Objekt eingelesen wird.
+        Schließt die Initialisierung ab. Liegen Metadaten (etwa aus dem
+        `Manifest`) vor, werden diese übernommen und die MIDI-Datei erst beim
+        ersten Zugriff eingelesen, ansonsten sofort.
 
         Parameters
         ----------
         filepath : str
             Pfad zur MIDI-Datei, der dem Konstruktor mit übergeben wurde.
+        cached : dict (optional)
+            Metadaten mit `tempo`, `duration`, `lowest` und `highest`.
         """
-        self.file = mido.MidiFile(filepath)
-        for msg in self.file.tracks[0]:
-            if msg.type != 'set_tempo': continue
-            self.tempo = msg.tempo
-            break
+        self.path = filepath
+        if cached is None:
+            self._load()
+            return
+        self.tempo = cached['tempo']
+        self.duration = cached['duration']
+        self.lowest = cached['lowest']
+        self.highest = cached['highest']
+
+    @property
+    def file(self) -> mido.MidiFile:
+        """Eingelesene MIDI-Datei, die beim ersten Zugriff geladen wird."""
+        if self._file is None: self._load()
+        return self._file
+
+    @property
+    def meta(self) -> dict:
+        """Metadaten des Liedes, wie sie im `Manifest` abgelegt werden."""
+        return dict(title=self.title, number=self.number, tempo=self.tempo,
+                    duration=self.duration, lowest=self.lowest,
+                    highest=self.highest)
 
     @property
     def messages(self) -> List[mido.Message]:
@@ -76,9 +124,43 @@ class Song:
             messages.append(msg.copy(time=time, note=note))
         return messages
 
+    @property
+    def timeline(self) -> Timeline:
+        """
+        Kompilierte Abfolge der Anschläge mit Tempo und Transponierung. Sie
+        wird zwischengespeichert und nur bei geändertem `tempo` oder
+        `transpose` neu berechnet.
+        """
+        key = (self.tempo, self.transpose)
+        if self._compiled is None or self._compiled[0] != key:
+            timeline = Timeline.from_track(self.file.tracks[0],
+                                           self.file.ticks_per_beat, *key)
+            self._compiled = (key, timeline)
+        return self._compiled[1]
+
+    def _load(self) -> None:
+        """
+        Interne Methode, die die MIDI-Datei einliest und fehlende Metadaten
+        daraus ermittelt.
+        """
+        file = mido.MidiFile(self.path)
+        track = file.tracks[0]
+        if self.tempo is None:
+            self.tempo = next((msg.tempo for msg in track
+                               if msg.type == 'set_tempo'), 500000)
+        if self.duration is None:
+            timeline = Timeline.from_track(track, file.ticks_per_beat,
+                                           self.tempo, 0)
+            notes = timeline.notes
+            self.duration = timeline.duration
+            self.lowest = min(notes) if len(notes) else None
+            self.highest = max(notes) if len(notes) else None
+        self._file = file
+
     @classmethod
     def from_file(
-        cls, filepath: str, number: str = None, title: str = None
+        cls, filepath: str, number: str = None, title: str = None,
+        meta: dict = None
     ) -> 'Song':
         """
         Versucht, ein Song-Objekt aus einer Datei zu erstellen.
@@ -92,6 +174,8 @@ class Song:
             gelesen.
         title : str (optional)
             Titel, falls nicht angegeben, wird er aus dem Dateinamen gelesen.
+        meta : dict (optional)
+            Bekannte Metadaten; die Datei wird dann erst bei Bedarf gelesen.
 
         Returns
         -------
@@ -113,7 +197,8 @@ class Song:
         elif name.startswith(f'{number} '): name = name[len(number) + 1:]
 
         if title is None: title = name
-        return Song(title=title, filepath=filepath, number=number)
+        return Song(title=title, filepath=filepath, number=number,
+                    cached=meta)
 
     @classmethod
     def from_number(
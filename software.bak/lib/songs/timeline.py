@@ -0,0 +1,155 @@
+from array import array
+import mido
+from typing import Iterable, Iterator, List, Tuple
+
+
+class Timeline:
+    """
+    Unveränderliche, kompakte Abfolge der Anschläge einer Melodie. Zu jedem
+    Anschlag werden der absolute Zeitpunkt (Sekunden seit Beginn) und die
+    MIDI-Note in Arrays gehalten, sodass beim Abspielen keine
+    `mido.Message`-Objekte mehr erzeugt werden müssen.
+
+    Attributes
+    ----------
+    times : memoryview
+        Absolute, aufsteigende Anschlagzeitpunkte in Sekunden (nur lesbar).
+    notes : memoryview
+        MIDI-Notenwerte der Anschläge (nur lesbar).
+    duration : float
+        Gesamtdauer der Melodie in Sekunden (inklusive abschließender Pausen).
+
+    Methods
+    -------
+    messages() : List[mido.Message]
+        Erzeugt wieder relative MIDI-Nachrichten aus der Abfolge.
+
+    Class methods
+    -------------
+    from_track(track, ticks_per_beat, tempo, transpose) : Timeline
+        Kompiliert eine MIDI-Spur.
+    from_messages(messages) : Timeline
+        Kompiliert eine Liste relativer MIDI-Nachrichten.
+    coerce(melody) : Timeline
+        Nimmt eine Timeline oder eine Liste von MIDI-Nachrichten entgegen.
+    """
+
+    __slots__ = ('_times', '_notes', '_duration')
+
+    def __init__(self, times: Iterable[float], notes: Iterable[int],
+                 duration: float = None):
+        """
+        Erstellt die Abfolge aus absoluten Zeitpunkten und Noten.
+
+        Parameters
+        ----------
+        times : Iterable[float]
+            Absolute Anschlagzeitpunkte in Sekunden.
+        notes : Iterable[int]
+            MIDI-Notenwerte, passend zu `times`.
+        duration : float (optional)
+            Gesamtdauer, andernfalls der Zeitpunkt des letzten Anschlags.
+
+        Raises
+        ------
+        ValueError
+            Falls Zeitpunkte und Noten nicht gleich lang sind.
+        """
+        self._times = array('d', times)
+        self._notes = array('h', notes)
+        if len(self._times) != len(self._notes):
+            raise ValueError('Zeitpunkte und Noten müssen gleich lang sein!')
+        last = self._times[-1] if self._times else 0.0
+        self._duration = last if duration is None else max(duration, last)
+
+    @property
+    def times(self) -> memoryview:
+        """Absolute Anschlagzeitpunkte in Sekunden."""
+        return memoryview(self._times).toreadonly()
+
+    @property
+    def notes(self) -> memoryview:
+        """MIDI-Notenwerte der Anschläge."""
+        return memoryview(self._notes).toreadonly()
+
+    @property
+    def duration(self) -> float:
+        """Gesamtdauer der Melodie in Sekunden."""
+        return self._duration
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def __iter__(self) -> Iterator[Tuple[float, int]]:
+        return zip(self._times, self._notes)
+
+    def __repr__(self) -> str:
+        return f'Timeline({len(self)} Anschläge, {self._duration:.3f} s)'
+
+    def messages(self) -> List[mido.Message]:
+        """
+        Erzeugt aus der Abfolge wieder MIDI-Nachrichten mit relativen Zeiten.
+        """
+        messages, last = [], 0.0
+        for t, note in self:
+            messages.append(mido.Message('note_on', note=note, time=t - last))
+            last = t
+        return messages
+
+    @classmethod
+    def from_track(
+        cls, track: mido.MidiTrack, ticks_per_beat: int, tempo: int,
+        transpose: int = 0
+    ) -> 'Timeline':
+        """
+        Kompiliert eine MIDI-Spur. Die Zeitpunkte werden aus den aufsummierten
+        Ticks berechnet, sodass sich keine Rundungsfehler aufaddieren.
+
+        Parameters
+        ----------
+        track : mido.MidiTrack
+            Einzulesende Spur.
+        ticks_per_beat : int
+            Auflösung der MIDI-Datei.
+        tempo : int
+            Wiedergabetempo in Mikrosekunden pro Schlag.
+        transpose : int (optional)
+            Anzahl der Halbtöne, um die transponiert werden soll.
+
+        Returns
+        -------
+        Die kompilierte Abfolge der Anschläge.
+        """
+        scale = tempo * 1e-6 / ticks_per_beat
+        times, notes = array('d'), array('h')
+        ticks = 0
+        for msg in track:
+            ticks += msg.time
+            if msg.type != 'note_on' or msg.velocity == 0: continue
+            times.append(ticks * scale)
+            notes.append(msg.note + transpose)
+        return cls(times, notes, ticks * scale)
+
+    @classmethod
+    def from_messages(cls, messages: Iterable[mido.Message]) -> 'Timeline':
+        """
+        Kompiliert eine Liste von MIDI-Nachrichten mit relativen Zeiten in
+        Sekunden (wie sie `Song.messages` liefert).
+        """
+        times, notes = array('d'), array('h')
+        t = 0.0
+        for msg in messages:
+            t += msg.time
+            if msg.type != 'note_on' or msg.velocity == 0: continue
+            times.append(t)
+            notes.append(msg.note)
+        return cls(times, notes, t)
+
+    @classmethod
+    def coerce(cls, melody) -> 'Timeline':
+        """
+        Gibt `melody` unverändert zurück, falls es bereits eine Timeline ist,
+        und kompiliert ansonsten die übergebenen MIDI-Nachrichten.
+        """
+        if isinstance(melody, cls): return melody
+        return cls.from_messages(melody)
@@ -0,0 +1,197 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+from threading import Event, Thread
+from typing import Dict
+import warnings
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_EVENT = struct.Struct('iIII')
+
+
+class Watcher:
+    """
+    Überwacht das Verzeichnis einer Bibliothek und überträgt neue, geänderte
+    und gelöschte MIDI-Dateien im laufenden Betrieb in die Bibliothek und ihre
+    Indizes. Unter Linux werden dazu Ereignisse von inotify genutzt, sodass
+    nur die betroffenen Dateien geprüft werden; andernfalls wird das
+    Verzeichnis regelmäßig anhand von Änderungszeiten und Größen abgeglichen.
+
+    Constants
+    ---------
+    INTERVAL : float
+        Abstand der Abgleiche in Sekunden, falls inotify nicht verfügbar ist.
+    MASK : int
+        Ereignisse, auf die inotify achtet.
+
+    Attributes
+    ----------
+    library : Library
+        Überwachte Bibliothek.
+    interval : float
+        Abstand der Abgleiche in Sekunden im Rückfallbetrieb.
+    inotify : bool
+        Gibt an, ob inotify genutzt wird.
+
+    Methods
+    -------
+    stop()
+        Beendet die Überwachung.
+    _run_inotify(fd, watches)
+        Interne Methode des Überwachungsthreads mit inotify.
+    _run_polling()
+        Interne Methode des Überwachungsthreads ohne inotify.
+    _watch(fd, folder, watches)
+        Interne Methode, die ein Verzeichnis samt Unterverzeichnissen
+        beobachtet.
+
+    Static methods
+    --------------
+    _inotify() : int
+        Öffnet eine inotify-Instanz.
+    """
+
+    INTERVAL = 5.0
+    MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+            | IN_DELETE | IN_DELETE_SELF)
+
+    _libc = None
+
+    def __init__(
+        self, library: 'Library', interval: float = INTERVAL,
+        inotify: bool = True
+    ):
+        """
+        Erstellt die Überwachung und startet ihren Thread. Die Verzeichnisse
+        werden bereits hier beobachtet und die Bibliothek einmal abgeglichen,
+        sodass keine Änderung seit dem Einlesen verloren geht.
+
+        Parameters
+        ----------
+        library : Library
+            Bibliothek, deren Verzeichnis überwacht werden soll.
+        interval : float (optional)
+            Abstand der Abgleiche in Sekunden, falls inotify nicht genutzt
+            wird.
+        inotify : bool (optional)
+            Gibt an, ob inotify genutzt werden soll, sofern verfügbar.
+        """
+        self.library = library
+        self.interval = interval
+        self._stop = Event()
+        fd = Watcher._inotify() if inotify else None
+        self.inotify = fd is not None
+        if fd is None: target, args = self._run_polling, ()
+        else:
+            watches = {}
+            self._watch(fd, '', watches)
+            target, args = self._run_inotify, (fd, watches)
+        try:
+            library.sync()
+        except Exception as e:
+            warnings.warn(f'Bibliothek nicht abgeglichen: {e}')
+        Thread(target=target, args=args, daemon=True).start()
+
+    def stop(self) -> None:
+        """Beendet die Überwachung."""
+        self._stop.set()
+
+    @staticmethod
+    def _inotify() -> int:
+        """
+        Interne Methode, die eine inotify-Instanz öffnet und ihren
+        Dateideskriptor zurückgibt (oder `None`, falls nicht verfügbar).
+        """
+        try:
+            if Watcher._libc is None:
+                Watcher._libc = ctypes.CDLL(ctypes.util.find_library('c'),
+                                            use_errno=True)
+            fd = Watcher._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        return fd if fd >= 0 else None
+
+    def _watch(self, fd: int, folder: str, watches: Dict[int, str]) -> None:
+        """
+        Interne Methode, die ein Verzeichnis (relativ zur Bibliothek) samt
+        aller Unterverzeichnisse beobachtet.
+        """
+        root = os.path.join(self.library.path, folder)
+        for path, _, _ in os.walk(root):
+            wd = Watcher._libc.inotify_add_watch(fd, os.fsencode(path),
+                                                 Watcher.MASK)
+            if wd < 0:
+                warnings.warn(f'{path} nicht überwachbar: '
+                              f'{os.strerror(ctypes.get_errno())}')
+                continue
+            watches[wd] = os.path.normpath(
+                os.path.relpath(path, self.library.path))
+
+    def _run_inotify(self, fd: int, watches: Dict[int, str]) -> None:
+        """
+        Interne Methode des Überwachungsthreads, die die Ereignisse von
+        inotify für die beobachteten Verzeichnisse `watches` auswertet und nur
+        die betroffenen Dateien bzw. Verzeichnisse abgleicht. Geht ein
+        Ereignis verloren, wird das ganze Verzeichnis abgeglichen.
+        """
+        try:
+            while not self._stop.is_set():
+                if not select.select([fd], [], [], 1.0)[0]: continue
+                try:
+                    data = os.read(fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+
+                keys, folders, overflow = [], [], False
+                offset = 0
+                while offset < len(data):
+                    wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                    name = data[offset + _EVENT.size:
+                                offset + _EVENT.size + length]
+                    offset += _EVENT.size + length
+                    name = os.fsdecode(name.rstrip(b'\0'))
+
+                    if mask & IN_Q_OVERFLOW: overflow = True
+                    if mask & IN_IGNORED:
+                        watches.pop(wd, None)
+                        continue
+                    folder = watches.get(wd)
+                    if folder is None or not name: continue
+                    path = os.path.normpath(os.path.join(folder, name))
+                    if mask & IN_ISDIR:
+                        if mask & (IN_CREATE | IN_MOVED_TO):
+                            self._watch(fd, path, watches)
+                        folders.append(path)
+                    elif name.endswith('.mid') and not mask & IN_CREATE:
+                        keys.append(path)
+
+                try:
+                    if overflow: self.library.sync()
+                    if keys: self.library.reload(*dict.fromkeys(keys))
+                    for f in dict.fromkeys(folders): self.library.sync(f)
+                except Exception as e:
+                    warnings.warn(f'Bibliothek nicht abgeglichen: {e}')
+        finally:
+            os.close(fd)
+
+    def _run_polling(self) -> None:
+        """
+        Interne Methode des Überwachungsthreads, die das Verzeichnis
+        regelmäßig abgleicht.
+        """
+        while not self._stop.wait(self.interval):
+            try:
+                self.library.sync()
+            except Exception as e:
+                warnings.warn(f'Bibliothek nicht abgeglichen: {e}')
@@ -1,16 +1,16 @@
 #!/usr/bin/env python
 import time
 
-from lib.carillon import Carillon
+from lib.carillon import Arbiter, Carillon
 from lib.direktorium import TodayDirektorium
 
 from customstriker import CustomStriker
 
 if __name__ == '__main__':
-    carillon = Carillon()
+    arbiter = Arbiter(Carillon())
     direktorium = TodayDirektorium()
 
-    striker = CustomStriker(carillon, direktorium)
+    striker = CustomStriker(arbiter, direktorium)
 
     while True:
         time.sleep(1)
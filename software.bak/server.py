@@ -1,34 +1,90 @@
-from flask import Flask
+from datetime import time
+from flask import abort, Flask, request, send_file
+import io
 
-from lib.carillon import Carillon
+from lib.carillon import Arbiter, Carillon
 from lib.direktorium import TodayDirektorium
-from lib.songs import Library
+from lib.metrics import Registry
+from lib.songs import Library, Watcher
 
 from customstriker import CustomStriker
 
 app = Flask(__name__)
 lib = Library('../songs')
+watcher = Watcher(lib)
 
-carillon = Carillon()
+arbiter = Arbiter(Carillon())
 direktorium = TodayDirektorium()
-striker = CustomStriker(carillon, direktorium)
+striker = CustomStriker(arbiter, direktorium)
 
 @app.route('/')
 def hello():
     return dict(hello='world!')
 
+@app.route('/metrics')
+def metrics():
+    return Registry.default().expose(), 200, {
+        'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
+@app.route('/plan')
+def plan_index():
+    try:
+        start, end = (request.args.get(k) for k in ('from', 'until'))
+        start = time.fromisoformat(start) if start else None
+        end = time.fromisoformat(end) if end else None
+    except ValueError:
+        abort(400)
+    plan = striker.plan()
+    entries = [dict(time=t.time().isoformat(), title=title,
+                    duration=round(duration, 3))
+               for t, title, duration in plan.between(start, end)]
+    return dict(date=plan.date.isoformat(), entries=entries)
+
+@app.route('/plan/midi')
+def plan_midi():
+    plan = striker.plan()
+    f = io.BytesIO()
+    plan.to_midi().save(file=f)
+    f.seek(0)
+    return send_file(f, mimetype='audio/midi',
+                     download_name=f'{plan.date.isoformat()}.mid')
+
 @app.route('/songs')
 def songs_index():
-    songs = [dict(id=i, number=s.number, title=s.title) for i, s in enumerate(lib.songs)]
+    songs = [dict(id=i, number=s.number, title=s.title) for i, s in lib.items()]
     return dict(songs=songs)
 
 @app.route('/songs/<int:song_id>')
 def songs_show(song_id):
-    s = lib.songs[song_id]
+    s = lib.get(song_id)
+    if s is None: abort(404)
     return dict(id=song_id, number=s.number, title=s.title)
 
 @app.route('/songs/<int:song_id>/play')
 def songs_play(song_id):
-    s = lib.songs[song_id]
-    striker.play(s.messages)
-    return songs_show(song_id)
+    s = lib.get(song_id)
+    if s is None: abort(404)
+    job = arbiter.submit(s.timeline, s.title)
+    return dict(songs_show(song_id), job=job.to_dict())
+
+@app.route('/jobs')
+def jobs_index():
+    return dict(jobs=[j.to_dict() for j in arbiter.jobs()])
+
+@app.route('/jobs/<int:job_id>')
+def jobs_show(job_id):
+    job = arbiter.get(job_id)
+    if job is None: abort(404)
+    return job.to_dict()
+
+@app.route('/jobs/<int:job_id>/cancel')
+def jobs_cancel(job_id):
+    jobs_show(job_id)
+    if not arbiter.cancel(job_id): abort(409)
+    return jobs_show(job_id)
+
+@app.route('/jobs/<int:job_id>/move/<int:index>')
+def jobs_move(job_id, index):
+    jobs_show(job_id)
+    if not arbiter.move(job_id, index): abort(409)
+    return jobs_index()
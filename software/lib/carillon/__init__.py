@@ -3,9 +3,22 @@ Bibliothek, die das Carillon als MIDI-Instrument und den Uhrmechanismus
 zusammenfasst.
 """
 
+from .audiocarillon import AudioCarillon
 from .carillon import Carillon
 from .carillonstriker import CarillonStriker
+from .devicesink import DeviceSink
+from .filesink import FileSink
+from .harness import Harness
+from .recordingport import RecordingPort
+from .renderer import Renderer
+from .samplebank import SampleBank
+from .sink import Sink
 from .song import Song
 from .striker import Striker
+from .timeline import Timeline
+from .timer import Timer
+from .timingreport import TimingReport
 
-__all__ = ['Carillon', 'CarillonStriker', 'Song', 'Striker', ]
+__all__ = ['AudioCarillon', 'Carillon', 'CarillonStriker', 'DeviceSink',
+           'FileSink', 'Harness', 'RecordingPort', 'Renderer', 'SampleBank',
+           'Sink', 'Song', 'Striker', 'Timeline', 'Timer', 'TimingReport', ]
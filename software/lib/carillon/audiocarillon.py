@@ -0,0 +1,130 @@
+import array
+from collections import deque
+import mido.ports
+import time
+from typing import Iterable
+import numpy as np
+import warnings
+
+from .carillon import Carillon
+from .renderer import Renderer
+from .sink import Sink
+
+
+class AudioCarillon(Carillon):
+    """
+    Carillon, das die Glockensamples ohne GrandOrgue direkt ausgibt. Ein
+    Anschlag legt für jede Glocke nur eine Stimme mit Lesezeiger an; der
+    Callback einer Audioausgabe (`Sink`) mischt davon blockweise jeweils den
+    nächsten Abschnitt. `hit()`, `chord()` und `play()` verhalten sich wie
+    beim MIDI-Carillon.
+
+    Ein Anschlag erklingt ab dem nächsten Block, den der Callback erzeugt.
+    Die Verzögerung vom Anschlag bis zum Klang ist damit durch einen Block
+    Wartezeit und einen Block für die Verspätung des Callbacks zuzüglich der
+    Latenz der Ausgabe beschränkt. Die gestimmten Samples werden bereits beim
+    Erstellen berechnet, damit kein Anschlag auf die Interpolation wartet,
+    und der Callback mischt über einen vorab angelegten Zwischenpuffer, ohne
+    Speicher anzufordern.
+
+    Attributes
+    ----------
+    port : mido.ports.BaseOutput
+        Port ohne Ausgabe; Anschläge gehen an die Audioausgabe.
+    sink : Sink
+        Audioausgabe, deren Callback die Stimmen mischt.
+    renderer : Renderer
+        Quelle der (gestimmten) Glockensamples.
+    bound : float
+        Obere Schranke der Verzögerung vom Anschlag bis zur Ausgabe in
+        Sekunden.
+    latencies : array.array
+        Gemessene Verzögerungen aller ausgegebenen Anschläge in Sekunden.
+
+    Methods
+    -------
+    close()
+        Beendet die Audioausgabe.
+    _callback(out)
+        Interne Methode, die den Audio-Callback bedient.
+    """
+
+    def __init__(self, sink: Sink = None, renderer: Renderer = None):
+        """
+        Erstellt das Carillon, berechnet alle Samples vor und startet die
+        Audioausgabe.
+
+        Parameters
+        ----------
+        sink : Sink (optional)
+            Audioausgabe, standardmäßig eine Null-Ausgabe.
+        renderer : Renderer (optional)
+            Quelle der Samples, muss die Abtastrate der Ausgabe nutzen.
+        """
+        super().__init__(mido.ports.BaseOutput())
+        self.sink = Sink() if sink is None else sink
+        self.renderer = Renderer(rate=self.sink.rate) if renderer is None \
+            else renderer
+        self._samples = {note: self.renderer.sample(note)
+                         for note in self.renderer.pipes}
+        self.latencies = array.array('d')
+        self._strikes = deque()
+        self._voices = []
+        self._scratch = np.empty(self.sink.block, dtype=np.float32)
+        self.sink.start(self._callback)
+
+    @property
+    def bound(self) -> float:
+        """Obere Schranke der Verzögerung in Sekunden."""
+        return 2 * self.sink.block / self.sink.rate + self.sink.latency
+
+    def chord(self, notes: Iterable[int]) -> None:
+        """
+        Schlägt mehrere Glocken gleichzeitig an, indem ihre Samples als
+        Stimmen an den Callback übergeben werden. Nicht vorhandene Glocken
+        werden mit einer Warnung übersprungen.
+
+        Parameters
+        ----------
+        notes : Iterable[int]
+            MIDI-Notenwerte der anzuschlagenden Glocken.
+        """
+        struck = time.monotonic()
+        samples = []
+        for note in notes:
+            sample = self._samples.get(note)
+            if sample is None: warnings.warn(f'Note {note} nicht verfügbar.')
+            else: samples.append(sample)
+        if samples: self._strikes.append((samples, struck))
+
+    def close(self) -> None:
+        """Beendet die Audioausgabe."""
+        self.sink.stop()
+
+    def _callback(self, out: np.ndarray) -> None:
+        """
+        Interne Methode, die den Audio-Callback bedient: Sie übernimmt die
+        seit dem letzten Block angeschlagenen Stimmen, misst deren
+        Verzögerung und mischt von jeder Stimme den nächsten Abschnitt in
+        den Block. Ausgeklungene Stimmen werden verworfen.
+        """
+        now = time.monotonic()
+        while self._strikes:
+            samples, struck = self._strikes.popleft()
+            self._voices.extend([sample, 0] for sample in samples)
+            self.latencies.append(now - struck + self.sink.latency)
+
+        out[:] = 0
+        if len(self._scratch) < len(out):
+            self._scratch = np.empty(len(out), dtype=np.float32)
+        scale = np.float32(self.renderer.gain / 32768)
+        voices = []
+        for voice in self._voices:
+            sample, cursor = voice
+            n = min(len(out), len(sample) - cursor)
+            scratch = self._scratch[:n]
+            np.multiply(sample[cursor:cursor + n], scale, out=scratch)
+            np.add(out[:n], scratch, out=out[:n])
+            voice[1] = cursor + n
+            if voice[1] < len(sample): voices.append(voice)
+        self._voices = voices
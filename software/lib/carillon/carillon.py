@@ -1,35 +1,67 @@
+import array
 import mido
-import mido.backends.rtmidi
+from mido.frozen import freeze_message
+import mido.ports
 import time
-from typing import List
+from typing import Callable, Iterable, List, Tuple, Union
 import warnings
 
+from .deadline import sleep_until
+from .timeline import Timeline
+
+
+def _prepare(note: int) -> Tuple[mido.Message, mido.Message]:
+    """
+    Erzeugt die eingefrorenen `note_on`- und `note_off`-Nachrichten einer
+    Note.
+    """
+    return (freeze_message(mido.Message('note_on', note=note)),
+            freeze_message(mido.Message('note_off', note=note)))
+
 
 class Carillon:
     """
     Klasse, die die Kommunikation zu GrandOrgue über MIDI-Messages abstrahiert
     zur Verfügung stellt.
 
+    Constants
+    ---------
+    LOWEST : int
+        Tiefste Note des Carillons.
+    HIGHEST : int
+        Höchste Note des Carillons.
+    MESSAGES : dict
+        Für jede Note des Carillons vorab erzeugte und eingefrorene
+        `note_on`- und `note_off`-Nachrichten.
+
     Attributes
     ----------
-    port : mido.backends.rtmidi.Output
-        MIDI-Port, an den die Nachrichten gesendet werden.
+    port : mido.ports.BaseOutput
+        MIDI-Port, an den die Nachrichten gesendet werden (standardmäßig der
+        Standardausgang von rtmidi, zum Testen etwa ein `RecordingPort`).
 
     Methods
     -------
     hit(note)
         Schlägt eine Glocke an.
-    play(messages)
-        Spielt eine Melodie auf dem Carillon.
+    chord(notes)
+        Schlägt mehrere Glocken in einem Schwung an.
+    play(melody, active) : array.array
+        Spielt eine Melodie auf dem Carillon und gibt die Verspätungen der
+        einzelnen Anschläge zurück.
     """
 
-    def __init__(self, port: mido.backends.rtmidi.Output = None):
+    LOWEST = 34
+    HIGHEST = 89
+    MESSAGES = {n: _prepare(n) for n in range(LOWEST, HIGHEST + 1)}
+
+    def __init__(self, port: mido.ports.BaseOutput = None):
         """
         Erzeugt das Carillon und belegt es mit einem MIDI-Port vor.
 
         Paramteres
         ----------
-        port : mido.backends.rtmidi.Output (optional)
+        port : mido.ports.BaseOutput (optional)
             MIDI-Port, der genutzt werden soll. Sofern keiner übergeben wird,
             wird ein Standardport geöffnet.
         """
@@ -45,21 +77,66 @@ class Carillon:
         note : int
             MIDI-Notenwert der anzuschlagenden Glocke.
         """
-        if note < 34 or note > 89:
-            warnings.warn(f'Note {note} nicht verfügbar.')
-        else:
-            self.port.send(mido.Message('note_on', note=note))
-            self.port.send(mido.Message('note_off', note=note))
+        self.chord((note, ))
 
-    def play(self, messages: List[mido.Message]) -> None:
+    def chord(self, notes: Iterable[int]) -> None:
         """
-        Spielt eine übergebene Melodie auf dem Carillon.
+        Schlägt mehrere Glocken gleichzeitig an. Zunächst werden alle
+        `note_on`-, danach alle `note_off`-Nachrichten in einem Schwung
+        gesendet. Es werden ausschließlich vorbereitete, eingefrorene
+        Nachrichten über `port.send` genutzt. Nicht vorhandene Glocken werden
+        mit einer Warnung übersprungen.
 
         Parameters
         ----------
-        messages : List[mido.Message]
-            MIDI-Nachrichten, die die Melodie kodieren.
+        notes : Iterable[int]
+            MIDI-Notenwerte der anzuschlagenden Glocken.
+        """
+        prepared = []
+        for note in notes:
+            e = Carillon.MESSAGES.get(note)
+            if e is None: warnings.warn(f'Note {note} nicht verfügbar.')
+            else: prepared.append(e)
+        if not prepared: return
+
+        for on, _ in prepared: self.port.send(on)
+        for _, off in prepared: self.port.send(off)
+
+    def play(
+        self, melody: Union[Timeline, List[mido.Message]],
+        active: Callable[[], bool] = None
+    ) -> array.array:
+        """
+        Spielt eine übergebene Melodie auf dem Carillon. Jeder Anschlag wird
+        gegen eine absolute Frist auf der monotonen Uhr geplant, sodass sich
+        Verzögerungen einzelner Anschläge nicht auf den Rest der Melodie
+        übertragen. Gleichzeitige Anschläge werden gemeinsam gesendet.
+
+        Parameters
+        ----------
+        melody : Timeline | List[mido.Message]
+            Kompilierte Abfolge der Anschläge oder MIDI-Nachrichten, die die
+            Melodie kodieren.
+        active : Callable[[], bool] (optional)
+            Wird vor jedem Anschlag abgefragt; liefert sie `False`, wird die
+            Wiedergabe abgebrochen.
+
+        Returns
+        -------
+        Verspätung jedes gespielten Anschlags in Sekunden.
         """
-        for msg in messages:
-            time.sleep(msg.time)
-            if msg.type == 'note_on' and msg.velocity != 0: self.hit(msg.note)
+        melody = Timeline.coerce(melody)
+        times, notes = melody.times, melody.notes
+        lateness = array.array('d')
+        start = time.monotonic()
+        i = 0
+        while i < len(times):
+            # Gleichzeitige Anschläge (Akkorde) gemeinsam senden
+            j = i + 1
+            while j < len(times) and times[j] == times[i]: j += 1
+            late = sleep_until(start + times[i])
+            if active is not None and not active(): break
+            self.chord(notes[i:j])
+            lateness.extend([late] * (j - i))
+            i = j
+        return lateness
@@ -1,8 +1,11 @@
+import array
 import mido
-from typing import List
+from threading import Lock
+from typing import List, Union
 
 from .carillon import Carillon
 from .striker import Striker
+from .timeline import Timeline
 
 
 class CarillonStriker(Striker):
@@ -19,9 +22,9 @@ class CarillonStriker(Striker):
 
     Methods
     -------
-    play(messages)
+    play(melody) : array.array
         Spielt eine Melodie und pausiert währenddessen das Geläut.
-    play_active(messages)
+    play_active(melody) : array.array
         Methode zum Abspielen einer Melodie, die bei `self.active = False`
         abbricht.
     """
@@ -31,19 +34,29 @@ class CarillonStriker(Striker):
         super().__init__()
         self.active = True
         self.carillon = carillon
+        self._lock = Lock()
 
-    def play(self, messages: List[mido.Message]) -> None:
-        """Spielt eine Melodie und pausiert währenddessen das Geläut."""
-        cache = self.active
-        self.active = False
-        self.carillon.play(messages)
-        self.active = cache
-
-    def play_active(self, messages: List[mido.Message]) -> None:
+    def play(
+        self, melody: Union[Timeline, List[mido.Message]]
+    ) -> array.array:
+        """
+        Spielt eine Melodie und pausiert währenddessen das Geläut.
+        Gleichzeitige Aufrufe werden nacheinander abgespielt, sodass jeder
+        den Zustand des Geläuts vor seinem Beginn wiederherstellt.
+        """
+        with self._lock:
+            cache = self.active
+            self.active = False
+            try:
+                return self.carillon.play(melody)
+            finally:
+                self.active = cache
+
+    def play_active(
+        self, melody: Union[Timeline, List[mido.Message]]
+    ) -> array.array:
         """
         Methode zum Abspielen einer Melodie, die bei Deaktivierung des Geläuts
         abbricht.
         """
-        for m in messages:
-            if not self.active: return
-            self.carillon.play([m])
+        return self.carillon.play(melody, lambda: self.active)
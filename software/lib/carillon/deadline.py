@@ -0,0 +1,35 @@
+"""
+Hilfsfunktionen, um Ereignisse gegen absolute Fristen auf der monotonen Uhr
+(`time.monotonic()`) statt mit relativen Pausen zu planen. Dadurch summieren
+sich Ungenauigkeiten von `time.sleep`, Sendezeiten und Pausen der
+Speicherbereinigung nicht über die Dauer einer Melodie auf.
+"""
+
+import time
+
+SPIN = 0.001
+"""Restzeit in Sekunden, die nicht geschlafen, sondern aktiv gewartet wird."""
+
+
+def sleep_until(deadline: float, spin: float = SPIN) -> float:
+    """
+    Wartet bis zur angegebenen Frist. Zunächst wird geschlafen, die letzte
+    Millisekunde wird aktiv gewartet, um das Überschwingen von `time.sleep`
+    auszugleichen.
+
+    Parameters
+    ----------
+    deadline : float
+        Frist als Zeitpunkt auf der Uhr `time.monotonic()`.
+    spin : float (optional)
+        Restzeit in Sekunden, die aktiv gewartet wird.
+
+    Returns
+    -------
+    Verspätung in Sekunden gegenüber der Frist (nie negativ).
+    """
+    remaining = deadline - time.monotonic()
+    if remaining > spin: time.sleep(remaining - spin)
+    now = time.monotonic()
+    while now < deadline: now = time.monotonic()
+    return now - deadline
@@ -0,0 +1,52 @@
+from .sink import Callback, Sink
+
+
+class DeviceSink(Sink):
+    """
+    Audioausgabe über die Soundkarte. Die Blöcke werden direkt im Callback
+    der Audiohardware angefordert (über das optionale Paket `sounddevice`).
+
+    Attributes
+    ----------
+    device : int | str
+        Zu nutzendes Ausgabegerät (oder `None` für das Standardgerät).
+    """
+
+    def __init__(self, rate: int = 44100, block: int = 256, device=None):
+        """
+        Erstellt die Ausgabe.
+
+        Parameters
+        ----------
+        rate : int (optional)
+            Abtastrate in Hz.
+        block : int (optional)
+            Größe der Blöcke in Frames.
+        device : int | str (optional)
+            Ausgabegerät, standardmäßig das des Systems.
+        """
+        super().__init__(rate, block)
+        self.device = device
+        self._stream = None
+
+    def start(self, callback: Callback) -> None:
+        """
+        Öffnet einen Audiostream mit möglichst geringer Latenz, dessen
+        Callback die Blöcke anfordert.
+        """
+        import sounddevice
+
+        def fill(outdata, frames, time, status):
+            callback(outdata[:, 0])
+
+        self._stream = sounddevice.OutputStream(
+            samplerate=self.rate, blocksize=self.block, channels=1,
+            dtype='float32', latency='low', device=self.device,
+            callback=fill)
+        self._stream.start()
+        self.latency = self._stream.latency
+
+    def stop(self) -> None:
+        """Beendet die Ausgabe und schließt den Audiostream."""
+        super().stop()
+        if self._stream is not None: self._stream.close()
@@ -0,0 +1,46 @@
+import numpy as np
+import wave
+
+from .sink import Sink
+
+
+class FileSink(Sink):
+    """
+    Audioausgabe, die alle Blöcke als 16-Bit-PCM in eine WAV-Datei schreibt,
+    etwa um Anschläge ohne Audiohardware nachzuhören.
+
+    Attributes
+    ----------
+    file : str
+        Pfad zur WAV-Datei.
+    """
+
+    def __init__(self, file: str, rate: int = 44100, block: int = 256):
+        """
+        Erstellt die Ausgabe und öffnet die WAV-Datei.
+
+        Parameters
+        ----------
+        file : str
+            Pfad zur WAV-Datei.
+        rate : int (optional)
+            Abtastrate in Hz.
+        block : int (optional)
+            Größe der Blöcke in Frames.
+        """
+        super().__init__(rate, block)
+        self.file = file
+        self._wave = wave.open(file, 'wb')
+        self._wave.setnchannels(1)
+        self._wave.setsampwidth(2)
+        self._wave.setframerate(rate)
+
+    def stop(self) -> None:
+        """Beendet die Ausgabe und schließt die Datei."""
+        super().stop()
+        self._wave.close()
+
+    def output(self, block: np.ndarray) -> None:
+        """Schreibt einen Block als 16-Bit-PCM."""
+        pcm = np.clip(block * 32768, -32768, 32767).astype('<i2')
+        self._wave.writeframes(pcm.tobytes())
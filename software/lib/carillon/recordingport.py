@@ -0,0 +1,42 @@
+import mido
+import mido.ports
+import time
+from typing import List, Tuple
+
+
+class RecordingPort(mido.ports.BaseOutput):
+    """
+    Virtueller MIDI-Ausgang, der jede gesendete Nachricht mit einem hoch
+    aufgelösten Zeitstempel (`time.perf_counter()`) aufzeichnet, statt sie
+    weiterzugeben. Damit lassen sich Carillon und Striker ohne MIDI-Hardware
+    betreiben und ihr Timing prüfen.
+
+    Attributes
+    ----------
+    messages : List[Tuple[float, mido.Message]]
+        Aufgezeichnete Nachrichten samt Zeitstempel in Sekunden.
+
+    Methods
+    -------
+    onsets() : List[Tuple[float, int]]
+        Gibt Zeitpunkte und Noten aller `note_on`-Nachrichten zurück.
+    clear()
+        Verwirft alle Aufzeichnungen.
+    """
+
+    def _open(self, **kwargs) -> None:
+        """Bereitet die Aufzeichnung vor."""
+        self.messages = []
+
+    def _send(self, msg: mido.Message) -> None:
+        """Zeichnet eine Nachricht samt Zeitstempel auf."""
+        self.messages.append((time.perf_counter(), msg))
+
+    def onsets(self) -> List[Tuple[float, int]]:
+        """Gibt Zeitpunkte und Noten aller Anschläge zurück."""
+        return [(t, m.note) for t, m in self.messages
+                if m.type == 'note_on' and m.velocity > 0]
+
+    def clear(self) -> None:
+        """Verwirft alle Aufzeichnungen."""
+        with self._lock: self.messages = []
@@ -0,0 +1,205 @@
+import configparser
+import mido
+import numpy as np
+import os
+from typing import Dict, Iterator, List, Tuple, Union
+import warnings
+import wave
+
+from .samplebank import SampleBank
+from .song import Song
+from .timeline import Timeline
+
+ORGAN = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..',
+                     '..', 'carillon', 'carillon.organ')
+"""Pfad zur GrandOrgue-Definition des Carillons samt Glockensamples."""
+
+
+class Renderer:
+    """
+    Rendert Melodien ohne laufendes GrandOrgue mit den Glockensamples des
+    Carillons zu Audio. Jedes Sample wird zum Zeitpunkt seines Anschlags in
+    einen Puffer gemischt; die Ausgabe erfolgt blockweise, sodass auch lange
+    Melodien mit wenig Speicher gerendert werden können. Die Samples stammen
+    aus einer `SampleBank` und werden ohne Kopie direkt aus den
+    abgebildeten Dateien gemischt.
+
+    Constants
+    ---------
+    RATE : int
+        Standard-Abtastrate in Hz.
+    CHUNK : int
+        Standardgröße der ausgegebenen Blöcke in Frames.
+    GAIN : float
+        Standardverstärkung, damit auch Akkorde nicht übersteuern.
+
+    Attributes
+    ----------
+    rate : int
+        Abtastrate der Ausgabe in Hz.
+    gain : float
+        Verstärkung der Samples.
+    pipes : Dict[int, Tuple[str, int]]
+        Sampledatei und Verstimmung in Cent je MIDI-Note (aus der
+        GrandOrgue-Definition).
+    bank : SampleBank
+        Quelle der Samples.
+
+    Methods
+    -------
+    sample(note) : np.ndarray
+        Gibt das (passend gestimmte) Sample einer Note zurück.
+    stream(melody, chunk) : Iterator[np.ndarray]
+        Rendert eine Melodie blockweise als 16-Bit-PCM.
+    render(melody) : np.ndarray
+        Rendert eine Melodie vollständig als 16-Bit-PCM.
+    write(melody, file, chunk)
+        Rendert eine Melodie in eine WAV-Datei.
+
+    Static methods
+    --------------
+    read_organ(organ) : Dict[int, Tuple[str, int]]
+        Liest die Zuordnung von Noten zu Samples aus einer GrandOrgue-Datei.
+    """
+
+    RATE = 44100
+    CHUNK = 1 << 16
+    GAIN = 0.5
+
+    def __init__(
+        self, organ: str = ORGAN, rate: int = RATE, gain: float = GAIN,
+        bank: SampleBank = None
+    ):
+        """
+        Erstellt den Renderer. Die Samples werden erst bei Bedarf geladen.
+
+        Parameters
+        ----------
+        organ : str (optional)
+            Pfad zur GrandOrgue-Definition des Carillons.
+        rate : int (optional)
+            Abtastrate der Ausgabe in Hz.
+        gain : float (optional)
+            Verstärkung der Samples.
+        bank : SampleBank (optional)
+            Quelle der Samples, standardmäßig die gemeinsame des Prozesses.
+        """
+        self.rate = rate
+        self.gain = gain
+        self.pipes = Renderer.read_organ(organ)
+        self.bank = SampleBank.default() if bank is None else bank
+        self._tuned = {}
+
+    @staticmethod
+    def read_organ(organ: str) -> Dict[int, Tuple[str, int]]:
+        """
+        Liest die Zuordnung von MIDI-Noten zu Sampledateien und deren
+        Verstimmung (`PitchTuning` in Cent) aus einer GrandOrgue-Datei.
+        """
+        config = configparser.ConfigParser(strict=False, interpolation=None)
+        with open(organ, encoding='latin-1') as f: config.read_file(f)
+        first = config.getint('Manual001', 'FirstAccessibleKeyMIDINoteNumber')
+        stop = config['Stop001']
+        folder = os.path.dirname(os.path.abspath(organ))
+
+        pipes = {}
+        for i in range(1, stop.getint('NumberOfLogicalPipes') + 1):
+            file = stop[f'Pipe{i:03d}'].replace('\\', os.sep)
+            tuning = stop.getint(f'Pipe{i:03d}PitchTuning', 0)
+            file = os.path.normpath(os.path.join(folder, file))
+            pipes[first + i - 1] = (file, tuning)
+        return pipes
+
+    def sample(self, note: int) -> np.ndarray:
+        """
+        Gibt das Sample einer Note mit Werten im 16-Bit-Bereich zurück (oder
+        `None`, falls die Note nicht existiert). In der Regel ist dies eine
+        Sicht auf die abgebildete Datei; nur verstimmte Samples oder solche
+        mit abweichender Abtastrate werden durch lineare Interpolation
+        umgerechnet und zwischengespeichert.
+        """
+        if note not in self.pipes: return None
+        sample = self._tuned.get(note)
+        if sample is not None: return sample
+
+        file, tuning = self.pipes[note]
+        sample = self.bank.get(file)
+        step = 2 ** (tuning / 1200) * self.bank.rate(file) / self.rate
+        if step == 1: return sample
+        positions = np.arange(0, len(sample) - 1, step)
+        sample = np.interp(positions, np.arange(len(sample)), sample) \
+            .astype(np.float32)
+        self._tuned[note] = sample
+        return sample
+
+    def stream(
+        self, melody: Union[Song, Timeline, List[mido.Message]],
+        chunk: int = CHUNK
+    ) -> Iterator[np.ndarray]:
+        """
+        Rendert eine Melodie blockweise. Für jeden Block werden nur die
+        Anschläge gemischt, deren Sample in den Block hineinklingt.
+
+        Parameters
+        ----------
+        melody : Song | Timeline | List[mido.Message]
+            Zu rendernde Melodie.
+        chunk : int (optional)
+            Größe der Blöcke in Frames.
+
+        Returns
+        -------
+        Blöcke von 16-Bit-PCM (mono), der letzte ggf. kürzer.
+        """
+        if isinstance(melody, Song): melody = melody.timeline
+        melody = Timeline.coerce(melody)
+
+        samples, onsets = [], []
+        times = np.frombuffer(melody.times, dtype=np.float64)
+        starts = np.rint(times * self.rate).astype(np.int64)
+        for start, note in zip(starts, melody.notes):
+            sample = self.sample(note)
+            if sample is None:
+                warnings.warn(f'Note {note} nicht verfügbar.')
+                continue
+            samples.append(sample)
+            onsets.append(start)
+        onsets = np.array(onsets, dtype=np.int64)
+        ends = onsets + np.array([len(s) for s in samples], dtype=np.int64)
+        total = max(int(ends.max()) if len(ends) else 0,
+                    int(round(melody.duration * self.rate)))
+        longest = max((len(s) for s in samples), default=0)
+
+        for c0 in range(0, total, chunk):
+            c1 = min(c0 + chunk, total)
+            buffer = np.zeros(c1 - c0, dtype=np.float32)
+            lo = np.searchsorted(onsets, c0 - longest, side='right')
+            hi = np.searchsorted(onsets, c1, side='left')
+            for i in lo + np.flatnonzero(ends[lo:hi] > c0):
+                s0, s1 = max(c0, onsets[i]), min(c1, ends[i])
+                buffer[s0 - c0:s1 - c0] += \
+                    samples[i][s0 - onsets[i]:s1 - onsets[i]]
+            buffer *= self.gain
+            np.clip(buffer, -32768, 32767, out=buffer)
+            yield buffer.astype('<i2')
+
+    def render(
+        self, melody: Union[Song, Timeline, List[mido.Message]]
+    ) -> np.ndarray:
+        """Rendert eine Melodie vollständig als 16-Bit-PCM (mono)."""
+        chunks = list(self.stream(melody))
+        return np.concatenate(chunks) if chunks else np.zeros(0, '<i2')
+
+    def write(
+        self, melody: Union[Song, Timeline, List[mido.Message]], file: str,
+        chunk: int = CHUNK
+    ) -> None:
+        """
+        Rendert eine Melodie blockweise in eine WAV-Datei (mono, 16 Bit).
+        """
+        with wave.open(file, 'wb') as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(self.rate)
+            for block in self.stream(melody, chunk):
+                w.writeframes(block.tobytes())
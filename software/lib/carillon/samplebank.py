@@ -0,0 +1,125 @@
+import numpy as np
+import struct
+from threading import Lock
+from typing import Tuple
+
+
+class SampleBank:
+    """
+    Stellt die Glockensamples als schreibgeschützt in den Speicher
+    abgebildete Dateien (`mmap`) zur Verfügung. Die Kopfdaten jeder WAV-Datei
+    werden einmalig gelesen, die PCM-Daten selbst werden nicht kopiert,
+    sondern als NumPy-Sicht auf die Datei zurückgegeben. Das Betriebssystem
+    lädt nur tatsächlich genutzte Seiten und teilt sie über den Page-Cache
+    zwischen allen Prozessen.
+
+    Attributes
+    ----------
+    nbytes : int
+        Größe aller bisher abgebildeten PCM-Daten in Bytes.
+
+    Methods
+    -------
+    get(file) : np.ndarray
+        Gibt die PCM-Daten einer WAV-Datei zurück.
+    rate(file) : int
+        Gibt die Abtastrate einer WAV-Datei zurück.
+    _load(file) : Tuple[np.ndarray, int]
+        Interne Methode, die eine WAV-Datei in den Speicher abbildet.
+
+    Static methods
+    --------------
+    read_header(file) : Tuple[int, int, int, int]
+        Liest die Kopfdaten einer WAV-Datei.
+
+    Class methods
+    -------------
+    default() : SampleBank
+        Gemeinsame Samplebank des Prozesses.
+    """
+
+    _default = None
+
+    def __init__(self):
+        """Erstellt eine leere Samplebank."""
+        self._samples = {}
+        self._lock = Lock()
+
+    @classmethod
+    def default(cls) -> 'SampleBank':
+        """Gibt die gemeinsame Samplebank des Prozesses zurück."""
+        if cls._default is None: cls._default = cls()
+        return cls._default
+
+    @property
+    def nbytes(self) -> int:
+        """Größe aller bisher abgebildeten PCM-Daten in Bytes."""
+        return sum(data.nbytes for data, _ in self._samples.values())
+
+    def get(self, file: str) -> np.ndarray:
+        """
+        Gibt die PCM-Daten einer WAV-Datei als 16-Bit-Werte zurück. Die Datei
+        wird beim ersten Zugriff abgebildet; bei mehreren Kanälen wird eine
+        Sicht auf den ersten Kanal zurückgegeben.
+        """
+        return self._load(file)[0]
+
+    def rate(self, file: str) -> int:
+        """Gibt die Abtastrate einer WAV-Datei in Hz zurück."""
+        return self._load(file)[1]
+
+    def _load(self, file: str) -> Tuple[np.ndarray, int]:
+        """
+        Interne Methode, die eine WAV-Datei bei Bedarf in den Speicher
+        abbildet.
+        """
+        sample = self._samples.get(file)
+        if sample is not None: return sample
+        with self._lock:
+            sample = self._samples.get(file)
+            if sample is not None: return sample
+            offset, frames, channels, rate = SampleBank.read_header(file)
+            data = np.memmap(file, dtype='<i2', mode='r', offset=offset,
+                             shape=(frames, channels))
+            sample = (data[:, 0], rate)
+            self._samples[file] = sample
+            return sample
+
+    @staticmethod
+    def read_header(file: str) -> Tuple[int, int, int, int]:
+        """
+        Liest die Kopfdaten einer WAV-Datei.
+
+        Returns
+        -------
+        Position der PCM-Daten in Bytes, Anzahl der Frames, Anzahl der Kanäle
+        und Abtastrate in Hz.
+
+        Raises
+        ------
+        ValueError
+            Falls die Datei kein unkomprimiertes 16-Bit-WAV ist.
+        """
+        fmt = None
+        with open(file, 'rb') as f:
+            riff, _, wave = struct.unpack('<4sI4s', f.read(12))
+            if riff != b'RIFF' or wave != b'WAVE':
+                raise ValueError(f'{file} ist keine WAV-Datei!')
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    raise ValueError(f'{file} enthält keine Audiodaten!')
+                chunk, size = struct.unpack('<4sI', header)
+                if chunk == b'fmt ':
+                    fmt = struct.unpack('<HHIIHH', f.read(16))
+                    f.seek(size - 16 + size % 2, 1)
+                elif chunk == b'data':
+                    break
+                else:
+                    f.seek(size + size % 2, 1)
+            offset = f.tell()
+
+        if fmt is None or fmt[0] != 1 or fmt[5] != 16:
+            raise ValueError(f'{file} ist kein unkomprimiertes 16-Bit-WAV!')
+        channels, rate = fmt[1], fmt[2]
+        return offset, size // (2 * channels), channels, rate
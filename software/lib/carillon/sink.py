@@ -0,0 +1,90 @@
+import numpy as np
+from threading import Event, Thread
+import time
+from typing import Callable
+
+from .deadline import sleep_until
+
+Callback = Callable[[np.ndarray], None]
+
+
+class Sink:
+    """
+    Audioausgabe, die regelmäßig Blöcke von einem Callback anfordert. Diese
+    Basisklasse verwirft die Blöcke (Null-Ausgabe) und taktet den Callback
+    selbst anhand der monotonen Uhr, sodass sie ohne Audiohardware zum Testen
+    und Messen genutzt werden kann.
+
+    Attributes
+    ----------
+    rate : int
+        Abtastrate in Hz.
+    block : int
+        Größe der angeforderten Blöcke in Frames.
+    latency : float
+        Zusätzliche Verzögerung der Ausgabe in Sekunden (etwa durch Puffer
+        der Audiohardware).
+
+    Methods
+    -------
+    start(callback)
+        Beginnt, Blöcke vom Callback anzufordern.
+    stop()
+        Beendet die Ausgabe.
+    output(block)
+        Gibt einen gefüllten Block aus.
+    _run(callback)
+        Interne Methode des Taktthreads.
+    """
+
+    def __init__(self, rate: int = 44100, block: int = 256):
+        """
+        Erstellt die Ausgabe.
+
+        Parameters
+        ----------
+        rate : int (optional)
+            Abtastrate in Hz.
+        block : int (optional)
+            Größe der Blöcke in Frames.
+        """
+        self.rate = rate
+        self.block = block
+        self.latency = 0.0
+        self._stop = Event()
+        self._thread = None
+
+    def start(self, callback: Callback) -> None:
+        """
+        Beginnt, in einem eigenen Thread Blöcke vom Callback anzufordern.
+
+        Parameters
+        ----------
+        callback : Callable[[np.ndarray], None]
+            Füllt den übergebenen Block (Gleitkommazahlen von -1 bis 1).
+        """
+        self._thread = Thread(target=self._run, args=(callback, ),
+                              daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Beendet die Ausgabe und wartet auf das Ende des Taktthreads."""
+        self._stop.set()
+        if self._thread is not None: self._thread.join()
+
+    def output(self, block: np.ndarray) -> None:
+        """Gibt einen gefüllten Block aus (hier: verwirft ihn)."""
+        pass
+
+    def _run(self, callback: Callback) -> None:
+        """
+        Interne Methode des Taktthreads, die zu jedem Block eine Frist auf
+        der monotonen Uhr berechnet und den Callback aufruft.
+        """
+        out = np.zeros(self.block, dtype=np.float32)
+        start, n = time.monotonic(), 0
+        while not self._stop.is_set():
+            sleep_until(start + n * self.block / self.rate)
+            callback(out)
+            self.output(out)
+            n += 1
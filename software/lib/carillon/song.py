@@ -1,6 +1,8 @@
 import mido
 from typing import List
 
+from .timeline import Timeline
+
 
 class Song:
     """
@@ -17,6 +19,9 @@ class Song:
     messages : List[mido.Message]
         Liste an Nachrichten, die in der Datei enthalten sind (passend
         transponiert und mit richtigem Tempo ausgestattet).
+    timeline : Timeline
+        Kompilierte Abfolge der Anschläge, die nur bei Änderung von `tempo`
+        oder `transpose` neu erstellt wird.
     """
 
     def __init__(self, path: str):
@@ -34,6 +39,7 @@ class Song:
 
         g = (m.tempo for m in self.file.tracks[0] if m.type == 'set_tempo')
         self.tempo = next(g, 500_000)
+        self._compiled = None
 
     @property
     def messages(self) -> List[mido.Message]:
@@ -47,3 +53,17 @@ class Song:
             m.time = mido.tick2second(m.time, tpb, self.tempo)
             m.note += self.transpose
         return messages
+
+    @property
+    def timeline(self) -> Timeline:
+        """
+        Kompilierte Abfolge der Anschläge mit Tempo und Transponierung. Sie
+        wird zwischengespeichert und nur bei geändertem `tempo` oder
+        `transpose` neu berechnet.
+        """
+        key = (self.tempo, self.transpose)
+        if self._compiled is None or self._compiled[0] != key:
+            timeline = Timeline.from_track(self.file.tracks[0],
+                                           self.file.ticks_per_beat, *key)
+            self._compiled = (key, timeline)
+        return self._compiled[1]
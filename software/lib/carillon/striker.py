@@ -1,8 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-import schedule
-from threading import Thread
-import time
+
+from .timer import every, Timer
 
 
 class Striker(ABC):
@@ -11,6 +10,11 @@ class Striker(ABC):
     Implementierung dieser abstrakten Klasse realisiert der Nutzer dann das
     eigentliche Geläut.
 
+    Attributes
+    ----------
+    timer : Timer
+        Zeitgeber, der die Viertelstunden auslöst.
+
     Methods
     -------
     strike(hours, quarters)
@@ -20,20 +24,19 @@ class Striker(ABC):
         `strike(hours, quarters)`.
     """
 
-    def __init__(self):
+    def __init__(self, timer: Timer = None):
         """
-        Initialisiert das Objekt und bereitet Scheduler und Thread zu dessen
-        Prüfung vor.
-        """
-        for t in range(0, 60, 15):
-            schedule.every().hour.at(f':{t:02d}').do(self._strike)
-
-        def thread():
-            while True:
-                schedule.run_pending()
-                time.sleep(0.1)
+        Initialisiert das Objekt und meldet es zu jeder Viertelstunde beim
+        Zeitgeber an.
 
-        Thread(target=thread, daemon=True).start()
+        Parameters
+        ----------
+        timer : Timer (optional)
+            Zu nutzender Zeitgeber, standardmäßig der gemeinsame Zeitgeber des
+            Prozesses.
+        """
+        self.timer = Timer.default() if timer is None else timer
+        self._timer_job = self.timer.schedule(self._strike, every(15))
 
     @abstractmethod
     def strike(self, hours: int, quarters: int) -> None:
@@ -0,0 +1,185 @@
+from datetime import datetime, timedelta
+import heapq
+import itertools
+from threading import Condition, Thread
+import time
+from typing import Callable
+
+Rule = Callable[[datetime], datetime]
+
+
+def every(minutes: int, offset: int = 0) -> Rule:
+    """
+    Erzeugt eine Regel, die alle `minutes` Minuten (gezählt ab Mitternacht
+    zuzüglich `offset` Minuten) auslöst.
+
+    Parameters
+    ----------
+    minutes : int
+        Abstand der Auslösungen in Minuten.
+    offset : int (optional)
+        Versatz der Auslösungen in Minuten.
+
+    Returns
+    -------
+    Funktion, die zu einer Ortszeit die nächste Auslösung danach ermittelt.
+    """
+    def rule(now: datetime) -> datetime:
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        elapsed = (now - midnight) // timedelta(minutes=1) - offset
+        return midnight + timedelta(minutes=(elapsed // minutes + 1) * minutes
+                                    + offset)
+    return rule
+
+
+def daily(hour: int, minute: int = 0) -> Rule:
+    """
+    Erzeugt eine Regel, die täglich zur angegebenen Uhrzeit auslöst.
+
+    Parameters
+    ----------
+    hour : int
+        Stunde der Auslösung.
+    minute : int (optional)
+        Minute der Auslösung.
+
+    Returns
+    -------
+    Funktion, die zu einer Ortszeit die nächste Auslösung danach ermittelt.
+    """
+    def rule(now: datetime) -> datetime:
+        at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        return at if at > now else at + timedelta(days=1)
+    return rule
+
+
+class Timer:
+    """
+    Ereignisgesteuerter Zeitgeber, der Aufträge in einem Min-Heap hält und
+    genau bis zur nächsten Frist schläft. Mehrere Striker und weitere Aufträge
+    (etwa der Angelus) können sich einen Zeitgeber und damit einen Thread
+    teilen.
+
+    Fristen werden als Unix-Zeit geführt, sodass Sommer- und Winterzeit keine
+    Sprünge verursachen. Springt die Systemuhr (etwa durch NTP), werden alle
+    Fristen neu berechnet; deutlich verpasste Fristen werden übersprungen
+    statt nachgeholt.
+
+    Constants
+    ---------
+    MAX_SLEEP : float
+        Maximale Schlafdauer in Sekunden, nach der Uhrsprünge erkannt werden.
+    JUMP : float
+        Abweichung zwischen Systemuhr und monotoner Uhr in Sekunden, ab der
+        ein Uhrsprung angenommen wird.
+    GRACE : float
+        Verspätung in Sekunden, bis zu der Aufträge noch ausgeführt werden.
+
+    Methods
+    -------
+    schedule(callback, rule) : int
+        Plant einen wiederkehrenden Auftrag ein.
+    cancel(job_id)
+        Entfernt einen Auftrag.
+    _run()
+        Interne Methode des Zeitgeberthreads.
+    _push(job_id, now)
+        Interne Methode, die die nächste Frist eines Auftrags einplant.
+
+    Class methods
+    -------------
+    default() : Timer
+        Gemeinsamer Zeitgeber des Prozesses.
+    """
+
+    MAX_SLEEP = 60.0
+    JUMP = 1.0
+    GRACE = 60.0
+
+    _default = None
+
+    def __init__(self):
+        """Erstellt den Zeitgeber und startet seinen Thread."""
+        self._jobs = {}
+        self._heap = []
+        self._ids = itertools.count(1)
+        self._cond = Condition()
+        Thread(target=self._run, daemon=True).start()
+
+    @classmethod
+    def default(cls) -> 'Timer':
+        """Gibt den gemeinsamen Zeitgeber des Prozesses zurück."""
+        if cls._default is None: cls._default = cls()
+        return cls._default
+
+    def schedule(self, callback: Callable[[], None], rule: Rule) -> int:
+        """
+        Plant einen wiederkehrenden Auftrag ein. Der Callback wird in einem
+        eigenen Thread ausgeführt, damit lange Geläute andere Aufträge nicht
+        verzögern.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            Auszuführende Funktion.
+        rule : Callable[[datetime], datetime]
+            Regel, die zu einer Ortszeit die nächste Auslösung ermittelt, etwa
+            `every(15)` oder `daily(12)`.
+
+        Returns
+        -------
+        Nummer des Auftrags, mit der er wieder entfernt werden kann.
+        """
+        with self._cond:
+            job_id = next(self._ids)
+            self._jobs[job_id] = [callback, rule, None]
+            self._push(job_id, time.time())
+            self._cond.notify()
+        return job_id
+
+    def cancel(self, job_id: int) -> None:
+        """Entfernt einen Auftrag, sofern er existiert."""
+        with self._cond: self._jobs.pop(job_id, None)
+
+    def _push(self, job_id: int, now: float) -> None:
+        """
+        Interne Methode, die die nächste Frist eines Auftrags nach `now`
+        ermittelt und in den Heap legt. Veraltete Heap-Einträge werden beim
+        Entnehmen anhand der gespeicherten Frist verworfen.
+        """
+        job = self._jobs[job_id]
+        at = datetime.fromtimestamp(now)
+        while True:
+            at = job[1](at)
+            deadline = at.timestamp()
+            # Doppelte Stunde bei Umstellung auf Winterzeit
+            if deadline <= now: deadline = at.replace(fold=1).timestamp()
+            if deadline > now: break
+        job[2] = deadline
+        heapq.heappush(self._heap, (deadline, job_id))
+
+    def _run(self) -> None:
+        """
+        Interne Methode des Zeitgeberthreads, die fällige Aufträge startet
+        und bis zur nächsten Frist schläft.
+        """
+        last = (time.time(), time.monotonic())
+        with self._cond:
+            while True:
+                now, mono = time.time(), time.monotonic()
+                if abs((now - last[0]) - (mono - last[1])) > Timer.JUMP:
+                    self._heap.clear()
+                    for job_id in self._jobs: self._push(job_id, now)
+                last = (now, mono)
+
+                while self._heap and self._heap[0][0] <= now:
+                    deadline, job_id = heapq.heappop(self._heap)
+                    job = self._jobs.get(job_id)
+                    if job is None or job[2] != deadline: continue
+                    if now - deadline <= Timer.GRACE:
+                        Thread(target=job[0], daemon=True).start()
+                    self._push(job_id, max(now, deadline))
+
+                timeout = Timer.MAX_SLEEP
+                if self._heap: timeout = min(timeout, self._heap[0][0] - now)
+                self._cond.wait(timeout)
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+import statistics
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class TimingReport:
+    """
+    Vergleich aufgezeichneter Anschläge mit ihrer idealen Abfolge. Alle
+    Zeiten in Sekunden.
+
+    Attributes
+    ----------
+    expected : int
+        Anzahl der erwarteten Anschläge.
+    recorded : int
+        Anzahl der aufgezeichneten Anschläge.
+    mismatches : int
+        Anzahl der Anschläge, deren Note nicht der erwarteten entspricht.
+    mean_error : float
+        Mittlere Abweichung der Anschläge von ihrem idealen Zeitpunkt.
+    max_error : float
+        Größte (betragsmäßige) Abweichung eines Anschlags.
+    jitter : float
+        Standardabweichung der Fehler der Abstände aufeinanderfolgender
+        Anschläge.
+    drift : float
+        Abweichung des letzten gegenüber dem ersten Anschlag, also der über
+        die Dauer aufgelaufene Fehler.
+
+    Class methods
+    -------------
+    compare(ideal, actual) : TimingReport
+        Vergleicht aufgezeichnete mit idealen Anschlägen.
+    """
+
+    expected: int
+    recorded: int
+    mismatches: int
+    mean_error: float
+    max_error: float
+    jitter: float
+    drift: float
+
+    @classmethod
+    def compare(
+        cls, ideal: Sequence[tuple], actual: Sequence[tuple]
+    ) -> 'TimingReport':
+        """
+        Vergleicht aufgezeichnete mit idealen Anschlägen paarweise in ihrer
+        Reihenfolge.
+
+        Parameters
+        ----------
+        ideal : Sequence[Tuple[float, int]]
+            Ideale Zeitpunkte (relativ zum Start) und Noten.
+        actual : Sequence[Tuple[float, int]]
+            Aufgezeichnete Zeitpunkte (relativ zum selben Start) und Noten.
+        """
+        pairs = list(zip(ideal, actual))
+        errors = [a[0] - i[0] for i, a in pairs]
+        deltas = [e1 - e0 for e0, e1 in zip(errors, errors[1:])]
+        return cls(
+            expected=len(ideal),
+            recorded=len(actual),
+            mismatches=sum(i[1] != a[1] for i, a in pairs),
+            mean_error=statistics.fmean(errors) if errors else 0.0,
+            max_error=max(map(abs, errors), default=0.0),
+            jitter=statistics.pstdev(deltas) if deltas else 0.0,
+            drift=errors[-1] - errors[0] if errors else 0.0,
+        )
+
+    def __str__(self) -> str:
+        return (f'{self.recorded}/{self.expected} Anschläge, '
+                f'{self.mismatches} falsch, '
+                f'Fehler Ø {self.mean_error * 1e3:.3f} ms '
+                f'(max. {self.max_error * 1e3:.3f} ms), '
+                f'Jitter {self.jitter * 1e3:.3f} ms, '
+                f'Drift {self.drift * 1e3:.3f} ms')
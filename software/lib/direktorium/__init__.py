@@ -4,12 +4,20 @@ fragt dazu die API https://www.eucharistiefeier.de/lk/ ab und cached Ergebnisse
 optional.
 """
 
+from .cache import Cache
+from .calendarium import Calendarium
 from .color import Color
 from .direktorium import Direktorium
 from .event import Event
+from .jsoncache import JsonCache
+from .prefetcher import Prefetcher
 from .rank import Rank
 from .season import Season
+from .seasontable import SeasonTable
+from .snapshot import Snapshot
+from .sqlitecache import SqliteCache
 from .todaydirektorium import TodayDirektorium
 
-__all__ = ['Color', 'Direktorium', 'Rank', 'Event', 'Season',
-           'TodayDirektorium', ]
+__all__ = ['Cache', 'Calendarium', 'Color', 'Direktorium', 'Rank', 'Event',
+           'JsonCache', 'Prefetcher', 'Season', 'SeasonTable', 'Snapshot',
+           'SqliteCache', 'TodayDirektorium', ]
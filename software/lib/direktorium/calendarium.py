@@ -0,0 +1,337 @@
+from datetime import date, timedelta
+from threading import Lock
+from typing import Dict, List
+
+from .color import Color
+from .direktorium import Direktorium
+from .event import Event
+from .rank import Rank
+
+W, R, G, V = Color.WHITE, Color.RED, Color.GREEN, Color.VIOLET
+H, F, M = Rank.HOCHFEST, Rank.FEST, Rank.GEBOTEN
+
+WEEKDAYS = ('Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag',
+            'Samstag', 'Sonntag')
+
+
+class Calendarium:
+    """
+    Offline-Berechnung des Generalkalenders (mit den Festen des deutschen
+    Regionalkalenders) für beliebige Jahre. Dient dem Direktorium als
+    Rückfallebene, wenn die Online-API nicht erreichbar ist.
+
+    Die Wichtigkeit (`importance`) entspricht der Nummer in der Tabelle der
+    liturgischen Tage (1 = Triduum, 13 = Wochentag), sodass die Sortierung der
+    der API entspricht. Hochfeste, Feste und gebotene Gedenktage werden
+    berechnet, ebenso Vorrang, Verdrängung und die Verlegung der Hochfeste
+    Josef, Verkündigung und Unbefleckte Empfängnis. Andere verdrängte
+    Hochfeste werden auf den nächsten freien Tag verlegt. Nichtgebotene
+    Gedenktage und Lesungen sind nicht enthalten.
+
+    Constants
+    ---------
+    FIXED : dict
+        Feste mit festem Datum: (Monat, Tag) -> (Titel, Rang, Farbe, Grad).
+    YEARS : int
+        Anzahl an Jahren, die berechnet im Speicher gehalten werden.
+
+    Methods
+    -------
+    get(d) : List[Event]
+        Gibt die Events eines Tages zurück.
+    year(year) : Dict[date, List[Event]]
+        Berechnet den Index eines ganzen Jahres.
+    _temporal(d, easter, advent, baptism) : Event
+        Ermittelt den Tag des Kirchenjahres.
+    _sanctoral(year, easter) : Dict[date, List[Event]]
+        Ermittelt die Heiligenfeste und beweglichen Feste eines Jahres.
+
+    Class methods
+    -------------
+    default() : Calendarium
+        Gemeinsame Instanz des Prozesses.
+    """
+
+    FIXED = {
+        (1, 1): ('Hochfest der Gottesmutter Maria', H, W, 3),
+        (1, 2): ('Hl. Basilius der Große und hl. Gregor von Nazianz', M, W,
+                 10),
+        (1, 17): ('Hl. Antonius, Mönchsvater in Ägypten', M, W, 10),
+        (1, 21): ('Hl. Agnes, Jungfrau, Märtyrin', M, R, 10),
+        (1, 24): ('Hl. Franz von Sales, Bischof, Kirchenlehrer', M, W, 10),
+        (1, 25): ('Bekehrung des hl. Apostels Paulus', F, W, 7),
+        (1, 26): ('Hl. Timotheus und hl. Titus, Bischöfe', M, W, 10),
+        (1, 28): ('Hl. Thomas von Aquin, Kirchenlehrer', M, W, 10),
+        (1, 31): ('Hl. Johannes Bosco, Priester', M, W, 10),
+        (2, 2): ('Darstellung des Herrn', F, W, 5),
+        (2, 5): ('Hl. Agatha, Jungfrau, Märtyrin', M, R, 10),
+        (2, 6): ('Hl. Paul Miki und Gefährten, Märtyrer', M, R, 10),
+        (2, 10): ('Hl. Scholastika, Jungfrau', M, W, 10),
+        (2, 14): ('Hl. Cyrill und hl. Methodius, Patrone Europas', F, W, 7),
+        (2, 22): ('Kathedra Petri', F, W, 7),
+        (3, 7): ('Hl. Perpetua und hl. Felizitas, Märtyrinnen', M, R, 10),
+        (3, 19): ('Hl. Josef, Bräutigam der Gottesmutter Maria', H, W, 3),
+        (3, 25): ('Verkündigung des Herrn', H, W, 3),
+        (4, 25): ('Hl. Markus, Evangelist', F, R, 7),
+        (4, 29): ('Hl. Katharina von Siena, Patronin Europas', F, W, 7),
+        (5, 2): ('Hl. Athanasius, Bischof, Kirchenlehrer', M, W, 10),
+        (5, 3): ('Hl. Philippus und hl. Jakobus, Apostel', F, R, 7),
+        (5, 14): ('Hl. Matthias, Apostel', F, R, 7),
+        (5, 26): ('Hl. Philipp Neri, Priester', M, W, 10),
+        (5, 31): ('Mariä Heimsuchung', F, W, 7),
+        (6, 1): ('Hl. Justin, Märtyrer', M, R, 10),
+        (6, 3): ('Hl. Karl Lwanga und Gefährten, Märtyrer', M, R, 10),
+        (6, 5): ('Hl. Bonifatius, Bischof, Märtyrer', M, R, 10),
+        (6, 11): ('Hl. Barnabas, Apostel', M, R, 10),
+        (6, 13): ('Hl. Antonius von Padua, Kirchenlehrer', M, W, 10),
+        (6, 21): ('Hl. Aloisius Gonzaga, Ordensmann', M, W, 10),
+        (6, 24): ('Geburt des hl. Johannes des Täufers', H, W, 3),
+        (6, 28): ('Hl. Irenäus, Bischof, Märtyrer', M, R, 10),
+        (6, 29): ('Hl. Petrus und hl. Paulus, Apostel', H, R, 3),
+        (7, 3): ('Hl. Thomas, Apostel', F, R, 7),
+        (7, 11): ('Hl. Benedikt von Nursia, Patron Europas', F, W, 7),
+        (7, 22): ('Hl. Maria Magdalena', F, W, 7),
+        (7, 23): ('Hl. Birgitta von Schweden, Patronin Europas', F, W, 7),
+        (7, 25): ('Hl. Jakobus, Apostel', F, R, 7),
+        (7, 26): ('Hl. Joachim und hl. Anna, Eltern Marias', M, W, 10),
+        (7, 29): ('Hl. Marta, hl. Maria und hl. Lazarus', M, W, 10),
+        (7, 31): ('Hl. Ignatius von Loyola, Priester', M, W, 10),
+        (8, 1): ('Hl. Alfons Maria von Liguori, Kirchenlehrer', M, W, 10),
+        (8, 4): ('Hl. Johannes Maria Vianney, Pfarrer von Ars', M, W, 10),
+        (8, 6): ('Verklärung des Herrn', F, W, 5),
+        (8, 8): ('Hl. Dominikus, Priester, Ordensgründer', M, W, 10),
+        (8, 9): ('Hl. Teresia Benedicta vom Kreuz (Edith Stein), Patronin '
+                 'Europas', F, R, 7),
+        (8, 10): ('Hl. Laurentius, Diakon, Märtyrer', F, R, 7),
+        (8, 11): ('Hl. Klara von Assisi, Jungfrau', M, W, 10),
+        (8, 14): ('Hl. Maximilian Maria Kolbe, Märtyrer', M, R, 10),
+        (8, 15): ('Mariä Aufnahme in den Himmel', H, W, 3),
+        (8, 20): ('Hl. Bernhard von Clairvaux, Kirchenlehrer', M, W, 10),
+        (8, 21): ('Hl. Pius X., Papst', M, W, 10),
+        (8, 22): ('Maria Königin', M, W, 10),
+        (8, 24): ('Hl. Bartholomäus, Apostel', F, R, 7),
+        (8, 27): ('Hl. Monika, Mutter des hl. Augustinus', M, W, 10),
+        (8, 28): ('Hl. Augustinus, Bischof, Kirchenlehrer', M, W, 10),
+        (8, 29): ('Enthauptung des hl. Johannes des Täufers', M, R, 10),
+        (9, 3): ('Hl. Gregor der Große, Papst, Kirchenlehrer', M, W, 10),
+        (9, 8): ('Mariä Geburt', F, W, 7),
+        (9, 13): ('Hl. Johannes Chrysostomus, Kirchenlehrer', M, W, 10),
+        (9, 14): ('Kreuzerhöhung', F, R, 5),
+        (9, 15): ('Gedächtnis der Schmerzen Mariens', M, W, 10),
+        (9, 16): ('Hl. Kornelius und hl. Cyprian, Märtyrer', M, R, 10),
+        (9, 21): ('Hl. Matthäus, Apostel, Evangelist', F, R, 7),
+        (9, 27): ('Hl. Vinzenz von Paul, Priester', M, W, 10),
+        (9, 29): ('Hl. Michael, hl. Gabriel und hl. Rafael, Erzengel', F, W,
+                  7),
+        (9, 30): ('Hl. Hieronymus, Kirchenlehrer', M, W, 10),
+        (10, 1): ('Hl. Theresia vom Kinde Jesus, Kirchenlehrerin', M, W, 10),
+        (10, 2): ('Heilige Schutzengel', M, W, 10),
+        (10, 4): ('Hl. Franz von Assisi, Ordensgründer', M, W, 10),
+        (10, 7): ('Unsere Liebe Frau vom Rosenkranz', M, W, 10),
+        (10, 15): ('Hl. Teresa von Ávila, Kirchenlehrerin', M, W, 10),
+        (10, 17): ('Hl. Ignatius von Antiochien, Bischof, Märtyrer', M, R,
+                   10),
+        (10, 18): ('Hl. Lukas, Evangelist', F, R, 7),
+        (10, 28): ('Hl. Simon und hl. Judas, Apostel', F, R, 7),
+        (11, 1): ('Allerheiligen', H, W, 3),
+        (11, 2): ('Allerseelen', Rank.NONE, V, 3),
+        (11, 4): ('Hl. Karl Borromäus, Bischof', M, W, 10),
+        (11, 9): ('Weihetag der Lateranbasilika', F, W, 5),
+        (11, 10): ('Hl. Leo der Große, Papst, Kirchenlehrer', M, W, 10),
+        (11, 11): ('Hl. Martin, Bischof von Tours', M, W, 10),
+        (11, 12): ('Hl. Josaphat, Bischof, Märtyrer', M, R, 10),
+        (11, 19): ('Hl. Elisabeth von Thüringen, Landgräfin', M, W, 10),
+        (11, 21): ('Unsere Liebe Frau in Jerusalem', M, W, 10),
+        (11, 22): ('Hl. Cäcilia, Jungfrau, Märtyrin', M, R, 10),
+        (11, 30): ('Hl. Andreas, Apostel', F, R, 7),
+        (12, 3): ('Hl. Franz Xaver, Priester', M, W, 10),
+        (12, 7): ('Hl. Ambrosius, Bischof, Kirchenlehrer', M, W, 10),
+        (12, 8): ('Hochfest der ohne Erbsünde empfangenen Jungfrau und '
+                  'Gottesmutter Maria', H, W, 3),
+        (12, 13): ('Hl. Luzia, Jungfrau, Märtyrin', M, R, 10),
+        (12, 14): ('Hl. Johannes vom Kreuz, Kirchenlehrer', M, W, 10),
+        (12, 26): ('Hl. Stephanus, erster Märtyrer', F, R, 7),
+        (12, 27): ('Hl. Johannes, Apostel, Evangelist', F, W, 7),
+        (12, 28): ('Unschuldige Kinder, Märtyrer', F, R, 7),
+    }
+
+    YEARS = 4
+
+    _default = None
+
+    def __init__(self):
+        """Erstellt den Kalender mit leerem Jahresspeicher."""
+        self._years = {}
+        self._lock = Lock()
+
+    @classmethod
+    def default(cls) -> 'Calendarium':
+        """Gibt die gemeinsame Instanz des Prozesses zurück."""
+        if cls._default is None: cls._default = cls()
+        return cls._default
+
+    def get(self, d: date) -> List[Event]:
+        """Gibt die nach Wichtigkeit sortierten Events eines Tages zurück."""
+        return list(self.year(d.year)[d])
+
+    def year(self, year: int) -> Dict[date, List[Event]]:
+        """
+        Berechnet den Index eines ganzen Jahres, der jedem Tag die nach
+        Wichtigkeit sortierten Events zuordnet. Berechnete Jahre werden
+        zwischengespeichert.
+        """
+        with self._lock:
+            if year in self._years: return self._years[year]
+
+        easter = Direktorium.easter(year)
+        christmas = date(year, 12, 25)
+        advent = christmas - timedelta(days=21 + christmas.isoweekday())
+        epiphany = date(year, 1, 6)
+        baptism = epiphany + timedelta(days=7 - epiphany.isoweekday() % 7)
+        sanctoral = self._sanctoral(year, easter)
+
+        index, impeded = {}, []
+        d = date(year, 1, 1)
+        while d.year == year:
+            day = self._temporal(d, easter, advent, baptism)
+            events, top = [day], day.importance
+            entries = sanctoral.get(d, ())
+            # Verdrängte Hochfeste auf den nächsten Tag verlegen, der nicht
+            # durch einen Tag der Ränge 1 bis 8 belegt ist
+            if impeded and top > 8 and all(e.importance > 8 for e in entries):
+                e = impeded.pop(0)
+                events.append(Event(e.title, d, color=e.color,
+                                    importance=e.importance, rank=e.rank))
+                top = e.importance
+            for e in entries:
+                if e.importance < top: events.append(e)
+                elif e.rank == H: impeded.append(e)
+                elif e.rank == M and top == 9:
+                    # Gedenktage in geprägten Zeiten werden zur Kommemoration
+                    events.append(Event(e.title, d, color=e.color,
+                                        importance=12, rank=Rank.NICHTGEBOTEN))
+            events.sort(key=lambda e: e.importance)
+            index[d] = events
+            d += timedelta(days=1)
+
+        with self._lock:
+            self._years[year] = index
+            while len(self._years) > Calendarium.YEARS:
+                del self._years[next(iter(self._years))]
+        return index
+
+    def _temporal(
+        self, d: date, easter: date, advent: date, baptism: date
+    ) -> Event:
+        """
+        Interne Methode, die den Tag des Kirchenjahres (Sonntag, Wochentag,
+        Hochfest des Herrn) für ein Datum ermittelt.
+        """
+        def event(title, color, importance, rank=Rank.NONE):
+            return Event(title, d, color=color, importance=importance,
+                         rank=rank)
+
+        wd = WEEKDAYS[d.weekday()]
+        sunday = d.weekday() == 6
+        delta = (d - easter).days
+        king = advent - timedelta(days=7)
+
+        # Osterfestkreis
+        fixed = {
+            -7: ('Palmsonntag', R, 2, Rank.NONE),
+            -3: ('Gründonnerstag', W, 1, Rank.NONE),
+            -2: ('Karfreitag', R, 1, Rank.NONE),
+            -1: ('Karsamstag', Color.NONE, 1, Rank.NONE),
+            0: ('Ostersonntag', W, 1, H),
+            7: ('2. Sonntag der Osterzeit (Weißer Sonntag)', W, 2, Rank.NONE),
+            39: ('Christi Himmelfahrt', W, 2, H),
+            49: ('Pfingstsonntag', R, 2, H),
+            50: ('Pfingstmontag', R, 4, H),
+            56: ('Dreifaltigkeitssonntag', W, 3, H),
+            60: ('Fronleichnam', W, 3, H),
+            68: ('Heiligstes Herz Jesu', W, 3, H),
+        }
+        if delta in fixed: return event(*fixed[delta])
+        if -46 <= delta < -7:
+            if delta == -46: return event('Aschermittwoch', V, 2)
+            if delta < -42: return event(f'{wd} nach Aschermittwoch', V, 9)
+            week = (delta + 42) // 7 + 1
+            if sunday: return event(f'{week}. Fastensonntag', V, 2)
+            return event(f'{wd} der {week}. Fastenwoche', V, 9)
+        if -7 < delta < 0: return event(f'{wd} der Karwoche', V, 2)
+        if 0 < delta < 7:
+            return event(f'{wd} der Osteroktav', W, 2, H)
+        if 7 < delta < 49:
+            week = delta // 7 + 1
+            if sunday: return event(f'{week}. Sonntag der Osterzeit', W, 2)
+            return event(f'{wd} der {week}. Osterwoche', W, 13)
+
+        # Weihnachtsfestkreis
+        if d == date(d.year, 12, 25):
+            return event('Hochfest der Geburt des Herrn', W, 2, H)
+        if d == date(d.year, 1, 6):
+            return event('Erscheinung des Herrn', W, 2, H)
+        if d == baptism: return event('Taufe des Herrn', W, 5, F)
+        if d.month == 12 and d.day > 25 or d.month == 1 and d.day == 1:
+            christmas = date(d.year, 12, 25)
+            family = christmas + timedelta(days=7 - christmas.isoweekday())
+            if christmas.isoweekday() == 7: family = date(d.year, 12, 30)
+            if d == family:
+                return event('Fest der Heiligen Familie', W, 5, F)
+            if d.month == 1: return event('Oktavtag von Weihnachten', W, 9)
+            return event(f'{d.day - 24}. Tag der Weihnachtsoktav', W, 9)
+        if d < baptism: return event('Wochentag der Weihnachtszeit', W, 13)
+        if d >= advent:
+            week = (d - advent).days // 7 + 1
+            if sunday: return event(f'{week}. Adventssonntag', V, 2)
+            importance = 9 if d.day >= 17 else 13
+            return event(f'{wd} der {week}. Adventswoche', V, importance)
+
+        # Zeit im Jahreskreis
+        if d == king:
+            return event('Christkönigssonntag', W, 3, H)
+        if d < easter:
+            week = (d - baptism).days // 7 + 1
+        else:
+            last = d - timedelta(days=d.isoweekday() % 7)
+            week = 34 - (king - last).days // 7
+        if sunday: return event(f'{week}. Sonntag im Jahreskreis', G, 6)
+        return event(f'{wd} der {week}. Woche im Jahreskreis', G, 13)
+
+    def _sanctoral(self, year: int, easter: date) -> Dict[date, List[Event]]:
+        """
+        Interne Methode, die die Heiligenfeste (inklusive Verlegungen) und die
+        beweglichen Gedenktage eines Jahres ermittelt.
+        """
+        palm = easter - timedelta(days=7)
+        lent = easter - timedelta(days=46)
+
+        def transfer(d: date, after_octave: bool) -> date:
+            # Verlegung von Hochfesten, die auf Sonntage der Fastenzeit, die
+            # Karwoche oder die Osteroktav fallen
+            if palm <= d <= easter + timedelta(days=7):
+                if after_octave: return easter + timedelta(days=8)
+                return palm - timedelta(days=1)
+            if lent <= d and d.weekday() == 6: return d + timedelta(days=1)
+            return d
+
+        entries = {}
+        for (month, day), (title, rank, color, grad) in \
+                Calendarium.FIXED.items():
+            d = date(year, month, day)
+            if (month, day) == (3, 19): d = transfer(d, False)
+            if (month, day) == (3, 25): d = transfer(d, True)
+            if (month, day) == (12, 8) and d.weekday() == 6:
+                d += timedelta(days=1)
+            entries.setdefault(d, []).append(
+                Event(title, d, color=color, importance=grad, rank=rank))
+
+        movable = {
+            50: ('Maria, Mutter der Kirche', W),
+            69: ('Unbeflecktes Herz Mariä', W),
+        }
+        for delta, (title, color) in movable.items():
+            d = easter + timedelta(days=delta)
+            entries.setdefault(d, []).append(
+                Event(title, d, color=color, importance=10, rank=M))
+        return entries
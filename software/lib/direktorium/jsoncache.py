@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+
+from .cache import Cache
+
+
+class JsonCache(Cache):
+    """
+    Cache, der jedes Jahr als Antwort der API in einer eigenen Datei
+    `<path>/<kalender>/<year>.json` ablegt. Die HTTP-Validatoren liegen
+    daneben in `<year>.headers.json`.
+
+    Methods
+    -------
+    file(kalender, year) : str
+        Pfad zur Datei eines Jahres.
+
+    Static Methods
+    --------------
+    _read(file) : dict
+        Liest eine JSON-Datei.
+    _write(file, data)
+        Schreibt eine JSON-Datei atomar.
+    """
+
+    def file(self, kalender: str, year: int) -> str:
+        """Pfad zur Datei eines Jahres."""
+        return os.path.join(self.path, kalender, f'{year}.json')
+
+    def year(self, kalender: str, year: int) -> dict:
+        """
+        Liest ein ganzes Jahr oder gibt `None` zurück, falls keine Datei
+        existiert.
+        """
+        return JsonCache._read(self.file(kalender, year))
+
+    def store(
+        self, kalender: str, year: int, data: dict, validators: dict = None
+    ) -> None:
+        """Legt ein Jahr samt HTTP-Validatoren ab."""
+        file = self.file(kalender, year)
+        JsonCache._write(f'{file[:-5]}.headers.json', validators or {})
+        JsonCache._write(file, data)
+
+    def validators(self, kalender: str, year: int) -> dict:
+        """
+        Liest die HTTP-Validatoren eines Jahres oder gibt `None` zurück, falls
+        das Jahr nicht zwischengespeichert ist.
+        """
+        file = self.file(kalender, year)
+        if not os.path.exists(file): return None
+        return JsonCache._read(f'{file[:-5]}.headers.json') or {}
+
+    @staticmethod
+    def _read(file: str) -> dict:
+        """Liest eine JSON-Datei oder gibt `None` zurück, falls sie fehlt."""
+        try:
+            with open(file) as f: return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write(file: str, data: dict) -> None:
+        """
+        Schreibt eine JSON-Datei. Sie wird zunächst unter einem temporären
+        Namen geschrieben und dann ersetzt, sodass parallel lesende Prozesse
+        nie eine halb geschriebene Datei sehen.
+        """
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(file), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f: json.dump(data, f)
+            os.replace(tmp, file)
+        except BaseException:
+            os.unlink(tmp)
+            raise